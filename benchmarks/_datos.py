@@ -0,0 +1,184 @@
+"""Datos y utilidades compartidas por los benchmarks."""
+
+from __future__ import annotations
+
+import numpy as np
+
+BACKENDS = ("pandas", "polars", "pyarrow")
+SEMILLA = 2024
+
+# Nombres mal escritos que no están en las equivalencias: obligan a pasar por el
+# fuzzy matching
+NOMBRES_CON_ERRORES = {
+    "departamentos": ["AMAZONS", "CAJAMARKA", "AYACUHCO", "HUANUKO"],
+    "provincias": ["CHACHAPOYA", "HUAROCHIR", "LA CONVENSION", "MARISCAL NIETTO"],
+    "distritos": ["MIRAFLORS", "SAN ISIDRP", "CHORRILOS", "SANTIAGO DE SURKO"],
+}
+
+
+def to_backend(valores: np.ndarray, backend: str):
+    """Series nativa del backend a partir de un arreglo de numpy."""
+    if backend == "pandas":
+        import pandas as pd
+
+        return pd.Series(valores, name="x")
+    if backend == "polars":
+        import polars as pl
+
+        return pl.Series("x", valores)
+    if backend == "pyarrow":
+        import pyarrow as pa
+
+        # Bloques de 1M filas, como los de una tabla leída de Parquet/IPC
+        bloques = np.array_split(valores, max(1, -(-len(valores) // 1_000_000)))
+        return pa.chunked_array([pa.array(bloque) for bloque in bloques])
+    raise ValueError(backend)
+
+
+def muestrear(opciones, n_rows: int) -> np.ndarray:
+    """`n_rows` valores elegidos al azar (con semilla fija) entre `opciones`."""
+    rng = np.random.default_rng(SEMILLA)
+    return np.asarray(list(opciones), dtype=object)[
+        rng.integers(0, len(opciones), n_rows)
+    ].astype(str)
+
+
+def medir(benchmark, funcion, *args, n_rows: int = 1, **kwargs):
+    """
+    Corre el benchmark. Las Series usan un número fijo de rondas, menor cuanto
+    más grandes son, para que 10M filas no multipliquen el tiempo total.
+    """
+    if n_rows == 1:
+        # Valores individuales: pytest-benchmark calibra las iteraciones
+        return benchmark(funcion, *args, **kwargs)
+
+    rondas = 10 if n_rows <= 1_000 else 3 if n_rows <= 100_000 else 1
+    benchmark.extra_info["n_rows"] = n_rows
+    return benchmark.pedantic(
+        funcion,
+        args=args,
+        kwargs=kwargs,
+        rounds=rondas,
+        warmup_rounds=1 if n_rows <= 100_000 else 0,
+    )
+
+
+# ----------------------------------------------------------------------
+# Memoria
+# ----------------------------------------------------------------------
+
+# Formas de representar una misma columna de texto
+REPRESENTACIONES = (
+    "pandas-object",
+    "pandas-category",
+    "pandas-arrow",
+    "polars",
+    "polars-categorical",
+    "pyarrow",
+    "pyarrow-dictionary",
+)
+
+
+def to_representacion(valores: np.ndarray, representacion: str):
+    """Series nativa en la representación indicada (ver `REPRESENTACIONES`)."""
+    backend, _, variante = representacion.partition("-")
+    if backend == "pandas":
+        import pandas as pd
+
+        dtype = {
+            "object": object,
+            "category": "category",
+            "arrow": "string[pyarrow]",
+        }[variante]
+        return pd.Series(valores, name="x", dtype=dtype)
+
+    serie = to_backend(valores, backend)
+    if not variante:
+        return serie
+    if backend == "polars":
+        import polars as pl
+
+        return serie.cast(pl.Categorical)
+    return serie.dictionary_encode()
+
+
+def nbytes(serie) -> int:
+    """Memoria ocupada por una Series nativa, incluyendo los objetos str de pandas."""
+    if hasattr(serie, "memory_usage"):
+        return int(serie.memory_usage(deep=True, index=False))
+    if hasattr(serie, "estimated_size"):
+        return serie.estimated_size()
+    return serie.nbytes
+
+
+class PicoMemoria:
+    """
+    Pico de memoria durante un bloque ``with``, medido de dos formas:
+
+    - ``tracemalloc``: asignaciones hechas por Python y numpy. No ve los
+      buffers de Arrow ni de Polars, que usan sus propios allocators.
+    - RSS del proceso, muestreado cada milisegundo en un hilo (requiere psutil).
+      Se reporta el aumento sobre el RSS inicial, así que subestima el pico si
+      el bloque reutiliza memoria que el proceso ya tenía reservada.
+    """
+
+    def __init__(self, intervalo: float = 0.001):
+        self.intervalo = intervalo
+        self.tracemalloc: int = 0
+        self.rss: int | None = None
+
+    def __enter__(self):
+        import gc
+        import threading
+        import tracemalloc
+
+        gc.collect()
+        try:
+            import psutil
+        except ImportError:
+            self._proceso = None
+        else:
+            self._proceso = psutil.Process()
+            self._rss_inicial = self._rss_max = self._proceso.memory_info().rss
+            self._detener = threading.Event()
+            self._hilo = threading.Thread(target=self._muestrear, daemon=True)
+            self._hilo.start()
+
+        tracemalloc.start()
+        return self
+
+    def _muestrear(self):
+        while not self._detener.wait(self.intervalo):
+            self._rss_max = max(self._rss_max, self._proceso.memory_info().rss)
+
+    def __exit__(self, *exc):
+        import tracemalloc
+
+        self.tracemalloc = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if self._proceso is not None:
+            self._detener.set()
+            self._hilo.join()
+            rss_final = self._proceso.memory_info().rss
+            self.rss = max(self._rss_max, rss_final) - self._rss_inicial
+        return False
+
+
+def medir_memoria(benchmark, funcion, *args, n_rows: int, **kwargs):
+    """
+    Registra en ``extra_info`` el pico de memoria de una llamada (ver
+    `PicoMemoria`) y el tamaño del resultado; el tiempo se mide con una sola
+    ronda aparte, sin tracemalloc activo.
+    """
+    with PicoMemoria() as pico:
+        resultado = funcion(*args, **kwargs)
+
+    benchmark.extra_info.update(
+        n_rows=n_rows,
+        pico_tracemalloc=pico.tracemalloc,
+        pico_rss=pico.rss,
+        resultado_bytes=nbytes(resultado),
+        pico_por_fila=round(pico.tracemalloc / n_rows, 1),
+    )
+    del resultado
+    return benchmark.pedantic(funcion, args=args, kwargs=kwargs, rounds=1)
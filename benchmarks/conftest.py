@@ -0,0 +1,53 @@
+"""
+Configuración de los benchmarks (pytest-benchmark).
+
+Los benchmarks no forman parte de la suite de tests: se ejecutan explícitamente
+con ``pytest benchmarks`` (ver las recetas ``bench`` del justfile). Los tamaños de
+Series se eligen con ``--bench-rows``; por defecto 1k y 100k filas, porque 10M
+filas por backend y función toma varios minutos.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import ubigeos_peru as ubg  # noqa: E402
+
+DBS_DIR = Path(__file__).parents[1] / "tests" / "test_dbs"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-rows",
+        default="1000,100000",
+        help="Tamaños de Series separados por comas (ej. 1000,100000,10000000)",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "n_rows" in metafunc.fixturenames:
+        tamanos = [int(n) for n in metafunc.config.getoption("--bench-rows").split(",")]
+        metafunc.parametrize("n_rows", tamanos, ids=[f"{n:_}" for n in tamanos])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def recursos_cargados():
+    # Se mide la conversión, no la primera lectura de los JSON
+    ubg.preload()
+
+
+@pytest.fixture(scope="session")
+def db_minam():
+    """Dataset real del MINAM (ver tests/conftest.py), en pandas."""
+    import pandas as pd
+
+    df = pd.read_csv(
+        DBS_DIR / "minam_valorizacion_residuos.csv",
+        sep=";",
+        usecols=["UBIGEO", "DEPARTAMENTO", "PROVINCIA", "DISTRITO"],
+    )
+    return df.apply(lambda col: col.str.strip() if col.dtype == "object" else col)
@@ -0,0 +1,210 @@
+"""
+Prueba de carga del servidor HTTP (`ubigeos-peru serve`) contra localhost.
+
+Por defecto levanta el servidor en un subproceso (para que no comparta el GIL
+con los clientes), lanza `--concurrency` hilos con conexiones persistentes
+durante `--duration` segundos y reporta requests/s, valores/s y latencias.
+
+    python benchmarks/load_test.py --scenario mix --concurrency 16
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --scenario batch
+
+No es parte de la suite de pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+
+from _datos import NOMBRES_CON_ERRORES, SEMILLA
+
+ESCENARIOS = ("single", "batch", "validate", "reverse", "mix")
+CODIGOS = ["150101", "080101", "010101", "150140", "130101", "040101", "999999"]
+NOMBRES = [
+    "Miraflores",
+    "Lince",
+    "SAN ISIDRO",
+    "Wanchaq",
+    *NOMBRES_CON_ERRORES["distritos"],
+]
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def servidor_local() -> Iterator[str]:
+    """Levanta `ubigeos-peru serve` en un subproceso y espera a que responda."""
+    puerto = _puerto_libre()
+    proceso = subprocess.Popen(
+        [sys.executable, "-m", "ubigeos_peru.cli", "serve", "--port", str(puerto)]
+    )
+    try:
+        limite = time.monotonic() + 30
+        while True:
+            try:
+                conexion = http.client.HTTPConnection("127.0.0.1", puerto, timeout=1)
+                conexion.request("GET", "/health")
+                conexion.getresponse().read()
+                break
+            except OSError:
+                if proceso.poll() is not None or time.monotonic() > limite:
+                    raise RuntimeError("El servidor no arrancó") from None
+                time.sleep(0.1)
+        yield f"http://127.0.0.1:{puerto}"
+    finally:
+        proceso.terminate()
+        proceso.wait()
+
+
+def _request(
+    rng: random.Random, escenario: str, batch_size: int
+) -> tuple[str, str, Optional[bytes], int]:
+    """(método, ruta, cuerpo, cantidad de valores) de un request del escenario."""
+    if escenario == "mix":
+        escenario = rng.choice(("single", "single", "validate", "batch", "reverse"))
+
+    if escenario == "single":
+        return "GET", f"/distrito?codigo={rng.choice(CODIGOS)}", None, 1
+    if escenario == "validate":
+        nombre = rng.choice(NOMBRES).replace(" ", "%20")
+        return "GET", f"/validate?nombre={nombre}&fuzzy_match=true", None, 1
+    if escenario == "reverse":
+        lat, lon = rng.uniform(-18, -3), rng.uniform(-81, -69)
+        return "GET", f"/reverse_geocode?lat={lat:.5f}&lon={lon:.5f}", None, 1
+    cuerpo = json.dumps({"codigos": rng.choices(CODIGOS, k=batch_size)}).encode()
+    return "POST", "/distrito", cuerpo, batch_size
+
+
+def _cliente(
+    url: str,
+    escenario: str,
+    batch_size: int,
+    hasta: float,
+    semilla: int,
+    latencias: list[float],
+    contadores: dict[str, int],
+    lock: threading.Lock,
+) -> None:
+    partes = urlsplit(url)
+    conexion = http.client.HTTPConnection(partes.hostname, partes.port, timeout=30)
+    rng = random.Random(semilla)
+    propias, valores, errores = [], 0, 0
+
+    while time.perf_counter() < hasta:
+        metodo, ruta, cuerpo, n = _request(rng, escenario, batch_size)
+        headers = {"Content-Type": "application/json"} if cuerpo else {}
+        inicio = time.perf_counter()
+        conexion.request(metodo, ruta, body=cuerpo, headers=headers)
+        respuesta = conexion.getresponse()
+        respuesta.read()
+        propias.append(time.perf_counter() - inicio)
+        # 404 es una respuesta esperada para códigos inexistentes
+        if respuesta.status >= 500:
+            errores += 1
+        valores += n
+
+    conexion.close()
+    with lock:
+        latencias.extend(propias)
+        contadores["valores"] += valores
+        contadores["errores"] += errores
+
+
+def correr(
+    url: str, escenario: str, concurrency: int, duration: float, batch_size: int
+) -> dict[str, float]:
+    latencias: list[float] = []
+    contadores = {"valores": 0, "errores": 0}
+    lock = threading.Lock()
+    hasta = time.perf_counter() + duration
+
+    hilos = [
+        threading.Thread(
+            target=_cliente,
+            args=(
+                url,
+                escenario,
+                batch_size,
+                hasta,
+                SEMILLA + i,
+                latencias,
+                contadores,
+                lock,
+            ),
+        )
+        for i in range(concurrency)
+    ]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+
+    cuantiles = (
+        statistics.quantiles(latencias, n=100) if len(latencias) > 1 else [0] * 99
+    )
+    return {
+        "requests": len(latencias),
+        "requests_s": len(latencias) / segundos,
+        "valores_s": contadores["valores"] / segundos,
+        "errores": contadores["errores"],
+        "p50_ms": cuantiles[49] * 1000,
+        "p95_ms": cuantiles[94] * 1000,
+        "p99_ms": cuantiles[98] * 1000,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--url", help="Servidor ya iniciado (por defecto se levanta uno local)"
+    )
+    parser.add_argument("--scenario", choices=ESCENARIOS, default="mix")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--json", action="store_true", help="Imprimir el resultado como JSON"
+    )
+    args = parser.parse_args(argv)
+
+    if args.url:
+        resultado = correr(
+            args.url, args.scenario, args.concurrency, args.duration, args.batch_size
+        )
+    else:
+        with servidor_local() as url:
+            resultado = correr(
+                url, args.scenario, args.concurrency, args.duration, args.batch_size
+            )
+
+    if args.json:
+        print(json.dumps(resultado))
+    else:
+        for clave, valor in resultado.items():
+            print(
+                f"{clave:>12}: {valor:,.2f}"
+                if isinstance(valor, float)
+                else f"{clave:>12}: {valor:,}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Benchmarks de tiempo de las funciones públicas, con valores individuales y con
+Series de pandas, Polars y PyArrow.
+
+Ejecutar con ``just bench`` o ``pytest benchmarks --benchmark-json=resultados.json``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from _datos import BACKENDS, NOMBRES_CON_ERRORES, medir, muestrear, to_backend
+
+import ubigeos_peru as ubg
+from ubigeos_peru.core import get_metadato
+
+LEVELS = ("departamentos", "provincias", "distritos")
+GETTERS = {
+    "departamentos": ubg.get_departamento,
+    "provincias": ubg.get_provincia,
+    "distritos": ubg.get_distrito,
+}
+VALIDADORES = {
+    "departamentos": ubg.validate_departamento,
+    "provincias": ubg.validate_provincia,
+    "distritos": ubg.validate_distrito,
+}
+
+
+def codigos(level: str) -> list[str]:
+    return list(ubg.cargar_diccionario(level, "inei"))
+
+
+def nombres(level: str) -> list[str]:
+    return list(ubg.cargar_diccionario("equivalencias", level))
+
+
+# ----------------------------------------------------------------------
+# Valores individuales
+# ----------------------------------------------------------------------
+
+
+class TestScalar:
+    @pytest.mark.parametrize("level", LEVELS)
+    def test_get_por_codigo(self, benchmark, level):
+        codigo = codigos(level)[-1]
+        medir(benchmark, GETTERS[level], codigo)
+
+    def test_get_macrorregion(self, benchmark):
+        medir(benchmark, ubg.get_macrorregion, "150101")
+
+    @pytest.mark.parametrize("level", LEVELS)
+    def test_get_ubigeo(self, benchmark, level):
+        nombre = next(iter(ubg.cargar_diccionario("inverted", level, "inei")))
+        medir(benchmark, ubg.get_ubigeo, nombre, level)
+
+    def test_get_metadato(self, benchmark):
+        medir(benchmark, get_metadato, "Lince", "distritos", "superficie")
+
+    @pytest.mark.parametrize("level", LEVELS)
+    @pytest.mark.parametrize("fuzzy", [False, True], ids=["exacto", "fuzzy"])
+    def test_validate(self, benchmark, level, fuzzy):
+        valor = NOMBRES_CON_ERRORES[level][0] if fuzzy else nombres(level)[-1]
+        medir(
+            benchmark, VALIDADORES[level], valor, fuzzy_match=fuzzy, on_error="coerce"
+        )
+
+
+# ----------------------------------------------------------------------
+# Series sintéticas
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestSeries:
+    @pytest.mark.parametrize("level", LEVELS)
+    def test_get_por_codigo(self, benchmark, backend, level, n_rows):
+        serie = to_backend(muestrear(codigos("distritos"), n_rows), backend)
+        medir(benchmark, GETTERS[level], serie, n_rows=n_rows)
+
+    def test_get_por_codigo_entero(self, benchmark, backend, n_rows):
+        enteros = muestrear(codigos("distritos"), n_rows).astype(np.int64)
+        serie = to_backend(enteros, backend)
+        medir(benchmark, ubg.get_distrito, serie, n_rows=n_rows)
+
+    def test_get_macrorregion(self, benchmark, backend, n_rows):
+        mixtos = codigos("departamentos") + list(
+            ubg.cargar_diccionario("departamentos", "inei").values()
+        )
+        serie = to_backend(muestrear(mixtos, n_rows), backend)
+        medir(benchmark, ubg.get_macrorregion, serie, n_rows=n_rows)
+
+    @pytest.mark.parametrize("level", LEVELS)
+    def test_get_ubigeo(self, benchmark, backend, level, n_rows):
+        # Algunas claves traen notas al pie (ej. "PION 1/"), que no son nombres
+        lugares = [
+            lugar
+            for lugar in ubg.cargar_diccionario("inverted", level, "inei")
+            if "/" not in lugar
+        ]
+        serie = to_backend(muestrear(lugares, n_rows), backend)
+        medir(benchmark, ubg.get_ubigeo, serie, level, n_rows=n_rows)
+
+    def test_get_metadato(self, benchmark, backend, n_rows):
+        serie = to_backend(muestrear(codigos("distritos"), n_rows), backend)
+        medir(benchmark, get_metadato, serie, "distritos", "superficie", n_rows=n_rows)
+
+    @pytest.mark.parametrize("level", LEVELS)
+    @pytest.mark.parametrize("fuzzy", [False, True], ids=["exacto", "fuzzy"])
+    def test_validate(self, benchmark, backend, level, fuzzy, n_rows):
+        valores = nombres(level) + (NOMBRES_CON_ERRORES[level] if fuzzy else [])
+        serie = to_backend(muestrear(valores, n_rows), backend)
+        medir(
+            benchmark,
+            VALIDADORES[level],
+            serie,
+            fuzzy_match=fuzzy,
+            on_error="coerce",
+            n_rows=n_rows,
+        )
+
+
+# ----------------------------------------------------------------------
+# Dataset real (MINAM, ~9k distritos con nombres sin tildes y en mayúsculas)
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestMinam:
+    def columna(self, db_minam, nombre, backend):
+        return to_backend(db_minam[nombre].to_numpy(), backend)
+
+    @pytest.mark.parametrize("level", LEVELS)
+    def test_get_desde_ubigeo(self, benchmark, db_minam, backend, level):
+        serie = self.columna(db_minam, "UBIGEO", backend)
+        medir(benchmark, GETTERS[level], serie, n_rows=len(db_minam))
+
+    @pytest.mark.parametrize(
+        "level, columna",
+        [
+            ("departamentos", "DEPARTAMENTO"),
+            ("provincias", "PROVINCIA"),
+            ("distritos", "DISTRITO"),
+        ],
+    )
+    @pytest.mark.parametrize("fuzzy", [False, True], ids=["exacto", "fuzzy"])
+    def test_validate(self, benchmark, db_minam, backend, level, columna, fuzzy):
+        serie = self.columna(db_minam, columna, backend)
+        medir(
+            benchmark,
+            VALIDADORES[level],
+            serie,
+            fuzzy_match=fuzzy,
+            on_error="coerce",
+            n_rows=len(db_minam),
+        )
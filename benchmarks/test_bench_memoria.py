@@ -0,0 +1,127 @@
+"""
+Benchmarks de memoria: pico de memoria (tracemalloc y RSS) de las funciones que
+reciben Series, con la misma columna en distintas representaciones (texto como
+objetos de Python, categórica y Arrow), y de la carga de los recursos.
+
+Los resultados quedan en ``extra_info`` de cada benchmark (ver
+``--benchmark-json``): ``pico_tracemalloc``, ``pico_rss``, ``resultado_bytes``
+y ``entrada_bytes``, en bytes.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+from _datos import (
+    NOMBRES_CON_ERRORES,
+    REPRESENTACIONES,
+    PicoMemoria,
+    medir_memoria,
+    muestrear,
+    nbytes,
+    to_representacion,
+)
+
+import ubigeos_peru as ubg
+from ubigeos_peru.core import get_metadato
+from ubigeos_peru.core.resource_manager import _PARTICIONES, ResourceManager
+
+
+def _codigos(level):
+    return list(ubg.cargar_diccionario(level, "inei"))
+
+
+def _nombres(level):
+    return list(ubg.cargar_diccionario("equivalencias", level))
+
+
+def _lugares(level):
+    # Sin las claves con notas al pie (ej. "PION 1/")
+    return [
+        lugar
+        for lugar in ubg.cargar_diccionario("inverted", level, "inei")
+        if "/" not in lugar
+    ]
+
+
+# nombre -> (función, valores de entrada, argumentos adicionales)
+CASOS = {
+    "get_departamento": (ubg.get_departamento, lambda: _codigos("distritos"), {}),
+    "get_provincia": (ubg.get_provincia, lambda: _codigos("distritos"), {}),
+    "get_distrito": (ubg.get_distrito, lambda: _codigos("distritos"), {}),
+    "get_macrorregion": (ubg.get_macrorregion, lambda: _codigos("departamentos"), {}),
+    "get_ubigeo": (
+        ubg.get_ubigeo,
+        lambda: _lugares("distritos"),
+        {"level": "distritos"},
+    ),
+    "get_metadato": (
+        get_metadato,
+        lambda: _codigos("distritos"),
+        {"level": "distritos", "key": "superficie"},
+    ),
+    "validate_distrito": (
+        ubg.validate_distrito,
+        lambda: _nombres("distritos"),
+        {"on_error": "coerce"},
+    ),
+    "validate_distrito_fuzzy": (
+        ubg.validate_distrito,
+        lambda: _nombres("distritos") + NOMBRES_CON_ERRORES["distritos"],
+        {"fuzzy_match": True, "on_error": "coerce"},
+    ),
+}
+
+
+@pytest.mark.parametrize("representacion", REPRESENTACIONES)
+@pytest.mark.parametrize("caso", CASOS)
+def test_memoria_series(benchmark, caso, representacion, n_rows):
+    funcion, valores, kwargs = CASOS[caso]
+    serie = to_representacion(muestrear(valores(), n_rows), representacion)
+    benchmark.extra_info["entrada_bytes"] = nbytes(serie)
+
+    medir_memoria(benchmark, funcion, serie, n_rows=n_rows, **kwargs)
+
+
+class TestRecursos:
+    @pytest.fixture(autouse=True)
+    def recursos_liberados(self):
+        ResourceManager.unload()
+        yield
+        # Los demás benchmarks asumen los recursos ya cargados
+        ubg.preload()
+
+    def test_cargar_recursos(self, benchmark):
+        """Todas las partes de todos los recursos, sin estructuras derivadas."""
+        partes = [
+            (nombre, *claves)
+            for nombre, niveles in _PARTICIONES.items()
+            for claves in itertools.product(*niveles)
+        ]
+
+        def cargar():
+            for nombre, *claves in partes:
+                ResourceManager.cargar_diccionario(nombre, *claves)
+
+        self._medir(benchmark, cargar)
+
+    def test_preload(self, benchmark):
+        """Recursos más vistas normalizadas e índices de fuzzy matching."""
+        self._medir(benchmark, ubg.preload)
+
+    @staticmethod
+    def _medir(benchmark, cargar):
+        with PicoMemoria() as pico:
+            cargar()
+
+        # Estimación propia de ResourceManager, para contrastarla con lo medido
+        benchmark.extra_info.update(
+            pico_tracemalloc=pico.tracemalloc,
+            pico_rss=pico.rss,
+            memory_usage=sum(ResourceManager.memory_usage().values()),
+        )
+        # setup no debe devolver nada: pytest-benchmark lo tomaría como argumentos
+        benchmark.pedantic(
+            cargar, setup=lambda: ResourceManager.unload() and None, rounds=3
+        )
@@ -15,6 +15,22 @@ RESOURCES_PATH = SCRIPT_DIR.parent / "src" / "ubigeos_peru" / "resources"
 RESOURCES_READABLE_PATH = SCRIPT_DIR.parent / "resources_readable"
 DATABASES_PATH = SCRIPT_DIR.parent / "databases"
 
+# Niveles de anidamiento por los que se parte cada recurso en resources/. Con 1,
+# cada clave de primer nivel va a su propio archivo (distritos/inei.json); con 2,
+# a un archivo por clave de segundo nivel (inverted/distritos/inei.json). El
+# ResourceManager carga solo la parte que necesita cada llamada.
+PARTITION_DEPTH = {
+    "departamentos": 1,
+    "distritos": 1,
+    "equivalencias": 1,
+    "inverted": 2,
+    "macrorregiones": 1,
+    "otros": 1,
+    "poblacion": 1,
+    "provincias": 1,
+    "global": 0,
+}
+
 
 def eliminar_acentos(texto: str) -> str:
     texto_normalizado = unicodedata.normalize("NFKD", texto)
@@ -66,6 +82,29 @@ def eliminar_acentos(texto: str) -> str:
 #         return None
 
 
+def _write_partitioned(data: dict, path: Path, depth: int) -> None:
+    if depth == 0:
+        with open(path.with_suffix(".json"), mode="wb") as f:
+            f.write(orjson.dumps(data))
+        return
+
+    path.mkdir(parents=True, exist_ok=True)
+    for key, value in data.items():
+        _write_partitioned(value, path / key, depth - 1)
+
+
+def _read_partitioned(path: Path, depth: int) -> dict:
+    if depth == 0:
+        with open(path.with_suffix(".json"), mode="rb") as f:
+            return orjson.loads(f.read())
+
+    data = {}
+    for child in sorted(path.iterdir()):
+        key = child.stem if child.suffix == ".json" else child.name
+        data[key] = _read_partitioned(path / key, depth - 1)
+    return data
+
+
 def write_to_resources(
     final_dict: dict,
     variable_name: Literal[
@@ -75,12 +114,13 @@ def write_to_resources(
         "inverted",
         "macrorregiones",
         "otros",
+        "poblacion",
         "provincias",
     ],
 ) -> None:
-    output_path = RESOURCES_PATH / f"{variable_name}.json"
-    with open(output_path, mode="wb") as f:
-        f.write(orjson.dumps(final_dict))
+    _write_partitioned(
+        final_dict, RESOURCES_PATH / variable_name, PARTITION_DEPTH[variable_name]
+    )
 
 
 def write_to_readable(
@@ -132,11 +172,11 @@ def update_to_resources(
         "global",
     ],
 ) -> None:
-    output_path = RESOURCES_PATH / f"{variable_name}.json"
+    output_path = RESOURCES_PATH / variable_name
+    depth = PARTITION_DEPTH[variable_name]
 
-    if os.path.exists(output_path):
-        with open(output_path, mode="rb") as f:
-            existing_data = orjson.loads(f.read())
+    if os.path.exists(output_path if depth else output_path.with_suffix(".json")):
+        existing_data = _read_partitioned(output_path, depth)
 
         merged_dicts = deep_merge_dicts(existing_data, final_dict)
     else:
@@ -146,8 +186,7 @@ def update_to_resources(
     #         natsorted(values.items(), key=lambda x: int(x[0]))
     #     )
 
-    with open(output_path, mode="wb") as f:
-        f.write(orjson.dumps(merged_dicts))
+    _write_partitioned(merged_dicts, output_path, depth)
 
     print(f"[INFO] Se actualizó {variable_name} en resources")
 
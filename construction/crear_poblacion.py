@@ -0,0 +1,29 @@
+import os
+
+import pandas as pd
+from _utils import DATABASES_PATH, write_to_resources
+
+full_path = os.path.join(DATABASES_PATH, "full.csv")
+
+
+def poblacion_creation():
+    """
+    Población por ubigeo INEI (distritos) y sus agregados por provincia y
+    departamento. Se usa para ordenar las sugerencias de `autocomplete`.
+    """
+    df = pd.read_csv(
+        full_path, sep=";", encoding="utf-8-sig", dtype={"ubigeo": str}
+    ).dropna(subset=["ubigeo", "población"])
+    df["ubigeo"] = df["ubigeo"].str.zfill(6)
+    df["población"] = df["población"].astype(int)
+
+    final_dict = {}
+    for level, largo in (("departamentos", 2), ("provincias", 4), ("distritos", 6)):
+        totales = df.groupby(df["ubigeo"].str[:largo])["población"].sum()
+        final_dict[level] = {codigo: int(total) for codigo, total in totales.items()}
+
+    write_to_resources(final_dict, "poblacion")
+
+
+if __name__ == "__main__":
+    poblacion_creation()
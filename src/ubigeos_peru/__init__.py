@@ -1,25 +1,80 @@
-from .core import (
-    cargar_diccionario,
-    get_departamento,
-    get_distrito,
-    get_macrorregion,
-    get_provincia,
-    get_ubigeo,
-    validate_departamento,
-    validate_distrito,
-    validate_provincia,
-)
-from .core.resource_manager import ResourceManager
-from .core.ubigeo_converter import UbigeoConverter
-from .core.validations import Validations
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import (
+        attach_tables,
+        autocomplete,
+        cargar_diccionario,
+        children,
+        descendants,
+        disable_stats,
+        enable_stats,
+        extract_ubigeo,
+        fuzzy_candidates,
+        get_departamento,
+        get_distrito,
+        get_macrorregion,
+        get_provincia,
+        get_ubigeo,
+        iter_convert,
+        parent,
+        preload,
+        register_duckdb,
+        rollup,
+        share_tables,
+        stats,
+        validate_departamento,
+        validate_distrito,
+        validate_provincia,
+    )
+    from .core.async_api import AsyncUbigeo
+    from .core.resource_manager import ResourceManager
+    from .core.ubigeo_converter import UbigeoConverter
+    from .core.validations import Validations
+
+# Atributos públicos y el módulo donde viven. Se importan recién al primer acceso
+# (PEP 562), para que `import ubigeos_peru` no cargue nada que no se use.
+_LAZY_ATTRS = {
+    "Validations": ".core.validations",
+    "UbigeoConverter": ".core.ubigeo_converter",
+    "ResourceManager": ".core.resource_manager",
+    "AsyncUbigeo": ".core.async_api",
+    "validate_departamento": ".core",
+    "validate_provincia": ".core",
+    "validate_distrito": ".core",
+    "fuzzy_candidates": ".core",
+    "get_departamento": ".core",
+    "get_provincia": ".core",
+    "get_distrito": ".core",
+    "get_macrorregion": ".core",
+    "get_ubigeo": ".core",
+    "cargar_diccionario": ".core",
+    "preload": ".core",
+    "register_duckdb": ".core",
+    "share_tables": ".core",
+    "attach_tables": ".core",
+    "autocomplete": ".core",
+    "children": ".core",
+    "parent": ".core",
+    "descendants": ".core",
+    "rollup": ".core",
+    "extract_ubigeo": ".core",
+    "iter_convert": ".core",
+    "enable_stats": ".core",
+    "disable_stats": ".core",
+    "stats": ".core",
+}
 
 __all__ = [
     "Validations",
     "UbigeoConverter",
     "ResourceManager",
+    "AsyncUbigeo",
     "validate_departamento",
     "validate_provincia",
     "validate_distrito",
+    "fuzzy_candidates",
     "get_departamento",
     "get_provincia",
     "get_distrito",
@@ -27,9 +82,39 @@ __all__ = [
     "get_ubigeo",
     # "get_medatato",
     "cargar_diccionario",
+    "preload",
+    "register_duckdb",
+    "share_tables",
+    "attach_tables",
+    "autocomplete",
+    "children",
+    "parent",
+    "descendants",
+    "rollup",
+    "extract_ubigeo",
+    "iter_convert",
+    "enable_stats",
+    "disable_stats",
+    "stats",
 ]
 
 __version__ = "0.2.3"
 __version_info__ = (0, 2, 2)
 __author__ = "Michael Suárez"
 __email__ = "michael-salvador@hotmail.com"
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Se guarda en el módulo para que los siguientes accesos no pasen por aquí
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
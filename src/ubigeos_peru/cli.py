@@ -0,0 +1,404 @@
+"""
+Interfaz de línea de comandos de ubigeos_peru.
+
+Ejemplo:
+
+    ubigeos-peru convert in.parquet out.parquet --col UBIGEO --add departamento,provincia
+    ubigeos-peru serve --port 8000
+
+La conversión se hace por lotes (memoria acotada): mientras un hilo escribe el
+lote anterior, el hilo principal lee y convierte el siguiente.
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+CAMPOS = ("departamento", "provincia", "distrito", "macrorregion")
+_FIN = object()
+
+
+def _importar_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "El comando 'convert' requiere 'pyarrow'. "
+            "Instálalo con: pip install ubigeos-peru[cli]"
+        ) from e
+    return pa
+
+
+def _detectar_formato(path: Path, formato: Optional[str]) -> str:
+    if formato:
+        return formato
+    suffix = path.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    if suffix in (".csv", ".txt"):
+        return "csv"
+    raise ValueError(
+        f"No se pudo inferir el formato de '{path}'. Usa --input-format/--output-format"
+    )
+
+
+# ------------------------------------------------------------------
+# LECTURA
+# ------------------------------------------------------------------
+
+
+def _leer_lotes(
+    path: Path, formato: str, col: str, batch_size: int, sep: str
+) -> Iterator[pa.RecordBatch]:
+    pa = _importar_pyarrow()
+
+    if formato == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        if col not in parquet_file.schema_arrow.names:
+            raise KeyError(f"La columna '{col}' no existe en {path}")
+        yield from parquet_file.iter_batches(batch_size=batch_size)
+        return
+
+    import pyarrow.csv as pacsv
+
+    # El código se lee como texto para no perder los ceros a la izquierda, y
+    # las celdas vacías como nulos (no como "")
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=max(batch_size * 64, 1 << 20)),
+        parse_options=pacsv.ParseOptions(delimiter=sep),
+        convert_options=pacsv.ConvertOptions(
+            column_types={col: pa.string()}, strings_can_be_null=True
+        ),
+    )
+    if col not in reader.schema.names:
+        raise KeyError(f"La columna '{col}' no existe en {path}")
+    for batch in reader:
+        # Los bloques de CSV no respetan batch_size; se cortan para acotar memoria
+        for offset in range(0, batch.num_rows, batch_size):
+            yield batch.slice(offset, batch_size)
+
+
+# ------------------------------------------------------------------
+# ESCRITURA
+# ------------------------------------------------------------------
+
+
+class _Escritor(threading.Thread):
+    """
+    Hilo que consume lotes de una cola acotada y los escribe, para que la
+    escritura se solape con la lectura y conversión del siguiente lote.
+    """
+
+    def __init__(self, path: Path, formato: str, sep: str, prefetch: int):
+        super().__init__(daemon=True)
+        self.path = path
+        self.formato = formato
+        self.sep = sep
+        self.cola: queue.Queue = queue.Queue(maxsize=prefetch)
+        self.error: Optional[BaseException] = None
+        self.filas = 0
+
+    def run(self) -> None:
+        writer = None
+        try:
+            while True:
+                batch = self.cola.get()
+                if batch is _FIN:
+                    break
+                if writer is None:
+                    writer = self._abrir(batch.schema)
+                writer.write_batch(batch)
+                self.filas += batch.num_rows
+        except BaseException as e:
+            self.error = e
+            # Vacía la cola para no bloquear al productor
+            while self.cola.get() is not _FIN:
+                pass
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _abrir(self, schema: pa.Schema):
+        if self.formato == "parquet":
+            import pyarrow.parquet as pq
+
+            return pq.ParquetWriter(self.path, schema)
+
+        import pyarrow.csv as pacsv
+
+        return pacsv.CSVWriter(
+            self.path, schema, write_options=pacsv.WriteOptions(delimiter=self.sep)
+        )
+
+
+# ------------------------------------------------------------------
+# CONVERSIÓN
+# ------------------------------------------------------------------
+
+
+def _convertir_con_error(
+    campo: str,
+    codigos: pa.ChunkedArray,
+    institucion: str,
+    normalize: bool,
+    on_error: str,
+) -> pa.ChunkedArray:
+    """
+    Convierte la columna con la ruta vectorizada. Si algún código no existe
+    (KeyError) o está mal formado (ValueError), se aplica `on_error` una vez por
+    cada código distinto y se reconstruye la columna.
+    """
+    pa = _importar_pyarrow()
+    import pyarrow.compute as pc
+
+    from .core._utils import assert_error
+    from .core.ubigeo_converter import UbigeoConverter
+
+    func = getattr(UbigeoConverter, f"get_{campo}")
+    kwargs = {"normalize": normalize}
+    if campo != "macrorregion":
+        # Las macrorregiones usan otras instituciones (inei, minsa, ceplan)
+        kwargs["institucion"] = institucion
+    if campo in ("provincia", "distrito"):
+        # Aquí on_error resuelve los códigos inexistentes sin salir de la ruta
+        # vectorizada; los mal formados igual pasan por la ruta de abajo
+        kwargs["on_error"] = on_error
+
+    try:
+        return func(codigos, **kwargs)
+    except (KeyError, ValueError):
+        if on_error == "raise":
+            raise
+
+    kwargs.pop("on_error", None)
+    unicos = pc.unique(codigos).drop_null()
+    traducidos = []
+    for codigo in unicos.to_pylist():
+        try:
+            traducido = func(codigo, **kwargs)
+        except (KeyError, ValueError) as e:
+            traducido = assert_error(
+                on_error,
+                evaluated=str(codigo),
+                institucion=institucion.upper(),
+                message=str(e.args[0]) if e.args else str(e),
+            )
+        traducidos.append(traducido)
+    return pc.take(
+        pa.array(traducidos, type=pa.string()), pc.index_in(codigos, value_set=unicos)
+    )
+
+
+def _convertir_lote(
+    batch: pa.RecordBatch,
+    col: str,
+    campos: Sequence[str],
+    institucion: str,
+    normalize: bool,
+    on_error: str,
+) -> pa.RecordBatch:
+    pa = _importar_pyarrow()
+
+    codigos = pa.chunked_array([batch.column(col)])
+    columnas = list(batch.columns)
+    nombres = list(batch.schema.names)
+
+    for campo in campos:
+        resultado = _convertir_con_error(
+            campo, codigos, institucion, normalize, on_error
+        )
+        columnas.append(resultado.combine_chunks().cast(pa.string()))
+        nombres.append(campo)
+
+    return pa.RecordBatch.from_arrays(columnas, names=nombres)
+
+
+def convert(
+    input_path: str | Path,
+    output_path: str | Path,
+    col: str,
+    add: Sequence[str] = ("departamento",),
+    institucion: str = "inei",
+    normalize: bool = False,
+    on_error: str = "coerce",
+    batch_size: int = 100_000,
+    input_format: Optional[str] = None,
+    output_format: Optional[str] = None,
+    sep: str = ",",
+    prefetch: int = 2,
+) -> int:
+    """
+    Convierte un archivo CSV o Parquet por lotes, agregando columnas de nombres
+    a partir de la columna de códigos de ubigeo.
+
+    Parameters
+    ----------
+    input_path, output_path : str | Path
+        Rutas de entrada y salida. El formato se infiere de la extensión.
+    col : str
+        Nombre de la columna con los códigos de ubigeo.
+    add : Sequence[str]
+        Campos a agregar: "departamento", "provincia", "distrito" o "macrorregion".
+    batch_size : int, default 100_000
+        Filas por lote (al menos 1); determina el uso máximo de memoria.
+    prefetch : int, default 2
+        Número máximo de lotes convertidos en espera de ser escritos (al menos 1).
+
+    Returns
+    -------
+    int
+        Número de filas escritas.
+    """
+    _importar_pyarrow()
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError("batch_size debe ser un entero positivo")
+    if not isinstance(prefetch, int) or prefetch < 1:
+        # Con 0 la cola no tendría límite y la memoria dejaría de estar acotada
+        raise ValueError("prefetch debe ser un entero positivo")
+
+    input_path, output_path = Path(input_path), Path(output_path)
+    campos = [campo.strip().lower() for campo in add if campo.strip()]
+    invalidos = [campo for campo in campos if campo not in CAMPOS]
+    if invalidos:
+        raise ValueError(
+            f"Campos no soportados: {invalidos}. Solo se aceptan: {', '.join(CAMPOS)}"
+        )
+
+    formato_in = _detectar_formato(input_path, input_format)
+    formato_out = _detectar_formato(output_path, output_format)
+
+    escritor = _Escritor(output_path, formato_out, sep, prefetch)
+    escritor.start()
+    try:
+        try:
+            for batch in _leer_lotes(input_path, formato_in, col, batch_size, sep):
+                if escritor.error is not None:
+                    break
+                escritor.cola.put(
+                    _convertir_lote(
+                        batch, col, campos, institucion, normalize, on_error
+                    )
+                )
+        finally:
+            escritor.cola.put(_FIN)
+            escritor.join()
+
+        if escritor.error is not None:
+            raise escritor.error
+    except BaseException:
+        # No se deja un archivo de salida a medio escribir
+        output_path.unlink(missing_ok=True)
+        raise
+
+    return escritor.filas
+
+
+# ------------------------------------------------------------------
+# MAIN
+# ------------------------------------------------------------------
+
+
+def _entero_positivo(valor: str) -> int:
+    try:
+        numero = int(valor)
+    except ValueError:
+        numero = 0
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"debe ser un entero positivo: '{valor}'")
+    return numero
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ubigeos-peru",
+        description="Herramientas de línea de comandos para ubigeos del Perú",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = subparsers.add_parser(
+        "convert",
+        help="Agrega nombres de ubicaciones a un CSV/Parquet procesándolo por lotes",
+    )
+    convert_parser.add_argument("input", help="Archivo de entrada (.csv o .parquet)")
+    convert_parser.add_argument("output", help="Archivo de salida (.csv o .parquet)")
+    convert_parser.add_argument(
+        "--col", required=True, help="Columna con los códigos de ubigeo"
+    )
+    convert_parser.add_argument(
+        "--add",
+        default="departamento",
+        help=f"Campos a agregar separados por comas ({', '.join(CAMPOS)})",
+    )
+    convert_parser.add_argument(
+        "--institucion", default="inei", choices=["inei", "reniec", "sunat"]
+    )
+    convert_parser.add_argument("--normalize", action="store_true")
+    convert_parser.add_argument(
+        "--on-error",
+        default="coerce",
+        choices=["raise", "warn", "ignore", "capitalize", "coerce"],
+    )
+    convert_parser.add_argument("--batch-size", type=_entero_positivo, default=100_000)
+    convert_parser.add_argument("--prefetch", type=_entero_positivo, default=2)
+    convert_parser.add_argument("--sep", default=",", help="Separador para CSV")
+    convert_parser.add_argument("--input-format", choices=["csv", "parquet"])
+    convert_parser.add_argument("--output-format", choices=["csv", "parquet"])
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Inicia un servidor HTTP local con endpoints de consulta (JSON y Arrow IPC)",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="No cargar los recursos al iniciar (se cargan en la primera consulta)",
+    )
+    serve_parser.add_argument(
+        "--verbose", action="store_true", help="Registrar cada request en stderr"
+    )
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "convert":
+        filas = convert(
+            args.input,
+            args.output,
+            col=args.col,
+            add=args.add.split(","),
+            institucion=args.institucion,
+            normalize=args.normalize,
+            on_error=args.on_error,
+            batch_size=args.batch_size,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            sep=args.sep,
+            prefetch=args.prefetch,
+        )
+        print(f"[INFO] Se escribieron {filas} filas en {args.output}", file=sys.stderr)
+    elif args.command == "serve":
+        from .server import serve
+
+        serve(args.host, args.port, preload=not args.no_preload, verbose=args.verbose)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,14 +16,26 @@ Antes:
 
 from __future__ import annotations
 
-from typing import Any, Literal
-
-from narwhals.typing import IntoSeriesT
-
+from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping, Optional, Sequence
+
+from .async_api import AsyncUbigeo
+from .autocomplete import autocomplete
+from .duckdb_integration import register_duckdb
+from .extraction import extract_ubigeo
+from .hierarchy import children, descendants, parent
+from .instrumentation import disable_stats, enable_stats, stats
 from .resource_manager import ResourceManager
+from .rollup import rollup
+from .shared_tables import attach_tables, share_tables
+from .streaming import iter_convert
 from .ubigeo_converter import UbigeoConverter
 from .validations import Validations
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from narwhals.typing import IntoDataFrameT, IntoSeriesT
+
 # ------------------------------------------------------------------
 # Envuelve los métodos de clase de Ubigeo en funciones top-level
 # ------------------------------------------------------------------
@@ -68,6 +80,7 @@ def get_departamento(
     - El subcódigo para departamento se toma de los primeros 2 caracteres del código validado.
     - Para códigos de longitud impar (1, 3 o 5), se asume que falta un cero inicial y se añadirá.
     - El input puede ser int o str, o una columna de un DataFrame. Se recomienda este último para mayor eficiencia y legibilidad.
+    - Las columnas pueden ser de str, enteros (también con nulos), floats con valores enteros (ej. 150101.0, como deja pandas a los enteros con NaN) o Arrow. Los nulos se devuelven como nulos.
 
     Examples
     --------
@@ -186,6 +199,7 @@ def get_provincia(
     - Para códigos de longitud impar (3 o 5), se asume que falta un cero inicial y se añadirá.
     - El subcódigo para provincia se toma de los últimos 4 caracteres del código validado.
     - El input puede ser str o int
+    - Las columnas pueden ser de str, enteros (también con nulos), floats con valores enteros (ej. 150101.0, como deja pandas a los enteros con NaN) o Arrow. Los nulos se devuelven como nulos.
 
     Examples
     --------
@@ -296,6 +310,7 @@ def get_distrito(
     - El subcódigo para provincia se toma de los últimos 4 caracteres del código validado.
     - Para códigos de longitud impar (3 o 5), se asume que falta un cero inicial y se añadirá.
     - El input puede ser str o int
+    - Las columnas pueden ser de str, enteros (también con nulos), floats con valores enteros (ej. 150101.0, como deja pandas a los enteros con NaN) o Arrow. Los nulos se devuelven como nulos.
 
     Examples
     --------
@@ -485,7 +500,13 @@ def validate_departamento(
     normalize: bool = False,
     fuzzy_match: bool = False,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-) -> str | IntoSeriesT:
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    fuzzy_report: bool = False,
+    score_cutoff: Optional[float] = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: Optional[bool] = None,
+) -> str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]:
     """
     Valida el nombre de un departamento escrito con gramática variable y devuelve el nombre oficial.
 
@@ -498,7 +519,8 @@ def validate_departamento(
     normalize : bool, optional
         Si se cambia a True, retorna el nombre en mayúsculas y sin acentos (ex. JUNIN), por defecto False.
     fuzzy_match : bool, optional
-        Si es True, intenta encontrar coincidencias aproximadas usando fuzzy matching, por defecto True.
+        Si es True, intenta encontrar coincidencias aproximadas: primero por similitud fonética
+        (ej. "WANUKO" -> Huánuco, "NASCA" ~ "NAZCA") y luego con fuzzy matching, por defecto True.
     on_error : {"raise", "warn", "ignore", "capitalize", "coerce"}, opcional
         Para manejar casos en que el nombre no coincide con ningún departamento; útil para evaluar datos mixtos.
         - `raise`: Lanza una excepción (valor por defecto).
@@ -506,10 +528,29 @@ def validate_departamento(
         - `ignore`: Omite el nombre sin generar error.
         - `capitalize`: Devuelve el nombre capitalizado (primera letra en mayúscula).
         - `coerce`: Devuelve None.
+    n_jobs : int, optional
+        Solo para Series. Número de procesos usados para el fuzzy matching de los valores
+        distintos (-1 usa todos los CPUs). Por defecto None, que ejecuta en el proceso actual.
+    executor : concurrent.futures.Executor, optional
+        Solo para Series. Executor externo a reutilizar entre llamadas; tiene prioridad sobre `n_jobs`.
+    fuzzy_report : bool, optional
+        Solo para Series. Si es True, en lugar de imprimir los reemplazos hechos por fuzzy matching
+        devuelve la tupla (serie, reporte), donde el reporte es un DataFrame del mismo backend con
+        una fila por valor reemplazado: "original", "match", "score" y "filas". Por defecto False.
+    score_cutoff : float, optional
+        Score mínimo (0-100) para aceptar una coincidencia del fuzzy matching. Por defecto
+        None, que usa 80.
+    scorer : str | Callable, optional
+        Scorer de `rapidfuzz.fuzz` usado en el fuzzy matching, por nombre (ej. "token_sort_ratio")
+        o como función. Por defecto "WRatio".
+    phonetic : bool, optional
+        Si se buscan coincidencias fonéticas antes del fuzzy matching. Estas no pasan por
+        `score_cutoff` (pueden diferir en varias letras, o en Ñ y N). Por defecto None: se
+        usan solo si no se indica un `score_cutoff`.
 
     Returns
     -------
-    str | IntoSeriesT
+    str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]
         Nombre oficial del departamento.
 
     Raises
@@ -580,6 +621,12 @@ def validate_departamento(
         normalize=normalize,
         fuzzy_match=fuzzy_match,
         on_error=on_error,
+        n_jobs=n_jobs,
+        executor=executor,
+        fuzzy_report=fuzzy_report,
+        score_cutoff=score_cutoff,
+        scorer=scorer,
+        phonetic=phonetic,
     )
 
 
@@ -589,7 +636,13 @@ def validate_provincia(
     normalize: bool = False,
     fuzzy_match: bool = False,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-) -> str | IntoSeriesT:
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    fuzzy_report: bool = False,
+    score_cutoff: Optional[float] = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: Optional[bool] = None,
+) -> str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]:
     """
     Valida el nombre de una provincia escrita con gramática variable y devuelve el nombre oficial.
 
@@ -602,7 +655,8 @@ def validate_provincia(
     normalize : bool, optional
         Si se cambia a True, retorna el nombre en mayúsculas y sin acentos (ex. HUAROCHIRI), por defecto False.
     fuzzy_match : bool, optional
-        Si es True, intenta encontrar coincidencias aproximadas usando fuzzy matching, por defecto True.
+        Si es True, intenta encontrar coincidencias aproximadas: primero por similitud fonética
+        (ej. "WANUKO" -> Huánuco, "NASCA" ~ "NAZCA") y luego con fuzzy matching, por defecto True.
     on_error : {"raise", "warn", "ignore", "capitalize", "coerce"}, opcional
         Para manejar casos en que el nombre no coincide con ninguna provincia; útil para evaluar datos mixtos.
         - `raise`: Lanza una excepción (valor por defecto).
@@ -610,10 +664,29 @@ def validate_provincia(
         - `ignore`: Omite el nombre sin generar error.
         - `capitalize`: Devuelve el nombre capitalizado (primera letra en mayúscula).
         - `coerce`: Devuelve None.
+    n_jobs : int, optional
+        Solo para Series. Número de procesos usados para el fuzzy matching de los valores
+        distintos (-1 usa todos los CPUs). Por defecto None, que ejecuta en el proceso actual.
+    executor : concurrent.futures.Executor, optional
+        Solo para Series. Executor externo a reutilizar entre llamadas; tiene prioridad sobre `n_jobs`.
+    fuzzy_report : bool, optional
+        Solo para Series. Si es True, en lugar de imprimir los reemplazos hechos por fuzzy matching
+        devuelve la tupla (serie, reporte), donde el reporte es un DataFrame del mismo backend con
+        una fila por valor reemplazado: "original", "match", "score" y "filas". Por defecto False.
+    score_cutoff : float, optional
+        Score mínimo (0-100) para aceptar una coincidencia del fuzzy matching. Por defecto
+        None, que usa 80.
+    scorer : str | Callable, optional
+        Scorer de `rapidfuzz.fuzz` usado en el fuzzy matching, por nombre (ej. "token_sort_ratio")
+        o como función. Por defecto "WRatio".
+    phonetic : bool, optional
+        Si se buscan coincidencias fonéticas antes del fuzzy matching. Estas no pasan por
+        `score_cutoff` (pueden diferir en varias letras, o en Ñ y N). Por defecto None: se
+        usan solo si no se indica un `score_cutoff`.
 
     Returns
     -------
-    str | IntoSeriesT
+    str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]
         Nombre oficial de la provincia.
 
     Raises
@@ -675,6 +748,12 @@ def validate_provincia(
         normalize=normalize,
         fuzzy_match=fuzzy_match,
         on_error=on_error,
+        n_jobs=n_jobs,
+        executor=executor,
+        fuzzy_report=fuzzy_report,
+        score_cutoff=score_cutoff,
+        scorer=scorer,
+        phonetic=phonetic,
     )
 
 
@@ -684,7 +763,13 @@ def validate_distrito(
     normalize: bool = False,
     fuzzy_match: bool = False,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-) -> str | IntoSeriesT:
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    fuzzy_report: bool = False,
+    score_cutoff: Optional[float] = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: Optional[bool] = None,
+) -> str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]:
     """
     Valida el nombre de un distrito escrito con gramática variable y devuelve el nombre oficial.
 
@@ -697,7 +782,8 @@ def validate_distrito(
     normalize : bool, optional
         Si se cambia a True, retorna el nombre en mayúsculas y sin acentos (ex. ANTIOQUIA), por defecto False.
     fuzzy_match : bool, optional
-        Si es True, intenta encontrar coincidencias aproximadas usando fuzzy matching, por defecto True.
+        Si es True, intenta encontrar coincidencias aproximadas: primero por similitud fonética
+        (ej. "WANUKO" -> Huánuco, "NASCA" ~ "NAZCA") y luego con fuzzy matching, por defecto True.
     on_error : {"raise", "warn", "ignore", "capitalize", "coerce"}, opcional
         Para manejar casos en que el nombre no coincide con ningún distrito; útil para evaluar datos mixtos.
         - `raise`: Lanza una excepción (valor por defecto).
@@ -705,10 +791,29 @@ def validate_distrito(
         - `ignore`: Omite el nombre sin generar error.
         - `capitalize`: Devuelve el nombre capitalizado (primera letra en mayúscula).
         - `coerce`: Devuelve None.
+    n_jobs : int, optional
+        Solo para Series. Número de procesos usados para el fuzzy matching de los valores
+        distintos (-1 usa todos los CPUs). Por defecto None, que ejecuta en el proceso actual.
+    executor : concurrent.futures.Executor, optional
+        Solo para Series. Executor externo a reutilizar entre llamadas; tiene prioridad sobre `n_jobs`.
+    fuzzy_report : bool, optional
+        Solo para Series. Si es True, en lugar de imprimir los reemplazos hechos por fuzzy matching
+        devuelve la tupla (serie, reporte), donde el reporte es un DataFrame del mismo backend con
+        una fila por valor reemplazado: "original", "match", "score" y "filas". Por defecto False.
+    score_cutoff : float, optional
+        Score mínimo (0-100) para aceptar una coincidencia del fuzzy matching. Por defecto
+        None, que usa 80.
+    scorer : str | Callable, optional
+        Scorer de `rapidfuzz.fuzz` usado en el fuzzy matching, por nombre (ej. "token_sort_ratio")
+        o como función. Por defecto "WRatio".
+    phonetic : bool, optional
+        Si se buscan coincidencias fonéticas antes del fuzzy matching. Estas no pasan por
+        `score_cutoff` (pueden diferir en varias letras, o en Ñ y N). Por defecto None: se
+        usan solo si no se indica un `score_cutoff`.
 
     Returns
     -------
-    str | IntoSeriesT
+    str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]
         Nombre oficial del distrito.
 
     Raises
@@ -770,6 +875,64 @@ def validate_distrito(
         normalize=normalize,
         fuzzy_match=fuzzy_match,
         on_error=on_error,
+        n_jobs=n_jobs,
+        executor=executor,
+        fuzzy_report=fuzzy_report,
+        score_cutoff=score_cutoff,
+        scorer=scorer,
+        phonetic=phonetic,
+    )
+
+
+def fuzzy_candidates(
+    ubicacion: str | IntoSeriesT,
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    limit: int = 5,
+    score_cutoff: float = 60,
+    scorer: str | Callable[..., float] = "WRatio",
+) -> list[tuple[str, float]] | IntoSeriesT:
+    """
+    Devuelve los nombres oficiales más parecidos a una ubicación, con su score, para revisión manual.
+
+    A diferencia de `validate_*`, que se queda con la mejor coincidencia, devuelve hasta `limit`
+    candidatos ordenados de mayor a menor score.
+
+    Parameters
+    ----------
+    ubicacion : str | IntoSeriesT
+        Nombre o serie de nombres a buscar.
+    level : {"departamentos", "provincias", "distritos"}, optional
+        Nivel administrativo en el que se busca (por defecto "distritos").
+    limit : int, optional
+        Cantidad máxima de candidatos por valor (por defecto 5).
+    score_cutoff : float, optional
+        Score mínimo (0-100) de un candidato (por defecto 60).
+    scorer : str | Callable, optional
+        Scorer de `rapidfuzz.fuzz`, por nombre o como función (por defecto "WRatio").
+
+    Returns
+    -------
+    list[tuple[str, float]] | IntoSeriesT
+        Para un str, lista de tuplas (nombre, score). Para una Series de pandas, Polars o PyArrow,
+        una serie del mismo backend con una lista de structs {"nombre", "score"} por fila
+        (requiere pyarrow); los nulos se mantienen.
+
+    Raises
+    ------
+    ValueError
+        Si `limit`, `score_cutoff` o `scorer` no son válidos.
+
+    Examples
+    --------
+    >>> ubg.fuzzy_candidates("Miraflors", limit=2)
+    [('Miraflores', 94.73684210526316), ('San Juan de Miraflores', 80.0)]
+    """
+    return Validations.fuzzy_candidates(
+        ubicacion,
+        level,
+        limit=limit,
+        score_cutoff=score_cutoff,
+        scorer=scorer,
     )
 
 
@@ -828,8 +991,54 @@ def cargar_diccionario(
         "otros",
         "inverted",
     ],
-) -> dict[str, Any]:
-    return ResourceManager.cargar_diccionario(resource_name)
+    *claves: str,
+) -> Mapping[str, Any]:
+    return ResourceManager.cargar_diccionario(resource_name, *claves)
+
+
+def preload(
+    levels: Optional[
+        Sequence[Literal["departamentos", "provincias", "distritos"]]
+    ] = None,
+    institutions: Optional[Sequence[Literal["inei", "reniec", "sunat"]]] = None,
+    fuzzy: bool = True,
+) -> dict[str, dict[str, Any]]:
+    """
+    Carga por adelantado los recursos, las vistas normalizadas y los índices de fuzzy matching.
+
+    Útil para ejecutarse al iniciar un proceso (por ejemplo, en un hook de inicio de un
+    contenedor), de modo que la primera consulta no pague el costo de parsear los JSON
+    ni de construir los índices.
+
+    Parameters
+    ----------
+    levels : list of {"departamentos", "provincias", "distritos"}, optional
+        Niveles a precargar. Con None (por defecto), los tres; una lista vacía
+        no precarga ninguno.
+    institutions : list of {"inei", "reniec", "sunat"}, optional
+        Instituciones cuyos recursos y vistas normalizadas se precargan. Con
+        None (por defecto), las tres; una lista vacía no precarga ninguna.
+    fuzzy : bool, default True
+        Si es True, construye también los índices de fuzzy matching y los fonéticos.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        Reporte por estructura con las claves "segundos" (tiempo de construcción),
+        "bytes" (memoria retenida, medida con tracemalloc) y "ya_cargado".
+
+    Examples
+    --------
+    >>> import ubigeos_peru as ubg
+    >>> reporte = ubg.preload(levels=["distritos"], institutions=["inei"])
+    >>> reporte["distritos/inei"]
+    {'segundos': 0.0023, 'bytes': 141377, 'ya_cargado': False}
+    >>> sum(r["segundos"] for r in reporte.values())
+    0.0324
+    """
+    return ResourceManager.preload(
+        levels=levels, institutions=institutions, fuzzy=fuzzy
+    )
 
 
 # ------------------------------------------------------------------
@@ -838,6 +1047,7 @@ def cargar_diccionario(
 __all__ = [
     "UbigeoConverter",
     "Validations",
+    "AsyncUbigeo",
     "get_departamento",
     "get_provincia",
     "get_distrito",
@@ -847,10 +1057,25 @@ __all__ = [
     "validate_departamento",
     "validate_provincia",
     "validate_distrito",
+    "fuzzy_candidates",
     "cargar_diccionario",
+    "preload",
+    "register_duckdb",
+    "share_tables",
+    "attach_tables",
+    "autocomplete",
+    "children",
+    "parent",
+    "descendants",
+    "rollup",
+    "extract_ubigeo",
+    "iter_convert",
+    "enable_stats",
+    "disable_stats",
+    "stats",
 ]
 
 if __name__ == "__main__":
     import doctest
 
-    doctest.testmod()
\ No newline at end of file
+    doctest.testmod()
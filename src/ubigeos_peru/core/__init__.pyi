@@ -1,8 +1,24 @@
-from typing import Any, Literal, overload
+from concurrent.futures import Executor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Sequence,
+    overload,
+)
 
-from narwhals.typing import IntoSeriesT
+from narwhals.typing import IntoDataFrameT, IntoSeriesT
 
 from ._utils import SeriesLike
+from .async_api import AsyncUbigeo as AsyncUbigeo
+from .shared_tables import SharedTables
+
+if TYPE_CHECKING:
+    import duckdb
 
 # ----------------------------------------------------------------------
 # VALIDADORES Y GETTERS UBIGEOS
@@ -146,6 +162,9 @@ def validate_departamento(
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
 ) -> str: ...
 @overload
 def validate_departamento(
@@ -153,19 +172,48 @@ def validate_departamento(
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    fuzzy_report: Literal[False] = False,
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
 ) -> IntoSeriesT: ...
+@overload
+def validate_departamento(
+    departamento: IntoSeriesT,
+    normalize: bool = False,
+    fuzzy_match: bool = True,
+    on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    *,
+    fuzzy_report: Literal[True],
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
+) -> tuple[IntoSeriesT, Any]: ...
 def validate_departamento(
     departamento: str | SeriesLike,
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-) -> str | SeriesLike: ...
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    fuzzy_report: bool = False,
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
+) -> str | SeriesLike | tuple[SeriesLike, Any]: ...
 @overload
 def validate_provincia(
     provincia: str,
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
 ) -> str: ...
 @overload
 def validate_provincia(
@@ -173,19 +221,48 @@ def validate_provincia(
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    fuzzy_report: Literal[False] = False,
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
 ) -> IntoSeriesT: ...
+@overload
+def validate_provincia(
+    provincia: IntoSeriesT,
+    normalize: bool = False,
+    fuzzy_match: bool = True,
+    on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    *,
+    fuzzy_report: Literal[True],
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
+) -> tuple[IntoSeriesT, Any]: ...
 def validate_provincia(
     provincia: str | SeriesLike,
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-) -> str | SeriesLike: ...
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    fuzzy_report: bool = False,
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
+) -> str | SeriesLike | tuple[SeriesLike, Any]: ...
 @overload
 def validate_distrito(
     distrito: str,
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
 ) -> str: ...
 @overload
 def validate_distrito(
@@ -193,13 +270,55 @@ def validate_distrito(
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    fuzzy_report: Literal[False] = False,
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
 ) -> IntoSeriesT: ...
+@overload
+def validate_distrito(
+    distrito: IntoSeriesT,
+    normalize: bool = False,
+    fuzzy_match: bool = True,
+    on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    *,
+    fuzzy_report: Literal[True],
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
+) -> tuple[IntoSeriesT, Any]: ...
 def validate_distrito(
     distrito: str | SeriesLike,
     normalize: bool = False,
     fuzzy_match: bool = True,
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-) -> str | SeriesLike: ...
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    fuzzy_report: bool = False,
+    score_cutoff: float | None = None,
+    scorer: str | Callable[..., float] = "WRatio",
+    phonetic: bool | None = None,
+) -> str | SeriesLike | tuple[SeriesLike, Any]: ...
+@overload
+def fuzzy_candidates(
+    ubicacion: str,
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    limit: int = 5,
+    score_cutoff: float = 60,
+    scorer: str | Callable[..., float] = "WRatio",
+) -> list[tuple[str, float]]: ...
+@overload
+def fuzzy_candidates(
+    ubicacion: IntoSeriesT,
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    limit: int = 5,
+    score_cutoff: float = 60,
+    scorer: str | Callable[..., float] = "WRatio",
+) -> IntoSeriesT: ...
 def cargar_diccionario(
     resource_name: Literal[
         "departamentos",
@@ -210,4 +329,90 @@ def cargar_diccionario(
         "otros",
         "inverted",
     ],
-) -> dict[str, Any]: ...
+    *claves: str,
+) -> Mapping[str, Any]: ...
+def preload(
+    levels: Sequence[Literal["departamentos", "provincias", "distritos"]] | None = None,
+    institutions: Sequence[Literal["inei", "reniec", "sunat"]] | None = None,
+    fuzzy: bool = True,
+) -> dict[str, dict[str, Any]]: ...
+def register_duckdb(
+    con: "duckdb.DuckDBPyConnection",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+    normalize: bool = False,
+    fuzzy_match: bool = True,
+    prefix: str = "ubigeo",
+    tables: bool = True,
+) -> "duckdb.DuckDBPyConnection": ...
+def share_tables(
+    levels: Sequence[Literal["departamentos", "provincias", "distritos"]] | None = None,
+    institutions: Sequence[Literal["inei", "reniec", "sunat"]] | None = None,
+    fuzzy: bool = True,
+) -> SharedTables: ...
+def attach_tables(name: str) -> None: ...
+def autocomplete(
+    prefix: str,
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+    limit: int = 10,
+    by_population: bool = False,
+) -> list[dict[str, str]]: ...
+def children(
+    code: str | int, institucion: Literal["inei", "reniec", "sunat"] = "inei"
+) -> dict[str, str]: ...
+def parent(code: str | int) -> str | None: ...
+def descendants(
+    code: str | int,
+    level: Literal["provincias", "distritos"] = "distritos",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+) -> dict[str, str]: ...
+def rollup(
+    df: IntoDataFrameT,
+    code_col: str,
+    value_cols: str | Sequence[str],
+    to: Literal["provincias", "departamentos", "macrorregiones"] = "departamentos",
+    agg: Literal["sum", "mean", "median", "min", "max", "count", "std", "var"]
+    | Mapping[
+        str, Literal["sum", "mean", "median", "min", "max", "count", "std", "var"]
+    ] = "sum",
+    institucion: Literal["inei", "reniec", "sunat", "minsa", "ceplan"] = "inei",
+) -> IntoDataFrameT: ...
+@overload
+def extract_ubigeo(
+    texts: str,
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+) -> str | None: ...
+@overload
+def extract_ubigeo(
+    texts: IntoSeriesT,
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+) -> IntoSeriesT: ...
+@overload
+def extract_ubigeo(
+    texts: Sequence[str | None],
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+) -> list[str | None]: ...
+def iter_convert(
+    lotes: Iterable[Any],
+    field: Literal[
+        "departamento",
+        "provincia",
+        "distrito",
+        "macrorregion",
+        "ubigeo",
+        "validate_departamento",
+        "validate_provincia",
+        "validate_distrito",
+    ] = "departamento",
+    batch_size: int = 10_000,
+    prefetch: int = 0,
+    **kwargs: Any,
+) -> Iterator[Any]: ...
+def enable_stats(
+    callback: Callable[[Literal["contador", "tiempo"], str, float], Any] | None = None,
+) -> None: ...
+def disable_stats() -> None: ...
+def stats(reset: bool = False) -> dict[str, Any]: ...
@@ -0,0 +1,131 @@
+"""
+Ejecución en paralelo (multiproceso) del fuzzy matching sobre valores distintos.
+
+Cuando el pool lo crea la librería, el proceso principal publica el índice de
+fuzzy matching en memoria compartida y los workers se adjuntan a él en el
+`initializer`, sin parsear recursos. Los workers reciben únicamente listas de
+strings, por lo que el costo de serialización es mínimo. Los resultados se
+reensamblan en el mismo orden de entrada.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from typing import Literal, Optional
+
+from ._utils import Scorer
+from .resource_manager import ResourceManager
+from .shared_tables import attach_tables, share_tables
+
+EntityType = Literal["departamentos", "provincias", "distritos"]
+
+# Por debajo de esta cantidad de valores no compensa levantar procesos
+_MIN_ITEMS_PARALELO = 256
+# Número de chunks por worker, para balancear la carga entre procesos
+_CHUNKS_POR_WORKER = 4
+
+
+def _init_worker(tablas: Optional[str] = None) -> None:
+    # Se ejecuta una vez por proceso: se adjunta a las tablas compartidas o, si no
+    # las hay, parsea los recursos y construye los índices
+    if tablas is not None:
+        attach_tables(tablas)
+    else:
+        ResourceManager.preload(fuzzy=True)
+
+
+def _fuzzy_chunk(
+    items: list[str],
+    entity_type: EntityType,
+    score_cutoff: float = 80,
+    scorer: Scorer = "WRatio",
+) -> list[Optional[tuple[str, float]]]:
+    indice = ResourceManager.cargar_indice_fuzzy(entity_type)
+    return [indice.buscar_con_score(item, score_cutoff, scorer) for item in items]
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    if n_jobs is None:
+        return 1
+    if not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+        raise ValueError("n_jobs debe ser un entero positivo, -1 o None")
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    return n_jobs
+
+
+def _dividir(items: list[str], n_chunks: int) -> list[list[str]]:
+    size = -(-len(items) // n_chunks)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def fuzzy_validate_many(
+    items: list[str],
+    entity_type: EntityType,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    score_cutoff: float = 80,
+    scorer: Scorer = "WRatio",
+) -> list[Optional[tuple[str, float]]]:
+    """
+    Aplica el fuzzy matching a una lista de valores (ya limpios y sin duplicados).
+
+    Parameters
+    ----------
+    items : list[str]
+        Valores a buscar.
+    entity_type : {'departamentos', 'provincias', 'distritos'}
+        Nivel cuyas equivalencias se usan como opciones.
+    n_jobs : int, optional
+        Número de procesos. None o 1 ejecuta en el proceso actual; -1 usa todos los CPUs.
+    executor : concurrent.futures.Executor, optional
+        Executor externo a reutilizar. Si se indica, tiene prioridad sobre `n_jobs`.
+    score_cutoff : float, default 80
+        Score mínimo (0-100) para aceptar una coincidencia.
+    scorer : str or callable, default "WRatio"
+        Scorer de rapidfuzz. Con procesos, una función debe poder serializarse
+        con pickle (las de `rapidfuzz.fuzz` o funciones de módulo, no lambdas).
+
+    Returns
+    -------
+    list[tuple[str, float] | None]
+        Para cada valor, la clave encontrada y su score, o None, en el mismo
+        orden de `items`.
+    """
+    workers = resolve_n_jobs(n_jobs)
+
+    if not items:
+        return []
+
+    if executor is None and (workers == 1 or len(items) < _MIN_ITEMS_PARALELO):
+        return _fuzzy_chunk(items, entity_type, score_cutoff, scorer)
+
+    if executor is not None:
+        n_chunks = getattr(executor, "_max_workers", workers) * _CHUNKS_POR_WORKER
+        chunks = _dividir(items, n_chunks)
+        resultados = executor.map(
+            _fuzzy_chunk,
+            chunks,
+            repeat(entity_type),
+            repeat(score_cutoff),
+            repeat(scorer),
+        )
+        return [match for chunk in resultados for match in chunk]
+
+    chunks = _dividir(items, workers * _CHUNKS_POR_WORKER)
+    with share_tables(levels=[entity_type], institutions=[]) as tablas:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(tablas.name,),
+        ) as pool:
+            resultados = pool.map(
+                _fuzzy_chunk,
+                chunks,
+                repeat(entity_type),
+                repeat(score_cutoff),
+                repeat(scorer),
+            )
+            return [match for chunk in resultados for match in chunk]
@@ -1,9 +1,79 @@
+from __future__ import annotations
+
+import re
 import unicodedata
 import warnings
-from functools import lru_cache
-from typing import Literal, Optional
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from . import instrumentation
+
+if TYPE_CHECKING:
+    import narwhals as nw
+
+# narwhals y rapidfuzz se importan recién cuando se necesitan (Series y fuzzy
+# matching), para que `import ubigeos_peru` y las consultas escalares sean livianas.
+
+
+def narwhalify_series(func: Callable) -> Callable:
+    """
+    Equivalente a `nw.narwhalify(series_only=True, eager_only=True)`, pero importa
+    narwhals en la primera llamada y no al definir la función.
+    """
+    wrapped = None
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal wrapped
+        if wrapped is None:
+            import narwhals as nw
+
+            wrapped = nw.narwhalify(func, series_only=True, eager_only=True)
+        return wrapped(*args, **kwargs)
+
+    return wrapper
+
+
+@instrumentation.medido("series")
+def codificar_diccionario(resultado: nw.Series, entrada: nw.Series) -> nw.Series:
+    """
+    Con series de PyArrow, devuelve `resultado` (nombres) como
+    `dictionary<int32, string>`: cada fila es un índice a un único diccionario de
+    nombres compartido por todos los chunks, y los chunks siguen a los de
+    `entrada`. Con otros backends devuelve `resultado` sin cambios.
+    """
+    if not resultado.implementation.is_pyarrow():
+        return resultado
+
+    import narwhals as nw
+    import pyarrow as pa
+    import pyarrow.compute as pc
 
-from rapidfuzz import fuzz, process, utils
+    nativo = resultado.to_native()
+    nombres = pc.unique(nativo).drop_null()
+    if nombres.type != pa.string():
+        nombres = nombres.cast(pa.string())
+
+    chunks = []
+    inicio = 0
+    for chunk in entrada.to_native().chunks:
+        # slice no copia; solo se calculan los índices del tramo
+        indices = pc.index_in(nativo.slice(inicio, len(chunk)), value_set=nombres)
+        chunks.append(pa.DictionaryArray.from_arrays(indices.combine_chunks(), nombres))
+        inicio += len(chunk)
+
+    codificado = pa.chunked_array(chunks, type=pa.dictionary(pa.int32(), pa.string()))
+    return nw.from_native(codificado, series_only=True)
 
 
 @lru_cache(maxsize=128)
@@ -15,6 +85,9 @@ def eliminar_acentos(texto: str) -> str:
     return texto_sin_acentos
 
 
+_ON_ERROR = ("raise", "warn", "ignore", "capitalize", "coerce")
+
+
 def assert_error(
     on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"],
     evaluated: str,
@@ -42,6 +115,9 @@ def assert_error(
     str or None
         Valor procesado según la estrategia
     """
+    if instrumentation.ACTIVO and on_error in _ON_ERROR:
+        instrumentation.contar(f"errores_{on_error}")
+
     if on_error == "raise":
         raise KeyError(message.format(evaluated, institucion))
     elif on_error == "warn":
@@ -59,11 +135,188 @@ def assert_error(
         )
 
 
-def fuzzy_validate(ubicacion: str, options: list[str], limit: int = 1):
-    result = process.extractOne(
-        ubicacion, options, scorer=fuzz.WRatio, processor=utils.default_process
+# Scorers de rapidfuzz.fuzz que se aceptan por nombre
+SCORERS = (
+    "WRatio",
+    "QRatio",
+    "ratio",
+    "partial_ratio",
+    "token_sort_ratio",
+    "token_set_ratio",
+    "token_ratio",
+    "partial_token_sort_ratio",
+    "partial_token_set_ratio",
+    "partial_token_ratio",
+)
+Scorer = Union[str, Callable[..., float]]
+
+
+def resolver_scorer(scorer: Scorer) -> Callable[..., float]:
+    """Función de rapidfuzz a partir de su nombre (ver `SCORERS`) o la función misma."""
+    if callable(scorer):
+        return scorer
+    if scorer not in SCORERS:
+        raise ValueError(
+            f"scorer debe ser una función de rapidfuzz o uno de: {', '.join(SCORERS)}"
+        )
+    from rapidfuzz import fuzz
+
+    return getattr(fuzz, scorer)
+
+
+def validar_score_cutoff(score_cutoff: float) -> float:
+    if isinstance(score_cutoff, bool) or not isinstance(score_cutoff, (int, float)):
+        raise TypeError("score_cutoff debe ser un número entre 0 y 100")
+    if not 0 <= score_cutoff <= 100:
+        raise ValueError("score_cutoff debe estar entre 0 y 100")
+    return score_cutoff
+
+
+class FuzzyIndex:
+    """
+    Opciones para fuzzy matching preprocesadas una sola vez, para no repetir
+    `utils.default_process` sobre todas las opciones en cada búsqueda.
+
+    El `score_cutoff` se pasa a rapidfuzz, que descarta una opción apenas sabe
+    que no puede alcanzarlo: un umbral alto acelera la búsqueda.
+    """
+
+    __slots__ = ("opciones", "procesadas")
+
+    def __init__(self, opciones: Iterable[str]):
+        from rapidfuzz import utils
+
+        self.opciones = tuple(opciones)
+        self.procesadas = tuple(utils.default_process(o) for o in self.opciones)
+
+    @classmethod
+    def desde_procesadas(
+        cls, opciones: Sequence[str], procesadas: Sequence[str]
+    ) -> FuzzyIndex:
+        """
+        Construye el índice a partir de opciones ya preprocesadas (por ejemplo,
+        leídas de memoria compartida), sin volver a aplicar `default_process`.
+        """
+        indice = cls.__new__(cls)
+        indice.opciones = opciones
+        indice.procesadas = procesadas
+        return indice
+
+    def __len__(self) -> int:
+        return len(self.opciones)
+
+    def buscar(
+        self, ubicacion: str, score_cutoff: float = 80, scorer: Scorer = "WRatio"
+    ) -> Optional[str]:
+        resultado = self.buscar_con_score(ubicacion, score_cutoff, scorer)
+        return None if resultado is None else resultado[0]
+
+    def buscar_con_score(
+        self, ubicacion: str, score_cutoff: float = 80, scorer: Scorer = "WRatio"
+    ) -> Optional[tuple[str, float]]:
+        """Como `buscar`, pero devuelve la opción junto con su score (0-100)."""
+        from rapidfuzz import process, utils
+
+        result = process.extractOne(
+            utils.default_process(ubicacion),
+            self.procesadas,
+            scorer=resolver_scorer(scorer),
+            processor=None,
+            score_cutoff=score_cutoff,
+        )
+        if result is None:
+            return None
+        return self.opciones[result[2]], result[1]
+
+    def candidatos(
+        self,
+        ubicacion: str,
+        limit: Optional[int] = 5,
+        score_cutoff: float = 80,
+        scorer: Scorer = "WRatio",
+    ) -> list[tuple[str, float]]:
+        """
+        Las `limit` opciones con mayor score (todas las que superan el umbral si
+        `limit` es None), ordenadas de mayor a menor.
+        """
+        from rapidfuzz import process, utils
+
+        resultados = process.extract(
+            utils.default_process(ubicacion),
+            self.procesadas,
+            scorer=resolver_scorer(scorer),
+            processor=None,
+            score_cutoff=score_cutoff,
+            limit=limit,
+        )
+        return [(self.opciones[i], score) for _, score, i in resultados]
+
+
+def fuzzy_validate(
+    ubicacion: str,
+    options: Iterable[str] | FuzzyIndex,
+    score_cutoff: float = 80,
+    scorer: Scorer = "WRatio",
+) -> Optional[str]:
+    if not isinstance(options, FuzzyIndex):
+        options = FuzzyIndex(options)
+    return options.buscar(ubicacion, score_cutoff, scorer)
+
+
+# Reglas de la clave fonética, en orden. Los reemplazos van en minúsculas para
+# que las reglas siguientes (que solo miran mayúsculas) no los vuelvan a tocar
+_REGLAS_FONETICAS = tuple(
+    (re.compile(patron), reemplazo)
+    for patron, reemplazo in (
+        (r"[^A-Z]", ""),  # espacios, guiones, dígitos
+        (r"CH", "c"),
+        (r"QU", "k"),  # QUICHUA ~ KICHWA
+        (r"GU(?=[EI])", "g"),  # GUE, GUI: la U no suena
+        (r"G(?=[EI])", "j"),  # GE ~ JE
+        (r"GU(?=[AO])", "u"),  # GUA ~ HUA ~ WA
+        (r"C(?=[EI])", "s"),
+        (r"[CKQ]", "k"),
+        (r"Z", "s"),
+        (r"LL|Y", "i"),  # yeísmo: LL ~ Y ~ I
+        (r"V", "b"),
+        (r"W", "u"),
+        (r"H", ""),  # H muda (HUA -> UA)
     )
-    if result[1] >= 80:
-        return result[0]
-    else:
-        return None
+)
+_REPETIDAS = re.compile(r"(.)\1+")
+
+
+def clave_fonetica(texto: str) -> str:
+    """
+    Clave fonética (estilo metaphone, adaptada al castellano y a la escritura de
+    topónimos quechuas) de un texto en mayúsculas y sin acentos.
+
+    Iguala las grafías que suenan igual: Y/LL/I, Z/S/C(E,I), V/B, C/K/QU, G(E,I)/J,
+    HUA/GUA/WA y la H muda; además ignora espacios, guiones y letras repetidas.
+    Por ejemplo, "NAZCA" y "NASCA" dan "naska"; "TOMAY KICHWA" y "TOMAY QUICHUA",
+    "tomaikicua".
+    """
+    for patron, reemplazo in _REGLAS_FONETICAS:
+        texto = patron.sub(reemplazo, texto)
+    return _REPETIDAS.sub(r"\1", texto.lower())
+
+
+def indice_fonetico(mapping: Mapping[str, str]) -> Mapping[str, str]:
+    """
+    Índice clave fonética -> clave de `mapping` (equivalencias), para resolver en
+    O(1) las variantes ortográficas antes de recurrir al fuzzy matching.
+
+    Las claves fonéticas que apuntan a nombres oficiales distintos son ambiguas y
+    se descartan: esos casos quedan para el fuzzy matching.
+    """
+    indice: dict[str, str] = {}
+    ambiguas: set[str] = set()
+    for clave, nombre in mapping.items():
+        fonetica = clave_fonetica(clave)
+        if not fonetica or fonetica in ambiguas:
+            continue
+        previa = indice.setdefault(fonetica, clave)
+        if mapping[previa] != nombre:
+            del indice[fonetica]
+            ambiguas.add(fonetica)
+    return MappingProxyType(indice)
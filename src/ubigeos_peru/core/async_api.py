@@ -0,0 +1,251 @@
+"""
+Fachada asyncio con micro-batching, para servicios que reciben muchas consultas
+escalares concurrentes (ej. un endpoint de FastAPI que valida un nombre por
+request).
+
+Las consultas que llegan dentro de una ventana corta (`max_delay`) o hasta
+juntar `max_batch` valores se agrupan por función y argumentos, y se resuelven
+juntas en un worker: un solo salto al executor por lote y una sola resolución
+por valor distinto del lote. El event loop queda libre mientras tanto.
+
+Como pandas y Polars son opcionales, el lote no se arma como una Series: el
+worker aplica la ruta escalar a cada valor distinto. Así cada valor conserva la
+semántica de la API síncrona, incluida su propia excepción con
+``on_error="raise"``, sin afectar al resto del lote.
+
+asyncio se importa dentro de los métodos (ya está cargado si hay un event loop
+corriendo), para no sumarlo al costo de importar `ubigeos_peru.core`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from . import instrumentation
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+
+
+def _resolver_lote(
+    funcion: str, kwargs: dict[str, Any], valores: list[str | int]
+) -> list[tuple[bool, Any]]:
+    """
+    Resuelve un lote en el worker. Devuelve, por valor, (True, resultado) o
+    (False, excepción). Es una función de módulo para poder usarse también con
+    un `ProcessPoolExecutor`.
+    """
+    from .. import core
+
+    func = getattr(core, funcion)
+    # La clave incluye el tipo para no mezclar 150101 con "150101"
+    resueltos: dict[tuple[type, str | int], tuple[bool, Any]] = {}
+    salida = []
+    for valor in valores:
+        clave = (type(valor), valor)
+        resultado = resueltos.get(clave)
+        if resultado is None:
+            try:
+                resultado = (True, func(valor, **kwargs))
+            except Exception as e:
+                resultado = (False, e)
+            resueltos[clave] = resultado
+        salida.append(resultado)
+    return salida
+
+
+class _Lote:
+    __slots__ = ("valores", "futuros", "temporizador")
+
+    def __init__(self) -> None:
+        self.valores: list[str | int] = []
+        self.futuros: list[asyncio.Future] = []
+        self.temporizador: Optional[asyncio.TimerHandle] = None
+
+
+class AsyncUbigeo:
+    """
+    Versión asíncrona de las funciones escalares, con micro-batching.
+
+    Parameters
+    ----------
+    max_delay : float, default 0.002
+        Segundos que espera el primer valor de un lote antes de despacharlo.
+    max_batch : int, default 256
+        Cantidad de valores con la que un lote se despacha sin esperar.
+    executor : concurrent.futures.Executor, optional
+        Executor donde se resuelven los lotes. Por defecto, el executor por
+        defecto del event loop (un pool de hilos).
+
+    Notes
+    -----
+    Una instancia queda ligada al event loop donde se usa por primera vez.
+    Solo acepta valores escalares (str o int); para Series se usa la API
+    síncrona, que ya es vectorizada.
+
+    Examples
+    --------
+    >>> aubg = ubg.AsyncUbigeo()
+    >>>
+    >>> @app.get("/distrito/{nombre}")
+    ... async def distrito(nombre: str):
+    ...     return await aubg.validate_distrito(nombre, fuzzy_match=True)
+    >>>
+    >>> await asyncio.gather(*(aubg.get_distrito(c) for c in ["150101", "080101"]))
+    ['Lima', 'Cusco']
+    """
+
+    def __init__(
+        self,
+        max_delay: float = 0.002,
+        max_batch: int = 256,
+        executor: Optional[Executor] = None,
+    ):
+        if max_delay < 0:
+            raise ValueError("max_delay debe ser >= 0")
+        if (
+            isinstance(max_batch, bool)
+            or not isinstance(max_batch, int)
+            or max_batch < 1
+        ):
+            raise ValueError("max_batch debe ser un entero >= 1")
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._executor = executor
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pendientes: dict[tuple, _Lote] = {}
+        self._tareas: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> AsyncUbigeo:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    async def get_departamento(self, codigo: str | int, **kwargs: Any) -> str:
+        """Como `get_departamento`, resuelto en lote."""
+        return await self._enviar("get_departamento", codigo, kwargs)
+
+    async def get_provincia(self, codigo: str | int, **kwargs: Any) -> str:
+        """Como `get_provincia`, resuelto en lote."""
+        return await self._enviar("get_provincia", codigo, kwargs)
+
+    async def get_distrito(self, codigo: str | int, **kwargs: Any) -> str:
+        """Como `get_distrito`, resuelto en lote."""
+        return await self._enviar("get_distrito", codigo, kwargs)
+
+    async def get_macrorregion(self, departamento: str | int, **kwargs: Any) -> str:
+        """Como `get_macrorregion`, resuelto en lote."""
+        return await self._enviar("get_macrorregion", departamento, kwargs)
+
+    async def get_ubigeo(self, ubicacion: str, **kwargs: Any) -> str:
+        """Como `get_ubigeo`, resuelto en lote."""
+        return await self._enviar("get_ubigeo", ubicacion, kwargs)
+
+    async def validate_departamento(self, departamento: str, **kwargs: Any) -> str:
+        """Como `validate_departamento`, resuelto en lote."""
+        return await self._enviar("validate_departamento", departamento, kwargs)
+
+    async def validate_provincia(self, provincia: str, **kwargs: Any) -> str:
+        """Como `validate_provincia`, resuelto en lote."""
+        return await self._enviar("validate_provincia", provincia, kwargs)
+
+    async def validate_distrito(self, distrito: str, **kwargs: Any) -> str:
+        """Como `validate_distrito`, resuelto en lote."""
+        return await self._enviar("validate_distrito", distrito, kwargs)
+
+    async def flush(self) -> None:
+        """Despacha los lotes pendientes sin esperar `max_delay` y espera a que terminen."""
+        import asyncio
+
+        for clave in list(self._pendientes):
+            self._despachar(clave)
+        if self._tareas:
+            await asyncio.gather(*self._tareas, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Resuelve lo pendiente. La instancia puede seguir usándose después."""
+        await self.flush()
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    async def _enviar(self, funcion: str, valor: str | int, kwargs: dict) -> Any:
+        import asyncio
+
+        if not isinstance(valor, (str, int)):
+            raise TypeError(
+                f"AsyncUbigeo solo acepta valores escalares (str o int), se insertó {type(valor)}. "
+                "Para Series usa la API síncrona"
+            )
+
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError(
+                "Esta instancia de AsyncUbigeo se usa desde otro event loop; crea una por loop"
+            )
+
+        # Solo se agrupan llamadas con la misma función y los mismos argumentos
+        clave = (funcion, tuple(sorted(kwargs.items())))
+        lote = self._pendientes.get(clave)
+        if lote is None:
+            lote = self._pendientes[clave] = _Lote()
+            lote.temporizador = loop.call_later(self.max_delay, self._despachar, clave)
+
+        futuro = loop.create_future()
+        lote.valores.append(valor)
+        lote.futuros.append(futuro)
+        if len(lote.valores) >= self.max_batch:
+            self._despachar(clave)
+
+        return await futuro
+
+    def _despachar(self, clave: tuple) -> None:
+        lote = self._pendientes.pop(clave, None)
+        if lote is None:
+            return
+        if lote.temporizador is not None:
+            lote.temporizador.cancel()
+
+        tarea = self._loop.create_task(self._resolver(clave, lote))
+        # El loop solo guarda referencias débiles a las tareas
+        self._tareas.add(tarea)
+        tarea.add_done_callback(self._tareas.discard)
+
+    async def _resolver(self, clave: tuple, lote: _Lote) -> None:
+        import asyncio
+
+        funcion, kwargs = clave
+        if instrumentation.ACTIVO:
+            instrumentation.contar("lotes_async")
+        try:
+            resultados = await self._loop.run_in_executor(
+                self._executor, _resolver_lote, funcion, dict(kwargs), lote.valores
+            )
+        except asyncio.CancelledError:
+            for futuro in lote.futuros:
+                futuro.cancel()
+            raise
+        except Exception as e:
+            # Falla del executor (ej. ya cerrado): se propaga a todo el lote
+            for futuro in lote.futuros:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+
+        for futuro, (ok, valor) in zip(lote.futuros, resultados):
+            # Quien esperaba pudo haber cancelado su consulta
+            if futuro.done():
+                continue
+            if ok:
+                futuro.set_result(valor)
+            else:
+                futuro.set_exception(valor)
@@ -0,0 +1,137 @@
+"""
+Autocompletado de nombres oficiales (departamentos, provincias y distritos).
+
+El índice es un arreglo ordenado de nombres normalizados (equivalencias y nombres
+oficiales, en mayúsculas y sin tildes); cada prefijo corresponde a un rango
+contiguo del arreglo, que se ubica con dos búsquedas binarias.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Literal
+
+from ._utils import eliminar_acentos
+from .resource_manager import ResourceManager
+from .ubigeo_converter import UbigeoConverter
+
+# Mayor que cualquier carácter: cierra el rango de claves que empiezan con un prefijo
+_FIN = "\U0010ffff"
+_ESPACIOS = re.compile(r"\s+")
+
+
+def _normalizar(texto: str) -> str:
+    # Se conserva un espacio final: "SAN " no debe sugerir "SANTA ..."
+    return _ESPACIOS.sub(" ", eliminar_acentos(texto).upper()).lstrip()
+
+
+class PrefixIndex:
+    """
+    Claves normalizadas ordenadas y, en paralelo, los códigos a los que apunta
+    cada una.
+    """
+
+    __slots__ = ("claves", "codigos")
+
+    def __init__(self, entradas: dict[str, list[str]]):
+        ordenadas = sorted(entradas.items())
+        self.claves = [clave for clave, _ in ordenadas]
+        self.codigos = [tuple(codigos) for _, codigos in ordenadas]
+
+    def buscar(self, prefijo: str) -> list[str]:
+        """Códigos de las claves que empiezan con `prefijo` (ya normalizado), sin repetir."""
+        inicio = bisect_left(self.claves, prefijo)
+        fin = bisect_left(self.claves, prefijo + _FIN, inicio)
+        # dict.fromkeys deduplica conservando el orden alfabético de las claves
+        return list(
+            dict.fromkeys(c for codigos in self.codigos[inicio:fin] for c in codigos)
+        )
+
+
+def _construir_indice(level: str, institucion: str) -> PrefixIndex:
+    oficiales = ResourceManager.cargar_diccionario(level, institucion)
+
+    codigos_por_nombre: dict[str, list[str]] = {}
+    for codigo, nombre in oficiales.items():
+        codigos_por_nombre.setdefault(nombre, []).append(codigo)
+
+    entradas: dict[str, list[str]] = {}
+    for codigo, nombre in oficiales.items():
+        entradas.setdefault(_normalizar(nombre), []).append(codigo)
+    # Los alias (ej. "CUZCO") apuntan a todos los códigos de su nombre oficial
+    for alias, nombre in ResourceManager.cargar_diccionario(
+        "equivalencias", level
+    ).items():
+        codigos = codigos_por_nombre.get(nombre)
+        if codigos:
+            destino = entradas.setdefault(alias, [])
+            destino.extend(c for c in codigos if c not in destino)
+
+    return PrefixIndex(entradas)
+
+
+def autocomplete(
+    prefix: str,
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+    limit: int = 10,
+    by_population: bool = False,
+) -> list[dict[str, str]]:
+    """
+    Sugiere nombres oficiales que empiezan con un prefijo, con su ubigeo.
+
+    La búsqueda no distingue mayúsculas ni tildes e incluye los nombres
+    alternativos conocidos (ej. "Cuzco" para Cusco). El índice se construye una
+    sola vez por nivel e institución; cada consulta son dos búsquedas binarias.
+
+    Parameters
+    ----------
+    prefix : str
+        Texto ingresado por el usuario.
+    level : {"departamentos", "provincias", "distritos"}, default "distritos"
+        Nivel en el que se busca.
+    institucion : {"inei", "reniec", "sunat"}, default "inei"
+        Institución de la que se toman los nombres y códigos.
+    limit : int, default 10
+        Número máximo de sugerencias.
+    by_population : bool, default False
+        Si es True, ordena las sugerencias por población (de mayor a menor) en
+        lugar de alfabéticamente. La población se toma del ubigeo INEI, por lo
+        que los códigos de otras instituciones que no coincidan quedan al final.
+
+    Returns
+    -------
+    list[dict[str, str]]
+        Sugerencias con las claves "nombre" y "ubigeo". Un mismo nombre puede
+        aparecer varias veces si corresponde a distintos ubigeos.
+
+    Examples
+    --------
+    >>> import ubigeos_peru as ubg
+    >>> ubg.autocomplete("cuz", level="departamentos")
+    [{'nombre': 'Cusco', 'ubigeo': '08'}]
+    >>> [s["nombre"] for s in ubg.autocomplete("san juan", limit=3, by_population=True)]
+    ['San Juan de Lurigancho', 'San Juan de Miraflores', 'San Juan Bautista']
+    """
+    level = UbigeoConverter._validate_level(level)
+    if not isinstance(prefix, str):
+        raise TypeError(f"El prefijo debe ser str, no {type(prefix).__name__}")
+    prefijo = _normalizar(prefix)
+    if not prefijo or limit <= 0:
+        return []
+
+    indice = ResourceManager.cargar_derivado(
+        (level, institucion, "autocomplete"),
+        lambda: _construir_indice(level, institucion),
+    )
+    codigos = indice.buscar(prefijo)
+
+    if by_population:
+        poblacion = ResourceManager.cargar_diccionario("poblacion", level)
+        codigos.sort(key=lambda codigo: -poblacion.get(codigo, 0))
+
+    oficiales = ResourceManager.cargar_diccionario(level, institucion)
+    return [
+        {"nombre": oficiales[codigo], "ubigeo": codigo} for codigo in codigos[:limit]
+    ]
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
+
+from .resource_manager import ResourceManager
+from .ubigeo_converter import UbigeoConverter
+from .validations import Validations
+
+if TYPE_CHECKING:
+    import duckdb
+    import pyarrow as pa
+
+# Separador usado para combinar (nombre, nivel) en una sola clave de diccionario
+_SEP = "\x1f"
+
+
+def _importar_dependencias():
+    try:
+        import duckdb  # noqa: F401
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError as e:
+        raise ImportError(
+            "register_duckdb requiere 'duckdb' y 'pyarrow'. "
+            "Instálalos con: pip install ubigeos-peru[duckdb]"
+        ) from e
+    return pa, pc
+
+
+def _mapear_unicos(
+    array: pa.ChunkedArray | pa.Array,
+    traductor: Callable[[Any], Optional[str]],
+) -> pa.Array:
+    """
+    Aplica `traductor` solo sobre los valores distintos del array y reconstruye el
+    resultado con un `take`, de modo que el costo en Python sea proporcional a la
+    cantidad de valores únicos y no al número de filas. Los nulos se propagan.
+    """
+    pa, pc = _importar_dependencias()
+
+    encoded = pc.dictionary_encode(array)
+    if isinstance(encoded, pa.ChunkedArray):
+        encoded = encoded.combine_chunks()
+
+    traducidos = pa.array(
+        [traductor(valor) for valor in encoded.dictionary.to_pylist()],
+        type=pa.string(),
+    )
+    return pc.take(traducidos, encoded.indices)
+
+
+def _seguro(func: Callable[..., str], *args, **kwargs) -> Optional[str]:
+    # En SQL los códigos inválidos o inexistentes se devuelven como NULL
+    try:
+        return func(*args, **kwargs)
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+# ------------------------------------------------------------------
+# UDFs
+# ------------------------------------------------------------------
+
+
+def _udf_departamento(institucion: str, normalize: bool):
+    def udf(codigos):
+        return _mapear_unicos(
+            codigos,
+            lambda codigo: _seguro(
+                UbigeoConverter.get_departamento,
+                codigo,
+                institucion=institucion,
+                normalize=normalize,
+            ),
+        )
+
+    return udf
+
+
+def _udf_provincia(institucion: str, normalize: bool):
+    def udf(codigos):
+        return _mapear_unicos(
+            codigos,
+            lambda codigo: _seguro(
+                UbigeoConverter.get_provincia,
+                codigo,
+                institucion=institucion,
+                normalize=normalize,
+            ),
+        )
+
+    return udf
+
+
+def _udf_distrito(institucion: str, normalize: bool):
+    def udf(codigos):
+        return _mapear_unicos(
+            codigos,
+            lambda codigo: _seguro(
+                UbigeoConverter.get_distrito,
+                codigo,
+                institucion=institucion,
+                normalize=normalize,
+            ),
+        )
+
+    return udf
+
+
+def _udf_validate(institucion: str, normalize: bool, fuzzy_match: bool):
+    def validar(clave: str) -> Optional[str]:
+        nombre, level = clave.split(_SEP, 1)
+        try:
+            level = UbigeoConverter._validate_level(level.lower())
+        except ValueError:
+            return None
+        return _seguro(
+            Validations._validate_generic,
+            nombre,
+            entity_type=level,
+            institucion=institucion,
+            normalize=normalize,
+            fuzzy_match=fuzzy_match,
+            on_error="coerce",
+        )
+
+    def udf(nombres, levels):
+        _, pc = _importar_dependencias()
+        claves = pc.binary_join_element_wise(nombres, levels, _SEP)
+        return _mapear_unicos(claves, validar)
+
+    return udf
+
+
+# ------------------------------------------------------------------
+# TABLAS DE REFERENCIA
+# ------------------------------------------------------------------
+
+
+def _tablas_referencia() -> dict[str, pa.Table]:
+    pa, _ = _importar_dependencias()
+
+    departamentos = ResourceManager.cargar_diccionario("departamentos")
+    provincias = ResourceManager.cargar_diccionario("provincias")
+    distritos = ResourceManager.cargar_diccionario("distritos")
+    equivalencias = ResourceManager.cargar_diccionario("equivalencias")
+
+    def filas_nivel(recurso: dict[str, dict[str, str]], largo: int) -> dict[str, list]:
+        columnas: dict[str, list] = {
+            "institucion": [],
+            "ubigeo": [],
+            "nombre": [],
+            "departamento": [],
+            "provincia": [],
+        }
+        for institucion, mapping in recurso.items():
+            deps = departamentos.get(institucion, {})
+            provs = provincias.get(institucion, {})
+            for codigo, nombre in mapping.items():
+                columnas["institucion"].append(institucion)
+                columnas["ubigeo"].append(codigo)
+                columnas["nombre"].append(nombre)
+                columnas["departamento"].append(deps.get(codigo[:2]))
+                columnas["provincia"].append(
+                    provs.get(codigo[:4]) if largo > 2 else None
+                )
+        return columnas
+
+    dep = filas_nivel(departamentos, 2)
+    prov = filas_nivel(provincias, 4)
+    dist = filas_nivel(distritos, 6)
+
+    equiv: dict[str, list] = {"level": [], "alias": [], "nombre": []}
+    for level, mapping in equivalencias.items():
+        for alias, nombre in mapping.items():
+            equiv["level"].append(level)
+            equiv["alias"].append(alias)
+            equiv["nombre"].append(nombre)
+
+    return {
+        "departamentos": pa.table(
+            {
+                "institucion": dep["institucion"],
+                "ubigeo": dep["ubigeo"],
+                "departamento": dep["nombre"],
+            }
+        ),
+        "provincias": pa.table(
+            {
+                "institucion": prov["institucion"],
+                "ubigeo": prov["ubigeo"],
+                "provincia": prov["nombre"],
+                "departamento": prov["departamento"],
+            }
+        ),
+        "distritos": pa.table(
+            {
+                "institucion": dist["institucion"],
+                "ubigeo": dist["ubigeo"],
+                "distrito": dist["nombre"],
+                "provincia": dist["provincia"],
+                "departamento": dist["departamento"],
+            }
+        ),
+        "equivalencias": pa.table(equiv),
+    }
+
+
+# ------------------------------------------------------------------
+# REGISTER DUCKDB
+# ------------------------------------------------------------------
+
+
+def register_duckdb(
+    con: duckdb.DuckDBPyConnection,
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+    normalize: bool = False,
+    fuzzy_match: bool = True,
+    prefix: str = "ubigeo",
+    tables: bool = True,
+) -> duckdb.DuckDBPyConnection:
+    """
+    Registra funciones (UDFs vectorizadas sobre Arrow) y tablas de referencia de
+    ubigeos en una conexión de DuckDB.
+
+    Funciones registradas (con el prefijo por defecto):
+
+    - ``ubigeo_departamento(codigo VARCHAR) -> VARCHAR``
+    - ``ubigeo_provincia(codigo VARCHAR) -> VARCHAR``
+    - ``ubigeo_distrito(codigo VARCHAR) -> VARCHAR``
+    - ``ubigeo_validate(nombre VARCHAR, level VARCHAR) -> VARCHAR``
+
+    Tablas de referencia (vistas en memoria sobre tablas de Arrow):
+
+    - ``ubigeo_departamentos(institucion, ubigeo, departamento)``
+    - ``ubigeo_provincias(institucion, ubigeo, provincia, departamento)``
+    - ``ubigeo_distritos(institucion, ubigeo, distrito, provincia, departamento)``
+    - ``ubigeo_equivalencias(level, alias, nombre)``
+
+    Parameters
+    ----------
+    con : duckdb.DuckDBPyConnection
+        Conexión de DuckDB donde se registrarán las funciones y tablas.
+    institucion : {"inei", "reniec", "sunat"}, default "inei"
+        Institución usada por las UDFs.
+    normalize : bool, default False
+        Si es True, las UDFs retornan los nombres en mayúsculas y sin acentos.
+    fuzzy_match : bool, default True
+        Si es True, ``ubigeo_validate`` intenta una búsqueda difusa.
+    prefix : str, default "ubigeo"
+        Prefijo para los nombres de funciones y tablas.
+    tables : bool, default True
+        Si es True, registra también las tablas de referencia.
+
+    Returns
+    -------
+    duckdb.DuckDBPyConnection
+        La misma conexión, para encadenar llamadas.
+
+    Notes
+    -----
+    - Las UDFs procesan cada lote de DuckDB trabajando solo sobre sus valores
+      distintos, por lo que el costo es proporcional a la cardinalidad.
+    - Los códigos o nombres que no se encuentran se devuelven como NULL.
+    - Para columnas numéricas, castear a VARCHAR: ``ubigeo_distrito(CAST(ubigeo AS VARCHAR))``.
+
+    Examples
+    --------
+    >>> import duckdb
+    >>> import ubigeos_peru as ubg
+    >>> con = ubg.register_duckdb(duckdb.connect())
+    >>> con.sql("SELECT ubigeo_distrito('150101')").fetchone()
+    ('Lima',)
+    >>> con.sql("SELECT ubigeo_validate('CUZCO', 'departamento')").fetchone()
+    ('Cusco',)
+    """
+    _importar_dependencias()
+
+    funciones = {
+        "departamento": (_udf_departamento(institucion, normalize), ["VARCHAR"]),
+        "provincia": (_udf_provincia(institucion, normalize), ["VARCHAR"]),
+        "distrito": (_udf_distrito(institucion, normalize), ["VARCHAR"]),
+        "validate": (
+            _udf_validate(institucion, normalize, fuzzy_match),
+            ["VARCHAR", "VARCHAR"],
+        ),
+    }
+
+    for nombre, (udf, parametros) in funciones.items():
+        nombre_sql = f"{prefix}_{nombre}"
+        try:
+            con.remove_function(nombre_sql)
+        except Exception:
+            pass
+        con.create_function(
+            nombre_sql,
+            udf,
+            parametros,
+            "VARCHAR",
+            type="arrow",
+            null_handling="special",
+        )
+
+    if tables:
+        for nombre, tabla in _tablas_referencia().items():
+            con.register(f"{prefix}_{nombre}", tabla)
+
+    return con
@@ -0,0 +1,251 @@
+"""
+Extracción de ubigeos desde texto libre (direcciones, descripciones, etc.).
+
+Los nombres oficiales de departamentos, provincias y distritos, junto con sus
+nombres alternativos (`equivalencias`), se compilan en un autómata de
+Aho–Corasick. El autómata trabaja sobre palabras y no sobre caracteres: el texto
+normalizado se parte en palabras y cada una es una transición, de modo que todas
+las menciones se encuentran en una sola pasada y siempre calzan con palabras
+completas ("ATE" no aparece dentro de "ATENCION").
+
+Cada mención apunta a todos los ubigeos con ese nombre, en cualquier nivel. La
+ambigüedad se resuelve por consistencia jerárquica: se elige el ubigeo que es
+compatible (ancestro o descendiente) con más menciones del texto, y los empates
+se rompen por población.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Literal, Optional
+
+from ._utils import eliminar_acentos
+from .resource_manager import ResourceManager
+from .ubigeo_converter import UbigeoConverter
+
+if TYPE_CHECKING:
+    from narwhals.typing import IntoSeriesT
+
+_NIVELES = ("departamentos", "provincias", "distritos")
+_LARGO = {"departamentos": 2, "provincias": 4, "distritos": 6}
+_SEPARADORES = re.compile(r"[^A-Z0-9]+")
+
+
+def _palabras(texto: str) -> list[str]:
+    return _SEPARADORES.sub(" ", eliminar_acentos(texto).upper()).split()
+
+
+class AhoCorasick:
+    """
+    Autómata de Aho–Corasick sobre secuencias de palabras.
+
+    Cada estado guarda sus transiciones (palabra -> estado), su enlace de fallo
+    y los patrones que terminan en él, incluidos los heredados por los enlaces
+    de fallo, para no recorrerlos durante la búsqueda.
+    """
+
+    __slots__ = ("transiciones", "fallos", "salidas", "largos", "valores")
+
+    def __init__(self, patrones: dict[tuple[str, ...], frozenset[str]]):
+        self.transiciones: list[dict[str, int]] = [{}]
+        salidas: list[list[int]] = [[]]
+        self.largos: list[int] = []
+        self.valores: list[frozenset[str]] = []
+
+        for patron, valor in patrones.items():
+            estado = 0
+            for palabra in patron:
+                siguiente = self.transiciones[estado].get(palabra)
+                if siguiente is None:
+                    siguiente = len(self.transiciones)
+                    self.transiciones[estado][palabra] = siguiente
+                    self.transiciones.append({})
+                    salidas.append([])
+                estado = siguiente
+            salidas[estado].append(len(self.valores))
+            self.largos.append(len(patron))
+            self.valores.append(valor)
+
+        # Enlaces de fallo en orden BFS: el de un estado depende de los de menor
+        # profundidad
+        self.fallos = [0] * len(self.transiciones)
+        cola = deque(self.transiciones[0].values())
+        while cola:
+            estado = cola.popleft()
+            for palabra, siguiente in self.transiciones[estado].items():
+                fallo = self.fallos[estado]
+                while fallo and palabra not in self.transiciones[fallo]:
+                    fallo = self.fallos[fallo]
+                destino = self.transiciones[fallo].get(palabra, 0)
+                self.fallos[siguiente] = destino if destino != siguiente else 0
+                salidas[siguiente] += salidas[self.fallos[siguiente]]
+                cola.append(siguiente)
+
+        self.salidas = [tuple(s) for s in salidas]
+
+    def buscar(self, palabras: list[str]) -> list[tuple[int, int, int]]:
+        """Menciones como (inicio, fin, patrón), con inicio y fin en palabras."""
+        transiciones, fallos, salidas, largos = (
+            self.transiciones,
+            self.fallos,
+            self.salidas,
+            self.largos,
+        )
+        menciones = []
+        estado = 0
+        for fin, palabra in enumerate(palabras, 1):
+            while estado and palabra not in transiciones[estado]:
+                estado = fallos[estado]
+            estado = transiciones[estado].get(palabra, 0)
+            for patron in salidas[estado]:
+                menciones.append((fin - largos[patron], fin, patron))
+        return menciones
+
+
+def _construir_automata(institucion: str) -> AhoCorasick:
+    patrones: dict[tuple[str, ...], set[str]] = {}
+    for level in _NIVELES:
+        codigos_por_nombre: dict[str, list[str]] = {}
+        for codigo, nombre in ResourceManager.cargar_diccionario(
+            level, institucion
+        ).items():
+            codigos_por_nombre.setdefault(nombre, []).append(codigo)
+            patrones.setdefault(tuple(_palabras(nombre)), set()).add(codigo)
+        for alias, nombre in ResourceManager.cargar_diccionario(
+            "equivalencias", level
+        ).items():
+            for codigo in codigos_por_nombre.get(nombre, ()):
+                patrones.setdefault(tuple(_palabras(alias)), set()).add(codigo)
+
+    patrones.pop((), None)
+    return AhoCorasick({p: frozenset(c) for p, c in patrones.items()})
+
+
+def _resolver(
+    automata: AhoCorasick, texto: str, largo: int, poblacion: dict[str, int]
+) -> Optional[str]:
+    menciones = automata.buscar(_palabras(texto))
+    if not menciones:
+        return None
+
+    # Una mención contenida en otra más larga no cuenta ("SURCO" dentro de
+    # "SANTIAGO DE SURCO")
+    menciones = [
+        (inicio, fin, patron)
+        for inicio, fin, patron in menciones
+        if not any(
+            i <= inicio and fin <= f and (i, f) != (inicio, fin)
+            for i, f, _ in menciones
+        )
+    ]
+    valores = [(fin, automata.valores[patron]) for _, fin, patron in menciones]
+
+    candidatos = {codigo[:largo] for _, codigos in valores for codigo in codigos}
+    candidatos = {codigo for codigo in candidatos if len(codigo) == largo}
+    if not candidatos:
+        return None
+
+    def puntaje(candidato: str) -> tuple[int, int, int, str]:
+        fines = [
+            fin
+            for fin, codigos in valores
+            if any(
+                candidato.startswith(codigo) or codigo.startswith(candidato)
+                for codigo in codigos
+            )
+        ]
+        # Mayor consistencia; a igualdad, la mención más a la derecha (en una
+        # dirección la localidad va después de la calle: "JR. PUNO 456, CUSCO"),
+        # luego la mayor población. El código solo vuelve determinista el orden
+        return len(fines), max(fines), poblacion.get(candidato, 0), candidato
+
+    return max(candidatos, key=puntaje)
+
+
+def extract_ubigeo(
+    texts: str | Iterable[str] | IntoSeriesT,
+    level: Literal["departamentos", "provincias", "distritos"] = "distritos",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+) -> Optional[str] | list[Optional[str]] | IntoSeriesT:
+    """
+    Extrae el ubigeo mencionado en un texto libre, como una dirección.
+
+    Encuentra todas las menciones de departamentos, provincias y distritos
+    (incluidos nombres alternativos) en una sola pasada por texto, y elige el
+    ubigeo más consistente con la jerarquía: en "AV. LOS INCAS 123, SANTIAGO DE
+    SURCO, LIMA", el distrito Santiago de Surco es compatible con la mención de
+    Lima, mientras que el distrito de Lima no lo es con la de Santiago de Surco.
+
+    Parameters
+    ----------
+    texts : str, list of str or Series
+        Texto o textos de los que se extrae el ubigeo. Las Series (pandas,
+        Polars, PyArrow, etc.) se procesan una vez por valor único.
+    level : {"departamentos", "provincias", "distritos"}, default "distritos"
+        Nivel del ubigeo a devolver. Una mención de un nivel inferior también
+        determina el de los niveles superiores (un distrito implica su provincia
+        y su departamento).
+    institucion : {"inei", "reniec", "sunat"}, default "inei"
+        Institución de la que se toman los nombres y códigos.
+
+    Returns
+    -------
+    str, list of str or Series
+        Ubigeo encontrado, o None si el texto no menciona ninguna ubicación del
+        nivel pedido. Para una Series devuelve una Series del mismo backend.
+
+    Notes
+    -----
+    - Las menciones se reconocen por palabras completas, sin distinguir
+      mayúsculas ni tildes. No se corrigen errores de tipeo: para eso están las
+      funciones ``validate_*``.
+    - Los empates (ej. un "San Isidro" sin más contexto) se resuelven a favor
+      de la mención que aparece más a la derecha (en una dirección, la
+      localidad suele ir después de la calle) y luego del ubigeo más poblado.
+
+    Examples
+    --------
+    >>> import ubigeos_peru as ubg
+    >>> ubg.extract_ubigeo("AV. LOS INCAS 123, SANTIAGO DE SURCO, LIMA")
+    '150140'
+    >>> ubg.extract_ubigeo("Jr. Puno 456, Wanchaq, Cusco")
+    '080108'
+    >>> ubg.extract_ubigeo(["Jr. Puno 456, Cusco", None], level="provincias")
+    ['0801', None]
+    """
+    level = UbigeoConverter._validate_level(level)
+    # Usa los tres niveles, pero se asocia a la parte de distritos, que es la
+    # que domina su tamaño (y la que `unload("distritos")` debe liberar)
+    automata = ResourceManager.cargar_derivado(
+        ("distritos", institucion, "extraccion"),
+        lambda: _construir_automata(institucion),
+    )
+    poblacion = ResourceManager.cargar_diccionario("poblacion", level)
+    largo = _LARGO[level]
+
+    if isinstance(texts, str):
+        return _resolver(automata, texts, largo, poblacion)
+
+    import narwhals as nw
+
+    serie = nw.from_native(texts, series_only=True, eager_only=True, pass_through=True)
+    # Los textos repetidos (muy comunes en registros administrativos) se
+    # resuelven una sola vez
+    if not isinstance(serie, nw.Series):
+        # Se recorre dos veces: un generador se agotaría en la primera
+        texts = list(texts)
+        resultados: dict[str, Optional[str]] = {}
+        for texto in texts:
+            if texto is not None and texto not in resultados:
+                resultados[texto] = _resolver(automata, texto, largo, poblacion)
+        return [None if texto is None else resultados[texto] for texto in texts]
+
+    unicos = serie.drop_nulls().unique().to_list()
+    if not unicos:
+        # Series vacía o solo con nulos (replace_strict no acepta un mapeo vacío)
+        return serie.cast(nw.String()).to_native()
+    extraidos = [_resolver(automata, str(texto), largo, poblacion) for texto in unicos]
+    return serie.replace_strict(
+        unicos, extraidos, default=None, return_dtype=nw.String()
+    ).to_native()
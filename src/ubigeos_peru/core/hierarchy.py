@@ -0,0 +1,175 @@
+"""
+Navegación de la jerarquía departamento -> provincia -> distrito.
+
+Para cada nivel e institución se guardan los códigos ordenados (y sus nombres en
+el mismo orden) junto con el rango ``[inicio, fin)`` que ocupa cada código padre.
+Como el ubigeo de un hijo empieza con el de su padre, los hijos de un padre son
+siempre un bloque contiguo del arreglo ordenado, y cada consulta es un slice.
+"""
+
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+from .resource_manager import ResourceManager
+from .ubigeo_converter import UbigeoConverter
+
+_LARGO = {"departamentos": 2, "provincias": 4, "distritos": 6}
+_NIVEL_POR_LARGO = {2: "departamentos", 4: "provincias", 6: "distritos"}
+
+
+class NivelOrdenado:
+    """
+    Códigos y nombres de un nivel, ordenados por código, con los rangos de
+    cada prefijo padre (2 dígitos y, para distritos, también 4).
+    """
+
+    __slots__ = ("codigos", "nombres", "rangos")
+
+    def __init__(self, mapping: dict[str, str], largos_padre: tuple[int, ...]):
+        ordenado = sorted(mapping.items())
+        self.codigos = tuple(codigo for codigo, _ in ordenado)
+        self.nombres = tuple(nombre for _, nombre in ordenado)
+
+        self.rangos: dict[str, tuple[int, int]] = {}
+        for largo in largos_padre:
+            for i, codigo in enumerate(self.codigos):
+                padre = codigo[:largo]
+                inicio, _ = self.rangos.get(padre, (i, i))
+                self.rangos[padre] = (inicio, i + 1)
+
+    def bajo(self, padre: str) -> dict[str, str]:
+        inicio, fin = self.rangos.get(padre, (0, 0))
+        return dict(zip(self.codigos[inicio:fin], self.nombres[inicio:fin]))
+
+
+def _nivel(level: str, institucion: str) -> NivelOrdenado:
+    largos_padre = tuple(largo for largo in (2, 4) if largo < _LARGO[level])
+    return ResourceManager.cargar_derivado(
+        (level, institucion, "jerarquia"),
+        lambda: NivelOrdenado(
+            ResourceManager.cargar_diccionario(level, institucion), largos_padre
+        ),
+    )
+
+
+def _validar_existe(codigo: str, institucion: str) -> str:
+    level = _NIVEL_POR_LARGO.get(len(codigo))
+    if level is None:
+        raise ValueError("El ubigeo debe tener 2, 4 o 6 dígitos")
+    if codigo not in ResourceManager.cargar_diccionario(level, institucion):
+        raise KeyError(
+            f"El código de ubigeo {codigo} no se encontró en la base de datos de {level} de {institucion.upper()}"
+        )
+    return level
+
+
+def children(
+    code: str | int, institucion: Literal["inei", "reniec", "sunat"] = "inei"
+) -> dict[str, str]:
+    """
+    Devuelve las unidades inmediatamente inferiores a un ubigeo.
+
+    Parameters
+    ----------
+    code : str or int
+        Ubigeo de un departamento (2 dígitos) o de una provincia (4 dígitos).
+    institucion : {"inei", "reniec", "sunat"}, default "inei"
+        Institución de la que se toman los códigos y nombres.
+
+    Returns
+    -------
+    dict[str, str]
+        Diccionario {ubigeo: nombre} ordenado por código. Los distritos no
+        tienen hijos, por lo que devuelven un diccionario vacío.
+
+    Raises
+    ------
+    KeyError
+        Si el ubigeo no existe para la institución.
+
+    Examples
+    --------
+    >>> import ubigeos_peru as ubg
+    >>> ubg.children("01")
+    {'0101': 'Chachapoyas', '0102': 'Bagua', ...}
+    >>> list(ubg.children(1501))[:3]
+    ['150101', '150102', '150103']
+    """
+    codigo = UbigeoConverter._validate_codigo(code)
+    level = _validar_existe(codigo, institucion)
+    if level == "distritos":
+        return {}
+    hijos = "provincias" if level == "departamentos" else "distritos"
+    return _nivel(hijos, institucion).bajo(codigo)
+
+
+def parent(code: str | int) -> Optional[str]:
+    """
+    Devuelve el ubigeo del nivel inmediatamente superior.
+
+    Se calcula a partir del propio código (los primeros 4 o 2 dígitos), sin
+    consultar los recursos.
+
+    Parameters
+    ----------
+    code : str or int
+        Ubigeo de un distrito o de una provincia.
+
+    Returns
+    -------
+    str or None
+        Ubigeo de la provincia o del departamento. None para un departamento.
+
+    Examples
+    --------
+    >>> import ubigeos_peru as ubg
+    >>> ubg.parent("150101")
+    '1501'
+    >>> ubg.parent(1501)
+    '15'
+    """
+    codigo = UbigeoConverter._validate_codigo(code)
+    if len(codigo) not in _NIVEL_POR_LARGO:
+        raise ValueError("El ubigeo debe tener 2, 4 o 6 dígitos")
+    if len(codigo) == 2:
+        return None
+    return codigo[: len(codigo) - 2]
+
+
+def descendants(
+    code: str | int,
+    level: Literal["provincias", "distritos"] = "distritos",
+    institucion: Literal["inei", "reniec", "sunat"] = "inei",
+) -> dict[str, str]:
+    """
+    Devuelve todas las unidades de un nivel que pertenecen a un ubigeo.
+
+    Parameters
+    ----------
+    code : str or int
+        Ubigeo de un departamento o de una provincia.
+    level : {"provincias", "distritos"}, default "distritos"
+        Nivel de las unidades a devolver. Debe ser inferior al del ubigeo.
+    institucion : {"inei", "reniec", "sunat"}, default "inei"
+        Institución de la que se toman los códigos y nombres.
+
+    Returns
+    -------
+    dict[str, str]
+        Diccionario {ubigeo: nombre} ordenado por código.
+
+    Examples
+    --------
+    >>> import ubigeos_peru as ubg
+    >>> len(ubg.descendants("08", level="distritos"))
+    116
+    """
+    codigo = UbigeoConverter._validate_codigo(code)
+    level = UbigeoConverter._validate_level(level)
+    nivel_codigo = _validar_existe(codigo, institucion)
+    if _LARGO[level] <= len(codigo):
+        raise ValueError(
+            f"El nivel '{level}' debe ser inferior al del ubigeo {codigo} ({nivel_codigo})"
+        )
+    return _nivel(level, institucion).bajo(codigo)
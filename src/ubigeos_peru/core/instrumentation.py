@@ -0,0 +1,172 @@
+"""
+Instrumentación opcional de las rutas críticas: contadores y tiempos por fase.
+
+Está desactivada por defecto. Cada punto de medición consulta primero el flag
+`ACTIVO` del módulo, así que sin instrumentación el costo es una lectura de
+atributo por llamada. Las consultas escalares solo actualizan contadores; los
+tiempos se toman en operaciones más pesadas (carga de recursos, Series y fuzzy
+matching).
+
+Contadores:
+
+- ``consultas``: búsquedas en los diccionarios (una Series suma una por fila).
+  Las funciones que delegan en otras (ej. `get_macrorregion`, que primero
+  obtiene el departamento) suman una por cada búsqueda que hacen.
+- ``cache_hits`` / ``cache_misses``: accesos a recursos y estructuras derivadas
+  ya cargados o que hubo que construir.
+- ``foneticos``: valores resueltos por el índice fonético, antes del fuzzy
+  matching.
+- ``fuzzy_llamadas``, ``fuzzy_aceptados``, ``fuzzy_rechazados``: valores
+  enviados al fuzzy matching (rapidfuzz) y su resultado.
+- ``errores_<on_error>``: valores sin coincidencia, por política ``on_error``.
+- ``lotes_async``: lotes despachados por `AsyncUbigeo` (``consultas`` /
+  ``lotes_async`` da el tamaño medio de lote).
+- ``lotes_iter``: lotes convertidos por `iter_convert`.
+
+Fases con tiempo: ``carga``, ``normalizacion``, ``busqueda``, ``fuzzy``
+(índice fonético y rapidfuzz) y ``series`` (construcción de la Series
+resultante). Las fases pueden anidarse:
+por ejemplo, la carga de un recurso durante la construcción de un índice de
+fuzzy matching cuenta en ambas.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import nullcontext
+from functools import wraps
+from typing import Any, Callable, Literal, Optional
+
+Fase = Literal["carga", "normalizacion", "busqueda", "fuzzy", "series"]
+Callback = Callable[[Literal["contador", "tiempo"], str, float], Any]
+
+# Se lee en cada punto de medición: debe ser un atributo simple del módulo
+ACTIVO = False
+
+_lock = threading.Lock()
+_contadores: dict[str, int] = {}
+# fase -> [llamadas, segundos acumulados, máximo]
+_tiempos: dict[str, list[float]] = {}
+_callback: Optional[Callback] = None
+
+_NULO = nullcontext()
+
+
+def enable_stats(callback: Optional[Callback] = None) -> None:
+    """
+    Activa la instrumentación (contadores y tiempos por fase).
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Función ``callback(tipo, nombre, valor)`` que se llama con cada evento,
+        para reenviarlo a Prometheus, OpenTelemetry, etc. ``tipo`` es
+        ``"contador"`` (``valor`` es el incremento) o ``"tiempo"`` (``valor``
+        son los segundos de la fase). Se llama en el hilo que produjo el evento
+        y sus excepciones se propagan. Reemplaza al callback anterior.
+
+    Examples
+    --------
+    >>> ubg.enable_stats()
+    >>> ubg.get_distrito(df["UBIGEO"])
+    >>> ubg.stats()["contadores"]["consultas"]
+    """
+    global ACTIVO, _callback
+    _callback = callback
+    ACTIVO = True
+
+
+def disable_stats() -> None:
+    """Desactiva la instrumentación y el callback. Los valores acumulados se conservan."""
+    global ACTIVO, _callback
+    ACTIVO = False
+    _callback = None
+
+
+def stats(reset: bool = False) -> dict[str, Any]:
+    """
+    Contadores y tiempos por fase acumulados desde la activación (o el último reset).
+
+    Parameters
+    ----------
+    reset : bool, default False
+        Si es True, pone en cero los acumulados después de leerlos.
+
+    Returns
+    -------
+    dict
+        ``{"activo": bool, "contadores": {nombre: n}, "tiempos": {fase:
+        {"llamadas": n, "segundos": total, "max": segundos}}}``
+    """
+    with _lock:
+        resultado = {
+            "activo": ACTIVO,
+            "contadores": dict(_contadores),
+            "tiempos": {
+                fase: {"llamadas": int(n), "segundos": total, "max": maximo}
+                for fase, (n, total, maximo) in _tiempos.items()
+            },
+        }
+        if reset:
+            _contadores.clear()
+            _tiempos.clear()
+    return resultado
+
+
+def contar(nombre: str, n: int = 1) -> None:
+    """Suma `n` a un contador. Quien llama verifica `ACTIVO` antes."""
+    with _lock:
+        _contadores[nombre] = _contadores.get(nombre, 0) + n
+    if _callback is not None:
+        _callback("contador", nombre, n)
+
+
+def registrar_tiempo(fase: Fase, segundos: float) -> None:
+    with _lock:
+        acumulado = _tiempos.get(fase)
+        if acumulado is None:
+            _tiempos[fase] = [1, segundos, segundos]
+        else:
+            acumulado[0] += 1
+            acumulado[1] += segundos
+            acumulado[2] = max(acumulado[2], segundos)
+    if _callback is not None:
+        _callback("tiempo", fase, segundos)
+
+
+class _Cronometro:
+    __slots__ = ("fase", "inicio")
+
+    def __init__(self, fase: Fase):
+        self.fase = fase
+
+    def __enter__(self) -> None:
+        self.inicio = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        registrar_tiempo(self.fase, time.perf_counter() - self.inicio)
+
+
+def medir(fase: Fase) -> Any:
+    """
+    Context manager que registra el tiempo de una fase. Con la instrumentación
+    desactivada devuelve un context manager vacío compartido.
+    """
+    return _Cronometro(fase) if ACTIVO else _NULO
+
+
+def medido(fase: Fase) -> Callable[[Callable], Callable]:
+    """Decorador equivalente a envolver toda la función en `medir(fase)`."""
+
+    def decorador(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ACTIVO:
+                return func(*args, **kwargs)
+            with _Cronometro(fase):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorador
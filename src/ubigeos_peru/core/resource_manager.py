@@ -1,7 +1,14 @@
+import itertools
+import sys
+import threading
+import time
+import tracemalloc
 from pathlib import Path
-from typing import Any, Literal
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Literal, Mapping, Optional
 
-import orjson
+from . import instrumentation
+from ._utils import FuzzyIndex, eliminar_acentos, indice_fonetico
 
 # Configuración de recursos
 RESOURCE_DIR = Path(__file__).parent.parent / "resources"
@@ -14,45 +21,572 @@ ResourceName = Literal[
     "equivalencias",
     "otros",
     "inverted",
+    "poblacion",
 ]
 
-_RESOURCE_FILES: dict[ResourceName, str] = {
-    "departamentos": "departamentos.json",
-    "provincias": "provincias.json",
-    "distritos": "distritos.json",
-    "macrorregiones": "macrorregiones.json",
-    "equivalencias": "equivalencias.json",
-    "otros": "otros.json",
-    "inverted": "inverted.json",
+_INSTITUCIONES = ("inei", "reniec", "sunat")
+_NIVELES = ("departamentos", "provincias", "distritos")
+
+# Cada recurso está partido en archivos por institución y/o nivel, para cargar
+# solo la parte que se necesita. Cada tupla enumera las claves de un nivel de
+# anidamiento: "inverted" -> resources/inverted/<nivel>/<institucion>.json
+_PARTICIONES: dict[ResourceName, tuple[tuple[str, ...], ...]] = {
+    "departamentos": (_INSTITUCIONES,),
+    "provincias": (_INSTITUCIONES,),
+    "distritos": (_INSTITUCIONES,),
+    "macrorregiones": (("ceplan", "inei", "minsa"),),
+    "equivalencias": (_NIVELES,),
+    "otros": (_NIVELES,),
+    "inverted": (_NIVELES, _INSTITUCIONES),
+    "poblacion": (_NIVELES,),
 }
 
 
+def _leer_recurso(ruta: str) -> dict[str, Any]:
+    import orjson
+
+    file_path = RESOURCE_DIR / f"{ruta}.json"
+    try:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Recurso no encontrado: {file_path}") from e
+
+
+def _congelar(obj: Any) -> Any:
+    """
+    Convierte recursivamente los diccionarios en vistas de solo lectura
+    (MappingProxyType) y las listas en tuplas.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _congelar(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_congelar(v) for v in obj)
+    return obj
+
+
+def _medir(obj: Any, vistos: Optional[set[int]] = None) -> int:
+    """
+    Estima en bytes la memoria ocupada por una estructura (recursivo, sin contar
+    dos veces un mismo objeto).
+    """
+    if vistos is None:
+        vistos = set()
+    if id(obj) in vistos:
+        return 0
+    vistos.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, MappingProxyType):
+        # El proxy no expone su dict interno; se estima con una copia superficial
+        size += sys.getsizeof(obj.copy())
+    if isinstance(obj, Mapping):
+        for k, v in obj.items():
+            size += _medir(k, vistos) + _medir(v, vistos)
+    elif isinstance(obj, (tuple, list, set, frozenset)):
+        for v in obj:
+            size += _medir(v, vistos)
+    elif hasattr(obj, "__slots__"):
+        for slot in obj.__slots__:
+            size += _medir(getattr(obj, slot, None), vistos)
+    return size
+
+
+def _parte(clave: tuple[str, ...]) -> str:
+    # Ruta del archivo ("distritos/inei") al que pertenece una clave
+    return "/".join(clave[: len(_PARTICIONES[clave[0]]) + 1])
+
+
 class ResourceManager:
-    _loaded: dict[str, dict[str, Any]] = {}
+    # Recursos ya publicados (inmutables), por ruta: "distritos/inei" para una
+    # parte y "distritos" para la vista que reúne todas. Se leen sin lock: una vez
+    # que una clave existe, su valor nunca cambia.
+    _loaded: dict[str, Mapping[str, Any]] = {}
+    # Un lock por ruta, para que la primera carga ocurra una sola vez aunque
+    # varios hilos la soliciten al mismo tiempo
+    _locks: dict[str, threading.Lock] = {}
+    _locks_lock = threading.Lock()
+    # Estructuras derivadas de los recursos (vistas normalizadas, índices fuzzy).
+    # La clave es una tupla cuyo primer elemento es el recurso de origen, seguido
+    # de las claves de la parte de la que se deriva.
+    _derived: dict[tuple[str, ...], Any] = {}
+    _derived_locks: dict[tuple[str, ...], threading.Lock] = {}
+    _derived_locks_lock = threading.Lock()
+
+    # Presupuesto de memoria (bytes) para recursos y estructuras derivadas. Con
+    # None no hay límite y no se lleva registro de uso.
+    _memory_budget: Optional[int] = None
+    # Tamaño estimado de cada estructura publicada: la ruta de la parte como tupla
+    # para los recursos y la clave completa para las derivadas
+    _sizes: dict[tuple[str, ...], int] = {}
+    # Último uso de cada ruta (contador creciente), para desalojar por LRU
+    _last_used: dict[str, int] = {}
+    _clock = itertools.count()
+    _evict_lock = threading.Lock()
 
     @classmethod
-    def cargar_diccionario(cls, resource_name: ResourceName) -> dict[str, Any]:
+    def cargar_diccionario(
+        cls, resource_name: ResourceName, *claves: str
+    ) -> Mapping[str, Any]:
         """
         Carga un recurso JSON desde el directorio de recursos con lazy loading
 
+        Solo se leen los archivos de la parte solicitada: por ejemplo,
+        `cargar_diccionario("distritos", "inei")` no parsea los de RENIEC ni
+        SUNAT. La primera llamada parsea el archivo bajo un lock propio y publica
+        una estructura de solo lectura; las siguientes la devuelven sin tomar
+        ningún lock.
+
         Args:
-            resource_name: Nombre clave del recurso (debe estar en _RESOURCE_FILES)
+            resource_name: Nombre clave del recurso (debe estar en _PARTICIONES)
+            claves: Claves para llegar a una parte del recurso (ej. "inei", o
+                "distritos", "inei" para "inverted"). Sin claves se devuelve el
+                recurso completo
 
         Returns:
-            Diccionario con los datos del JSON
+            Mapping de solo lectura con los datos del JSON
 
         Raises:
+            KeyError: Si el nombre del recurso o alguna de las claves no es válida
             FileNotFoundError: Si el recurso no existe
-            json.JSONDecodeError: Si el archivo no es JSON válido
-        """
-        if resource_name not in cls._loaded:
-            file_path = RESOURCE_DIR / _RESOURCE_FILES[resource_name]
-            try:
-                with open(file_path, "rb") as f:
-                    resource_data = orjson.loads(f.read())
-                    cls._loaded[resource_name] = resource_data
-            except FileNotFoundError as e:
-                raise FileNotFoundError(f"Recurso no encontrado: {file_path}") from e
-        else:
-            resource_data = cls._loaded[resource_name]
+            orjson.JSONDecodeError: Si el archivo no es JSON válido
+        """
+        try:
+            profundidad = len(_PARTICIONES[resource_name])
+        except KeyError:
+            raise KeyError(
+                f"Recurso desconocido: {resource_name}. Solo se aceptan: {', '.join(_PARTICIONES)}"
+            )
+
+        ruta = "/".join((resource_name, *claves[:profundidad]))
+        resource_data = cls._loaded.get(ruta)
+        if instrumentation.ACTIVO:
+            instrumentation.contar(
+                "cache_misses" if resource_data is None else "cache_hits"
+            )
+        if resource_data is None:
+            resource_data = cls._cargar(resource_name, claves[:profundidad], ruta)
+        elif cls._memory_budget is not None:
+            cls._last_used[ruta] = next(cls._clock)
+
+        for clave in claves[profundidad:]:
+            resource_data = resource_data[clave]
+        return resource_data
+
+    @classmethod
+    def _cargar(
+        cls, resource_name: ResourceName, partes: tuple[str, ...], ruta: str
+    ) -> Mapping[str, Any]:
+        particiones = _PARTICIONES[resource_name]
+        for parte, opciones in zip(partes, particiones):
+            if parte not in opciones:
+                raise KeyError(
+                    f"Clave desconocida para {resource_name}: {parte}. Solo se aceptan: {', '.join(opciones)}"
+                )
+
+        with cls._locks_lock:
+            lock = cls._locks.setdefault(ruta, threading.Lock())
+
+        cargado = False
+        with lock:
+            # Otro hilo pudo haberlo publicado mientras se esperaba el lock
+            resource_data = cls._loaded.get(ruta)
+            if resource_data is None:
+                if len(partes) == len(particiones):
+                    with instrumentation.medir("carga"):
+                        resource_data = _congelar(_leer_recurso(ruta))
+                    cargado = True
+                else:
+                    # Vista que reúne las partes; cada una se carga y publica por
+                    # separado, así que se comparten con las llamadas parciales
+                    resource_data = MappingProxyType(
+                        {
+                            clave: cls.cargar_diccionario(resource_name, *partes, clave)
+                            for clave in particiones[len(partes)]
+                        }
+                    )
+                cls._loaded[ruta] = resource_data
+
+        if cls._memory_budget is not None:
+            cls._last_used[ruta] = next(cls._clock)
+            if cargado:
+                cls._desalojar(proteger=ruta)
+
         return resource_data
+
+    @classmethod
+    def cargar_derivado(
+        cls, clave: tuple[str, ...], constructor: Callable[[], Any]
+    ) -> Any:
+        """
+        Devuelve una estructura derivada de un recurso, construyéndola una sola vez
+
+        Sigue la misma lógica que `cargar_diccionario`: lectura sin lock si ya
+        existe, y construcción bajo un lock propio de la clave en caso contrario.
+
+        Args:
+            clave: Tupla que identifica la estructura; empieza con el nombre del
+                recurso y las claves de la parte de la que se deriva
+            constructor: Función sin argumentos que construye la estructura
+
+        Returns:
+            La estructura derivada
+        """
+        data = cls._derived.get(clave)
+        if instrumentation.ACTIVO:
+            instrumentation.contar("cache_misses" if data is None else "cache_hits")
+        if data is not None:
+            if cls._memory_budget is not None:
+                cls._last_used[_parte(clave)] = next(cls._clock)
+            return data
+
+        with cls._derived_locks_lock:
+            lock = cls._derived_locks.setdefault(clave, threading.Lock())
+
+        construido = False
+        with lock:
+            data = cls._derived.get(clave)
+            if data is None:
+                with instrumentation.medir("carga"):
+                    data = constructor()
+                cls._derived[clave] = data
+                construido = True
+
+        if cls._memory_budget is not None:
+            cls._last_used[_parte(clave)] = next(cls._clock)
+            if construido:
+                cls._desalojar(proteger=_parte(clave))
+
+        return data
+
+    @classmethod
+    def unload(cls, resource_name: Optional[ResourceName] = None, *claves: str) -> bool:
+        """
+        Libera un recurso (o una parte de él) y las estructuras derivadas
+
+        El recurso se vuelve a cargar de forma transparente la próxima vez que se
+        use. Las referencias que ya tenga quien llama siguen siendo válidas,
+        porque los datos publicados nunca se modifican.
+
+        Args:
+            resource_name: Nombre del recurso. Con None se liberan todos
+            claves: Claves de la parte a liberar (ej. "inei"). Sin claves se
+                libera el recurso completo
+
+        Returns:
+            True si había algo cargado que liberar
+
+        Raises:
+            KeyError: Si el nombre del recurso no es válido
+        """
+        if resource_name is None:
+            liberados = [cls.unload(name) for name in _PARTICIONES]
+            return any(liberados)
+
+        if resource_name not in _PARTICIONES:
+            raise KeyError(
+                f"Recurso desconocido: {resource_name}. Solo se aceptan: {', '.join(_PARTICIONES)}"
+            )
+
+        prefijo = (resource_name, *claves)
+        n = len(prefijo)
+
+        liberado = False
+        for ruta in list(cls._loaded):
+            partes = tuple(ruta.split("/"))
+            # La parte pedida, lo que cuelga de ella y las vistas que la contienen
+            if partes[:n] == prefijo or prefijo[: len(partes)] == partes:
+                liberado = cls._loaded.pop(ruta, None) is not None or liberado
+                cls._last_used.pop(ruta, None)
+        for clave in list(cls._derived):
+            if clave[:n] == prefijo:
+                liberado = cls._derived.pop(clave, None) is not None or liberado
+        for clave in list(cls._sizes):
+            if clave[:n] == prefijo:
+                cls._sizes.pop(clave, None)
+
+        return liberado
+
+    @classmethod
+    def set_memory_budget(cls, max_bytes: Optional[int]) -> None:
+        """
+        Fija un presupuesto de memoria para los recursos cargados
+
+        Cuando el total estimado (recursos más estructuras derivadas) lo supera,
+        se liberan las partes usadas hace más tiempo (LRU) junto con sus
+        derivados. La parte que se acaba de usar nunca se libera, aunque por sí
+        sola exceda el presupuesto.
+
+        Args:
+            max_bytes: Límite en bytes. Con None se desactiva el límite
+
+        Raises:
+            ValueError: Si el límite no es un entero >= 0
+        """
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 0):
+            raise ValueError("El presupuesto de memoria debe ser un entero >= 0 o None")
+
+        cls._memory_budget = max_bytes
+        if max_bytes is None:
+            cls._last_used.clear()
+            return
+
+        # Lo ya cargado se considera usado ahora, en orden de carga
+        for ruta in list(cls._loaded):
+            cls._last_used.setdefault(ruta, next(cls._clock))
+        cls._desalojar()
+
+    @classmethod
+    def memory_usage(cls, detalle: bool = False) -> dict[str, int]:
+        """
+        Memoria estimada (en bytes) de lo que está cargado actualmente
+
+        Los tamaños se calculan la primera vez que se piden y se guardan hasta
+        que el recurso se libera.
+
+        Args:
+            detalle: Si es False (por defecto) agrupa por recurso, sumando sus
+                partes y estructuras derivadas. Si es True devuelve una entrada
+                por estructura, con nombres como "distritos/inei" o
+                "distritos/inei/normalize"
+
+        Returns:
+            Diccionario {nombre: bytes}
+        """
+        uso: dict[str, int] = {}
+        for clave, size in cls._tamanos():
+            nombre = "/".join(clave) if detalle else clave[0]
+            uso[nombre] = uso.get(nombre, 0) + size
+        return uso
+
+    @classmethod
+    def _tamanos(cls) -> list[tuple[tuple[str, ...], int]]:
+        # Solo se miden las partes leídas de archivo: las vistas que las reúnen
+        # comparten los mismos objetos
+        estructuras: list[tuple[tuple[str, ...], Any]] = []
+        for ruta, data in list(cls._loaded.items()):
+            clave = tuple(ruta.split("/"))
+            if len(clave) == len(_PARTICIONES[clave[0]]) + 1:
+                estructuras.append((clave, data))
+        estructuras += list(cls._derived.items())
+
+        tamanos = []
+        for clave, data in estructuras:
+            size = cls._sizes.get(clave)
+            if size is None:
+                size = _medir(data)
+                cls._sizes[clave] = size
+            tamanos.append((clave, size))
+        return tamanos
+
+    @classmethod
+    def _desalojar(cls, proteger: Optional[str] = None) -> None:
+        # Libera partes por LRU hasta quedar dentro del presupuesto
+        with cls._evict_lock:
+            presupuesto = cls._memory_budget
+            if presupuesto is None:
+                return
+
+            uso: dict[str, int] = {}
+            for clave, size in cls._tamanos():
+                ruta = _parte(clave)
+                uso[ruta] = uso.get(ruta, 0) + size
+            total = sum(uso.values())
+
+            def ultimo_uso(ruta: str) -> int:
+                # Usar una vista completa ("distritos") cuenta como usar sus partes
+                partes = ruta.split("/")
+                return max(
+                    cls._last_used.get("/".join(partes[:i]), -1)
+                    for i in range(1, len(partes) + 1)
+                )
+
+            candidatos = sorted((r for r in uso if r != proteger), key=ultimo_uso)
+            for ruta in candidatos:
+                if total <= presupuesto:
+                    break
+                cls.unload(*ruta.split("/"))
+                total -= uso[ruta]
+
+    @classmethod
+    def cargar_normalizado(
+        cls, resource_name: ResourceName, *claves: str
+    ) -> Mapping[str, str]:
+        """
+        Vista de un recurso con los valores en mayúsculas y sin acentos
+
+        Args:
+            resource_name: Nombre del recurso
+            claves: Claves para llegar al mapping (ej. "inei" o "distritos")
+
+        Returns:
+            Mapping de solo lectura con los mismos códigos y los nombres normalizados
+        """
+
+        def construir() -> Mapping[str, str]:
+            mapping = cls.cargar_diccionario(resource_name, *claves)
+            return MappingProxyType(
+                {k: eliminar_acentos(v).upper() for k, v in mapping.items()}
+            )
+
+        return cls.cargar_derivado((resource_name, *claves, "normalize"), construir)
+
+    @classmethod
+    def cargar_indice_fuzzy(
+        cls, entity_type: Literal["departamentos", "provincias", "distritos"]
+    ) -> FuzzyIndex:
+        """
+        Índice de fuzzy matching (opciones preprocesadas) sobre las equivalencias
+        de un nivel
+        """
+        return cls.cargar_derivado(
+            ("equivalencias", entity_type, "fuzzy"),
+            lambda: FuzzyIndex(cls.cargar_diccionario("equivalencias", entity_type)),
+        )
+
+    @classmethod
+    def cargar_indice_fonetico(
+        cls, entity_type: Literal["departamentos", "provincias", "distritos"]
+    ) -> Mapping[str, str]:
+        """
+        Índice clave fonética -> clave de equivalencias de un nivel, usado antes
+        del fuzzy matching
+        """
+        return cls.cargar_derivado(
+            ("equivalencias", entity_type, "fonetico"),
+            lambda: indice_fonetico(
+                cls.cargar_diccionario("equivalencias", entity_type)
+            ),
+        )
+
+    @classmethod
+    def preload(
+        cls,
+        levels: Optional[Iterable[str]] = None,
+        institutions: Optional[Iterable[str]] = None,
+        fuzzy: bool = True,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Construye por adelantado los recursos y estructuras derivadas, para no
+        pagar su costo en la primera consulta
+
+        Solo se cargan las partes de los niveles e instituciones indicados.
+
+        Args:
+            levels: Lista de niveles a precargar (por defecto, None, los tres)
+            institutions: Lista de instituciones a precargar (por defecto, None,
+                inei, reniec y sunat)
+            fuzzy: Si es True, construye también los índices de fuzzy matching
+                y los fonéticos
+
+        Returns:
+            Reporte por estructura (ej. "distritos/inei") con el tiempo de
+            construcción en segundos ("segundos"), la memoria retenida en bytes
+            ("bytes") y si ya estaba cargada de antes ("ya_cargado")
+        """
+        if isinstance(levels, str) or isinstance(institutions, str):
+            raise TypeError(
+                "levels e institutions deben ser listas, ej. levels=['distritos']"
+            )
+        # Una lista vacía no precarga nada; solo None significa "todos"
+        levels = list(_NIVELES if levels is None else levels)
+        institutions = list(_INSTITUCIONES if institutions is None else institutions)
+
+        for level in levels:
+            if level not in _NIVELES:
+                raise ValueError(
+                    'Solo se aceptan "departamentos", "distritos", "provincias" como niveles'
+                )
+        for institucion in institutions:
+            if institucion not in _INSTITUCIONES:
+                raise ValueError(
+                    'Solo se aceptan "inei", "reniec", "sunat" como instituciones'
+                )
+
+        tareas: list[tuple[str, Callable[[], Any], Callable[[], bool]]] = []
+
+        def agregar_recurso(resource_name: ResourceName, *partes: str) -> None:
+            ruta = "/".join((resource_name, *partes))
+            tareas.append(
+                (
+                    ruta,
+                    lambda: cls.cargar_diccionario(resource_name, *partes),
+                    lambda: ruta in cls._loaded,
+                )
+            )
+
+        def agregar_derivado(
+            nombre: str, clave: tuple[str, ...], construir: Callable[[], Any]
+        ) -> None:
+            tareas.append((nombre, construir, lambda: clave in cls._derived))
+
+        for level in levels:
+            for institucion in institutions:
+                agregar_recurso(level, institucion)
+            agregar_recurso("equivalencias", level)
+            for institucion in institutions:
+                agregar_recurso("inverted", level, institucion)
+            agregar_recurso("otros", level)
+        if "departamentos" in levels:
+            for institucion in _PARTICIONES["macrorregiones"][0]:
+                agregar_recurso("macrorregiones", institucion)
+
+        if "departamentos" in levels:
+            for institucion in _PARTICIONES["macrorregiones"][0]:
+                agregar_derivado(
+                    f"macrorregiones/{institucion}/normalize",
+                    ("macrorregiones", institucion, "normalize"),
+                    lambda institucion=institucion: cls.cargar_normalizado(
+                        "macrorregiones", institucion
+                    ),
+                )
+
+        for level in levels:
+            for institucion in institutions:
+                agregar_derivado(
+                    f"{level}/{institucion}/normalize",
+                    (level, institucion, "normalize"),
+                    lambda level=level, institucion=institucion: cls.cargar_normalizado(
+                        level, institucion
+                    ),
+                )
+            agregar_derivado(
+                f"equivalencias/{level}/normalize",
+                ("equivalencias", level, "normalize"),
+                lambda level=level: cls.cargar_normalizado("equivalencias", level),
+            )
+            if fuzzy:
+                agregar_derivado(
+                    f"equivalencias/{level}/fuzzy",
+                    ("equivalencias", level, "fuzzy"),
+                    lambda level=level: cls.cargar_indice_fuzzy(level),
+                )
+                agregar_derivado(
+                    f"equivalencias/{level}/fonetico",
+                    ("equivalencias", level, "fonetico"),
+                    lambda level=level: cls.cargar_indice_fonetico(level),
+                )
+
+        estaba_midiendo = tracemalloc.is_tracing()
+        if not estaba_midiendo:
+            tracemalloc.start()
+
+        reporte: dict[str, dict[str, Any]] = {}
+        try:
+            for nombre, construir, ya_existe in tareas:
+                ya_cargado = ya_existe()
+                memoria_inicial = tracemalloc.get_traced_memory()[0]
+                inicio = time.perf_counter()
+                construir()
+                segundos = time.perf_counter() - inicio
+                memoria_final = tracemalloc.get_traced_memory()[0]
+                reporte[nombre] = {
+                    "segundos": segundos,
+                    "bytes": max(memoria_final - memoria_inicial, 0),
+                    "ya_cargado": ya_cargado,
+                }
+        finally:
+            if not estaba_midiendo:
+                tracemalloc.stop()
+
+        return reporte
@@ -0,0 +1,191 @@
+"""
+Agregación jerárquica de indicadores (distrito -> provincia -> departamento ->
+macrorregión).
+
+Las claves del nivel superior se derivan aritméticamente del ubigeo entero
+(``ubigeo // 100`` o ``// 10_000``), la agregación se hace con el group by nativo
+del backend sobre esas claves enteras, y los nombres se agregan recién al
+resultado, que tiene a lo sumo 196 filas.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, Mapping, Sequence
+
+from .resource_manager import ResourceManager
+
+if TYPE_CHECKING:
+    from narwhals.typing import IntoDataFrameT
+
+Agg = Literal["sum", "mean", "median", "min", "max", "count", "std", "var"]
+_AGREGACIONES = ("sum", "mean", "median", "min", "max", "count", "std", "var")
+
+_LARGO = {"departamentos": 2, "provincias": 4, "distritos": 6}
+_COLUMNA_NOMBRE = {
+    "departamentos": "departamento",
+    "provincias": "provincia",
+    "macrorregiones": "macrorregion",
+}
+
+
+def _nivel_de_codigos(maximo: int) -> str:
+    # Los ubigeos enteros pierden los ceros a la izquierda, pero sus rangos no se
+    # solapan: departamentos <= 25, provincias <= 2599, distritos >= 10101
+    if maximo < 100:
+        return "departamentos"
+    if maximo < 10_000:
+        return "provincias"
+    return "distritos"
+
+
+def rollup(
+    df: IntoDataFrameT,
+    code_col: str,
+    value_cols: str | Sequence[str],
+    to: Literal["provincias", "departamentos", "macrorregiones"] = "departamentos",
+    agg: Agg | Mapping[str, Agg] = "sum",
+    institucion: Literal["inei", "reniec", "sunat", "minsa", "ceplan"] = "inei",
+) -> IntoDataFrameT:
+    """
+    Agrega columnas numéricas a un nivel superior de la jerarquía de ubigeos.
+
+    No requiere materializar columnas de nombres por fila: las claves del nivel
+    superior se calculan a partir del ubigeo y los nombres se agregan solo al
+    resultado agregado.
+
+    Parameters
+    ----------
+    df : DataFrame
+        DataFrame de pandas, Polars, PyArrow u otro backend soportado por narwhals.
+    code_col : str
+        Columna con los ubigeos (str con ceros a la izquierda o enteros) de un
+        nivel inferior al de destino. Para ``to="macrorregiones"`` también se
+        aceptan códigos de departamento.
+    value_cols : str or list of str
+        Columnas a agregar.
+    to : {"provincias", "departamentos", "macrorregiones"}, default "departamentos"
+        Nivel de destino.
+    agg : str or dict[str, str], default "sum"
+        Agregación a aplicar ("sum", "mean", "median", "min", "max", "count",
+        "std" o "var"), o un diccionario {columna: agregación}.
+    institucion : {"inei", "reniec", "sunat", "minsa", "ceplan"}, default "inei"
+        Institución de la que se toman los nombres. Para ``to="macrorregiones"``
+        indica la clasificación (inei, minsa o ceplan).
+
+    Returns
+    -------
+    DataFrame
+        DataFrame del mismo backend, ordenado por código, con las columnas
+        "ubigeo" (salvo para macrorregiones), el nombre del nivel
+        ("provincia", "departamento" o "macrorregion") y las columnas agregadas.
+        Las filas con ubigeo nulo, o cuyo departamento no pertenece a ninguna
+        macrorregión de la clasificación elegida, se descartan.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import ubigeos_peru as ubg
+    >>> df = pd.DataFrame({"ubigeo": ["150101", "150116", "080101"], "casos": [3, 4, 5]})
+    >>> ubg.rollup(df, "ubigeo", "casos", to="departamentos")
+      ubigeo departamento  casos
+    0     08        Cusco      5
+    1     15         Lima      7
+    """
+    import narwhals as nw
+
+    if to not in ("provincias", "departamentos", "macrorregiones"):
+        raise ValueError(
+            'Solo se aceptan "provincias", "departamentos", "macrorregiones" como nivel de destino (to)'
+        )
+
+    if isinstance(value_cols, str):
+        value_cols = [value_cols]
+    agregaciones = (
+        {col: agg[col] for col in value_cols}
+        if isinstance(agg, Mapping)
+        else dict.fromkeys(value_cols, agg)
+    )
+    for col, funcion in agregaciones.items():
+        if funcion not in _AGREGACIONES:
+            raise ValueError(
+                f"Agregación no soportada para '{col}': {funcion}. Solo se aceptan: {', '.join(_AGREGACIONES)}"
+            )
+
+    # Las filas sin ubigeo se descartan antes del cast: con pandas/numpy un
+    # entero no admite nulos
+    frame = nw.from_native(df, eager_only=True).filter(~nw.col(code_col).is_null())
+    clave = "__ubigeo_clave__"
+
+    maximo = frame.select(nw.col(code_col).cast(nw.Int64).max()).item()
+    nivel_origen = "distritos" if maximo is None else _nivel_de_codigos(maximo)
+
+    # Las macrorregiones agrupan departamentos, así que admiten códigos de
+    # cualquier nivel; el resto exige partir de un nivel inferior
+    nivel_destino = "departamentos" if to == "macrorregiones" else to
+    if _LARGO[nivel_origen] < _LARGO[nivel_destino] or (nivel_origen == to):
+        raise ValueError(
+            f"Los ubigeos de '{code_col}' son de {nivel_origen}; no se pueden agregar a {to}"
+        )
+
+    # 150101 // 100 -> 1501, 150101 // 10_000 -> 15
+    divisor = 10 ** (_LARGO[nivel_origen] - _LARGO[nivel_destino])
+    expr_clave = nw.col(code_col).cast(nw.Int64) // divisor
+
+    if to == "macrorregiones":
+        # Departamento -> macrorregión con un reemplazo vectorizado sobre las
+        # claves enteras (a lo sumo 25 valores). Los departamentos sin
+        # macrorregión van a -1, porque un Int64 de numpy no admite nulos
+        departamentos = ResourceManager.cargar_diccionario("departamentos", "inei")
+        regiones_por_dep = ResourceManager.cargar_diccionario(
+            "macrorregiones", institucion
+        )
+        regiones = sorted(set(regiones_por_dep.values()))
+        id_region = {region: i for i, region in enumerate(regiones)}
+        antiguos = [int(codigo) for codigo in departamentos]
+        nuevos = [
+            id_region.get(regiones_por_dep.get(n), -1) for n in departamentos.values()
+        ]
+        expr_clave = expr_clave.replace_strict(
+            antiguos, nuevos, default=-1, return_dtype=nw.Int64
+        )
+
+    resultado = (
+        frame.with_columns(expr_clave.alias(clave))
+        .filter(nw.col(clave) >= 0)
+        .group_by(clave)
+        .agg(
+            *(
+                getattr(nw.col(col), funcion)().alias(col)
+                for col, funcion in agregaciones.items()
+            )
+        )
+        .sort(clave)
+    )
+
+    # Nombres solo sobre las filas agregadas
+    claves = resultado[clave].to_list()
+    backend = nw.get_native_namespace(resultado)
+    columna_nombre = _COLUMNA_NOMBRE[to]
+    if to == "macrorregiones":
+        nombres = [regiones[k] for k in claves]
+        columnas = [
+            nw.new_series(columna_nombre, nombres, nw.String(), backend=backend)
+        ]
+    else:
+        largo = _LARGO[to]
+        ubigeos = [str(k).zfill(largo) for k in claves]
+        mapping = ResourceManager.cargar_diccionario(to, institucion)
+        columnas = [
+            nw.new_series("ubigeo", ubigeos, nw.String(), backend=backend),
+            nw.new_series(
+                columna_nombre,
+                [mapping.get(u) for u in ubigeos],
+                nw.String(),
+                backend=backend,
+            ),
+        ]
+
+    resultado = resultado.with_columns(*columnas).select(
+        *(s.name for s in columnas), *agregaciones
+    )
+    return nw.maybe_reset_index(resultado).to_native()
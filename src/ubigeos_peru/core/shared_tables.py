@@ -0,0 +1,308 @@
+"""
+Tablas de consulta compiladas en memoria compartida (`multiprocessing.shared_memory`).
+
+El proceso principal publica una sola vez los recursos ya parseados (códigos,
+nombres y opciones de fuzzy matching) en un único bloque de memoria compartida.
+Los workers se adjuntan por nombre y consultan las tablas directamente sobre ese
+bloque, sin parsear JSON ni construir diccionarios propios, de modo que la memoria
+no crece con la cantidad de workers y el arranque es inmediato.
+
+Formato del bloque::
+
+    [u64: largo del manifiesto][manifiesto JSON][datos alineados a 8 bytes]
+
+Cada lista de strings se guarda como un arreglo de offsets (uint32, n + 1
+elementos) y un heap con los strings en UTF-8, uno detrás de otro. Las tablas
+(código -> nombre) guardan sus claves ordenadas, para buscarlas con bisección.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator, Optional
+
+from ._utils import FuzzyIndex
+from .resource_manager import _INSTITUCIONES, _NIVELES, _PARTICIONES, ResourceManager
+
+_CABECERA = struct.Struct("<Q")
+_ALINEACION = 8
+
+# Bloques adjuntados en este proceso, para no adjuntar dos veces el mismo bloque
+_ADJUNTADOS: dict[str, shared_memory.SharedMemory] = {}
+
+
+def _alinear(n: int) -> int:
+    return n + (-n % _ALINEACION)
+
+
+class _Cadenas(Sequence):
+    """
+    Lista de solo lectura sobre un arreglo de offsets y un heap UTF-8. Cada acceso
+    decodifica únicamente el string pedido.
+    """
+
+    # `_shm` va al final: al liberar la lista se sueltan primero las vistas y
+    # después el bloque, que no puede cerrarse mientras haya vistas exportadas
+    __slots__ = ("_offsets", "_heap", "_shm")
+
+    def __init__(
+        self, shm: shared_memory.SharedMemory, base: int, descriptor: dict[str, int]
+    ):
+        n = descriptor["n"]
+        inicio = base + descriptor["offsets"]
+        self._offsets = shm.buf[inicio : inicio + 4 * (n + 1)].cast("I")
+        heap = base + descriptor["heap"]
+        self._heap = shm.buf[heap : heap + self._offsets[n]]
+        self._shm = shm
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return str(self._heap[self._offsets[i] : self._offsets[i + 1]], "utf-8")
+
+
+class SharedTable(Mapping):
+    """
+    Mapping de solo lectura (str -> str) sobre memoria compartida. Las búsquedas
+    son por bisección sobre las claves ordenadas.
+    """
+
+    __slots__ = ("_claves", "_valores")
+
+    def __init__(self, claves: _Cadenas, valores: _Cadenas):
+        self._claves = claves
+        self._valores = valores
+
+    def __getitem__(self, key: str) -> str:
+        if isinstance(key, str):
+            i = bisect_left(self._claves, key)
+            if i < len(self._claves) and self._claves[i] == key:
+                return self._valores[i]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._claves)
+
+    def __len__(self) -> int:
+        return len(self._claves)
+
+    def __repr__(self) -> str:
+        return f"SharedTable({len(self)} entradas)"
+
+
+class _Escritor:
+    """Acumula los datos del bloque y devuelve sus offsets (relativos a los datos)."""
+
+    def __init__(self) -> None:
+        self.partes: list[bytes] = []
+        self.tamano = 0
+
+    def agregar(self, datos: bytes) -> int:
+        relleno = -self.tamano % _ALINEACION
+        if relleno:
+            self.partes.append(b"\0" * relleno)
+            self.tamano += relleno
+        offset = self.tamano
+        self.partes.append(datos)
+        self.tamano += len(datos)
+        return offset
+
+    def cadenas(self, valores: Iterable[str]) -> dict[str, int]:
+        codificados = [v.encode("utf-8") for v in valores]
+        offsets = array("I", [0])
+        total = 0
+        for c in codificados:
+            total += len(c)
+            offsets.append(total)
+        return {
+            "n": len(codificados),
+            "offsets": self.agregar(offsets.tobytes()),
+            "heap": self.agregar(b"".join(codificados)),
+        }
+
+
+class SharedTables:
+    """
+    Bloque de memoria compartida con las tablas publicadas por `share_tables`.
+
+    El proceso que lo crea es su dueño: al cerrarlo (o al salir del bloque
+    ``with``) el bloque se libera. Los workers deben adjuntarse con
+    `attach_tables` usando `name`.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, tablas: list[str]):
+        self._shm: Optional[shared_memory.SharedMemory] = shm
+        self.name = shm.name
+        self.size = shm.size
+        self.tablas = tablas
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> SharedTables:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"SharedTables(name={self.name!r}, size={self.size}, tablas={len(self.tablas)})"
+
+
+def share_tables(
+    levels: Optional[Iterable[str]] = None,
+    institutions: Optional[Iterable[str]] = None,
+    fuzzy: bool = True,
+) -> SharedTables:
+    """
+    Publica las tablas de consulta en un bloque de memoria compartida.
+
+    Se publican, para cada nivel e institución, las tablas código -> nombre, las
+    inversas nombre -> código, las equivalencias y (si `fuzzy` es True) las
+    opciones preprocesadas para fuzzy matching. Las macrorregiones se incluyen
+    cuando se pide el nivel "departamentos".
+
+    Parameters
+    ----------
+    levels : list of {"departamentos", "provincias", "distritos"}, optional
+        Niveles a publicar. Por defecto, los tres.
+    institutions : list of {"inei", "reniec", "sunat"}, optional
+        Instituciones a publicar. Por defecto, las tres. Una lista vacía publica
+        solo las tablas que no dependen de la institución.
+    fuzzy : bool, default True
+        Si es True, publica también los índices de fuzzy matching.
+
+    Returns
+    -------
+    SharedTables
+        Dueño del bloque. Usar como context manager, o llamar a ``close()``
+        cuando los workers terminen.
+
+    Examples
+    --------
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> import ubigeos_peru as ubg
+    >>> with ubg.share_tables(levels=["distritos"]) as tablas:
+    ...     with ProcessPoolExecutor(
+    ...         initializer=ubg.attach_tables, initargs=(tablas.name,)
+    ...     ) as pool:
+    ...         list(pool.map(ubg.get_distrito, ["150101", "080101"]))
+    ['Lima', 'Cusco']
+    """
+    levels = list(_NIVELES if levels is None else levels)
+    institutions = list(_INSTITUCIONES if institutions is None else institutions)
+
+    for level in levels:
+        if level not in _NIVELES:
+            raise ValueError(
+                'Solo se aceptan "departamentos", "distritos", "provincias" como niveles'
+            )
+    for institucion in institutions:
+        if institucion not in _INSTITUCIONES:
+            raise ValueError(
+                'Solo se aceptan "inei", "reniec", "sunat" como instituciones'
+            )
+
+    rutas: list[tuple[str, ...]] = []
+    for level in levels:
+        for institucion in institutions:
+            rutas.append((level, institucion))
+            rutas.append(("inverted", level, institucion))
+        rutas.append(("equivalencias", level))
+    if "departamentos" in levels:
+        rutas += [("macrorregiones", i) for i in _PARTICIONES["macrorregiones"][0]]
+
+    escritor = _Escritor()
+    manifiesto: dict[str, dict] = {"tablas": {}, "fuzzy": {}}
+    for ruta in rutas:
+        items = sorted(ResourceManager.cargar_diccionario(*ruta).items())
+        manifiesto["tablas"]["/".join(ruta)] = {
+            "claves": escritor.cadenas(k for k, _ in items),
+            "valores": escritor.cadenas(v for _, v in items),
+        }
+    if fuzzy:
+        for level in levels:
+            indice = ResourceManager.cargar_indice_fuzzy(level)
+            manifiesto["fuzzy"][level] = {
+                "opciones": escritor.cadenas(indice.opciones),
+                "procesadas": escritor.cadenas(indice.procesadas),
+            }
+
+    encabezado = json.dumps(manifiesto).encode("utf-8")
+    inicio_datos = _alinear(_CABECERA.size + len(encabezado))
+
+    shm = shared_memory.SharedMemory(create=True, size=inicio_datos + escritor.tamano)
+    try:
+        _CABECERA.pack_into(shm.buf, 0, len(encabezado))
+        shm.buf[_CABECERA.size : _CABECERA.size + len(encabezado)] = encabezado
+        posicion = inicio_datos
+        for parte in escritor.partes:
+            shm.buf[posicion : posicion + len(parte)] = parte
+            posicion += len(parte)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+
+    return SharedTables(shm, list(manifiesto["tablas"]) + list(manifiesto["fuzzy"]))
+
+
+def attach_tables(name: str) -> None:
+    """
+    Adjunta las tablas publicadas con `share_tables` al proceso actual.
+
+    Pensada como ``initializer`` de un pool de procesos: tras llamarla, las
+    funciones de la librería consultan las tablas directamente sobre la memoria
+    compartida, sin parsear los recursos. Lo que no esté publicado se sigue
+    cargando desde los archivos de la forma habitual.
+
+    Parameters
+    ----------
+    name : str
+        Nombre del bloque (``SharedTables.name``).
+
+    Notes
+    -----
+    - Las opciones preprocesadas de fuzzy matching se decodifican una vez por
+      proceso, porque rapidfuzz necesita objetos str para comparar.
+    - Llamarla más de una vez con el mismo nombre no tiene efecto.
+    """
+    if name in _ADJUNTADOS:
+        return
+
+    shm = shared_memory.SharedMemory(name=name)
+    (largo,) = _CABECERA.unpack_from(shm.buf, 0)
+    manifiesto = json.loads(bytes(shm.buf[_CABECERA.size : _CABECERA.size + largo]))
+    base = _alinear(_CABECERA.size + largo)
+
+    for ruta, tabla in manifiesto["tablas"].items():
+        # Se publican como partes ya cargadas: cargar_diccionario las encuentra
+        # en su camino rápido
+        ResourceManager._loaded[ruta] = SharedTable(
+            _Cadenas(shm, base, tabla["claves"]), _Cadenas(shm, base, tabla["valores"])
+        )
+    for level, indice in manifiesto["fuzzy"].items():
+        ResourceManager._derived[("equivalencias", level, "fuzzy")] = (
+            FuzzyIndex.desde_procesadas(
+                _Cadenas(shm, base, indice["opciones"]),
+                tuple(_Cadenas(shm, base, indice["procesadas"])),
+            )
+        )
+
+    _ADJUNTADOS[name] = shm
@@ -0,0 +1,297 @@
+"""
+Conversión por lotes de entradas que no entran en memoria (un archivo de texto
+con millones de códigos, un cursor de base de datos, etc.).
+
+`iter_convert` consume un iterable de lotes o de valores sueltos y devuelve un
+generador que convierte un lote a la vez, así que la memoria queda acotada por
+`batch_size` (y `prefetch`) y no por el tamaño de la entrada. Los recursos se
+cargan una sola vez y quedan en caché entre lotes.
+
+Las Series (pandas, Polars, PyArrow) se convierten con la ruta vectorizada de
+cada función. Las listas y los valores sueltos no requieren un backend de
+DataFrames: se resuelve cada valor distinto con la ruta escalar, con una caché
+acotada que se comparte entre lotes (los mismos códigos se repiten mucho en
+registros administrativos).
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, Literal
+
+from . import instrumentation
+from ._utils import assert_error
+
+Campo = Literal[
+    "departamento",
+    "provincia",
+    "distrito",
+    "macrorregion",
+    "ubigeo",
+    "validate_departamento",
+    "validate_provincia",
+    "validate_distrito",
+]
+_FUNCIONES = {
+    "departamento": "get_departamento",
+    "provincia": "get_provincia",
+    "distrito": "get_distrito",
+    "macrorregion": "get_macrorregion",
+    "ubigeo": "get_ubigeo",
+    "validate_departamento": "validate_departamento",
+    "validate_provincia": "validate_provincia",
+    "validate_distrito": "validate_distrito",
+}
+_ESCALARES = (str, int, float, type(None))
+_SIN_ON_ERROR = ("get_departamento", "get_macrorregion", "get_ubigeo")
+# Entradas de la caché de valores resueltos; al llenarse se vacía
+_MAX_CACHE = 100_000
+_FIN = object()
+
+
+def _agrupar(lotes: Iterable[Any], batch_size: int) -> Iterator[Any]:
+    """
+    Junta los valores sueltos en listas de `batch_size` y deja pasar los lotes
+    (listas, tuplas o Series) tal cual, sin alterar el orden.
+    """
+    pendientes: list[Any] = []
+    for elemento in lotes:
+        if isinstance(elemento, _ESCALARES):
+            pendientes.append(elemento)
+            if len(pendientes) >= batch_size:
+                yield pendientes
+                pendientes = []
+            continue
+        if pendientes:
+            yield pendientes
+            pendientes = []
+        yield elemento
+    if pendientes:
+        yield pendientes
+
+
+class _Convertidor:
+    """Convierte un lote con la función del campo, reutilizando la caché."""
+
+    __slots__ = ("func", "kwargs", "on_error", "cache")
+
+    def __init__(self, nombre: str, kwargs: dict[str, Any]):
+        from .. import core
+
+        self.func = getattr(core, nombre)
+        self.kwargs = dict(kwargs)
+        self.on_error = self.kwargs.get("on_error", "raise")
+        if nombre in _SIN_ON_ERROR:
+            # Estas funciones no tienen on_error: se aplica aquí sin reenviarlo
+            self.kwargs.pop("on_error", None)
+        # La clave incluye el tipo para no mezclar 150101 con "150101"
+        self.cache: dict[tuple[type, Any], Any] = {}
+
+    def __call__(self, lote: Any) -> Any:
+        if instrumentation.ACTIVO:
+            instrumentation.contar("lotes_iter")
+        if not isinstance(lote, (list, tuple)):
+            return self._convertir_serie(lote)
+
+        cache = self.cache
+        if len(cache) > _MAX_CACHE:
+            cache.clear()
+        salida = []
+        for valor in lote:
+            valor = _normalizar_escalar(valor)
+            if valor is None:
+                salida.append(None)
+                continue
+            clave = (type(valor), valor)
+            try:
+                resultado = cache[clave]
+            except KeyError:
+                resultado = cache[clave] = self._resolver(valor)
+            salida.append(resultado)
+        return salida
+
+    def _convertir_serie(self, serie: Any) -> Any:
+        try:
+            return self.func(serie, **self.kwargs)
+        except KeyError:
+            if self.on_error == "raise" or "on_error" in self.kwargs:
+                raise
+        # Función sin on_error con algún código inexistente: se resuelve valor
+        # por valor para aplicar on_error y se rearma la Series del mismo backend
+        import narwhals as nw
+
+        original = nw.from_native(serie, series_only=True)
+        return nw.new_series(
+            name=original.name,
+            values=self(original.to_list()),
+            dtype=nw.String(),
+            backend=original.implementation,
+        ).to_native()
+
+    def _resolver(self, valor: Any) -> Any:
+        try:
+            return self.func(valor, **self.kwargs)
+        except KeyError as e:
+            # La ruta escalar de get_* no aplica on_error; se aplica aquí igual
+            # que en la ruta de Series
+            if self.on_error == "raise":
+                raise
+            return assert_error(
+                self.on_error,
+                evaluated=str(valor),
+                institucion=self.kwargs.get("institucion", "inei"),
+                message=str(e.args[0]) if e.args else str(e),
+            )
+
+
+def _normalizar_escalar(valor: Any) -> Any:
+    """
+    Los floats enteros (150101.0, frecuentes en cursores de bases de datos) se
+    tratan como int y NaN como nulo, igual que en la ruta de Series.
+    """
+    if not isinstance(valor, float):
+        return valor
+    if valor != valor:
+        return None
+    if not valor.is_integer():
+        raise TypeError("No se aceptan códigos con decimales")
+    return int(valor)
+
+
+def _con_prefetch(
+    lotes: Iterator[Any], convertir: Callable[[Any], Any], prefetch: int
+) -> Iterator[Any]:
+    """
+    Lee y convierte hasta `prefetch` lotes por adelantado en un hilo, mientras
+    el consumidor procesa el actual. Los errores se relanzan en el consumidor.
+    """
+    cola: queue.Queue = queue.Queue(maxsize=prefetch)
+    detener = threading.Event()
+
+    def poner(item: tuple[bool, Any]) -> bool:
+        # put con timeout, para no quedar bloqueado si el consumidor se detuvo
+        while not detener.is_set():
+            try:
+                cola.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def producir() -> None:
+        try:
+            for lote in lotes:
+                if not poner((True, convertir(lote))):
+                    return
+            poner((True, _FIN))
+        except BaseException as e:
+            poner((False, e))
+
+    hilo = threading.Thread(target=producir, name="ubigeos-prefetch", daemon=True)
+    hilo.start()
+    try:
+        while True:
+            ok, item = cola.get()
+            if not ok:
+                raise item
+            if item is _FIN:
+                return
+            yield item
+    finally:
+        # Si el consumidor corta antes (break, close), el hilo termina en cuanto
+        # intenta encolar el siguiente lote
+        detener.set()
+
+
+def iter_convert(
+    lotes: Iterable[Any],
+    field: Campo = "departamento",
+    batch_size: int = 10_000,
+    prefetch: int = 0,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Convierte una entrada grande por lotes, de forma perezosa.
+
+    Parameters
+    ----------
+    lotes : Iterable
+        Iterable de lotes (listas, tuplas o Series de pandas, Polars o PyArrow)
+        o de valores sueltos (str, int, float o None), ej. las líneas de un archivo o
+        las filas de un cursor. Los valores sueltos se agrupan en listas de
+        `batch_size`.
+    field : str, default "departamento"
+        Conversión a aplicar: "departamento", "provincia", "distrito",
+        "macrorregion" y "ubigeo" usan la función ``get_*`` correspondiente;
+        "validate_departamento", "validate_provincia" y "validate_distrito",
+        la función ``validate_*``.
+    batch_size : int, default 10_000
+        Tamaño de los lotes armados con valores sueltos. Los lotes que ya vienen
+        armados no se dividen.
+    prefetch : int, default 0
+        Lotes que un hilo lee y convierte por adelantado. Con 0 todo ocurre en
+        el hilo que consume el generador. Conviene cuando leer la entrada
+        bloquea (disco, red, base de datos).
+    **kwargs
+        Argumentos de la función del campo (institucion, normalize, on_error,
+        fuzzy_match, etc.).
+
+    Yields
+    ------
+    list or Series
+        Un resultado por lote, del mismo tipo que el lote: una lista para
+        listas, tuplas y valores sueltos, y una Series del mismo backend para
+        Series. Los None se mantienen como None.
+
+    Notes
+    -----
+    - La memoria queda acotada por `batch_size` y `prefetch`: nunca se materializa
+      la entrada completa.
+    - En las listas, cada valor distinto se resuelve una sola vez (con una caché
+      compartida entre lotes) y `on_error` se aplica por valor igual que en la
+      ruta de Series. Los floats enteros (150101.0) se tratan como códigos y NaN
+      como nulo.
+    - `on_error` también se acepta con "departamento", "macrorregion" y
+      "ubigeo", aunque sus funciones no lo tengan: se aplica a cada valor sin
+      coincidencia.
+
+    Examples
+    --------
+    >>> import ubigeos_peru as ubg
+    >>> codigos = ["150101", "080101", None, "150101"]
+    >>> list(ubg.iter_convert(codigos, field="distrito", batch_size=2))
+    [['Lima', 'Cusco'], [None, 'Lima']]
+
+    Para un archivo con un código por línea:
+
+    >>> with open("codigos.txt") as f:  # doctest: +SKIP
+    ...     lineas = (linea.strip() for linea in f)
+    ...     for lote in ubg.iter_convert(lineas, field="provincia", prefetch=2):
+    ...         procesar(lote)
+    """
+    try:
+        nombre = _FUNCIONES[field]
+    except KeyError:
+        raise ValueError(
+            f"field debe ser uno de: {', '.join(_FUNCIONES)}, se recibió '{field}'"
+        ) from None
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError("batch_size debe ser un entero positivo")
+    if not isinstance(prefetch, int) or prefetch < 0:
+        raise ValueError("prefetch debe ser un entero mayor o igual a 0")
+
+    convertir = _Convertidor(nombre, kwargs)
+    return _iterar(_agrupar(lotes, batch_size), convertir, prefetch)
+
+
+def _iterar(
+    lotes: Iterator[Any], convertir: Callable[[Any], Any], prefetch: int
+) -> Iterator[Any]:
+    # Separado de iter_convert para que los argumentos se validen al llamarla y
+    # no recién al pedir el primer lote
+    if prefetch:
+        yield from _con_prefetch(lotes, convertir, prefetch)
+    else:
+        for lote in lotes:
+            yield convertir(lote)
@@ -1,15 +1,21 @@
-from typing import Literal
+from __future__ import annotations
 
-import narwhals as nw
-from narwhals.typing import IntoSeriesT
+from typing import TYPE_CHECKING, Callable, Literal
 
+from . import instrumentation
 from ._utils import (
     assert_error,
+    codificar_diccionario,
     eliminar_acentos,
+    narwhalify_series,
 )
 from .resource_manager import ResourceManager
 from .validations import Validations
 
+if TYPE_CHECKING:
+    import narwhals as nw
+    from narwhals.typing import IntoSeriesT
+
 Levels = Literal["departamentos", "provincias", "distritos"]
 
 
@@ -53,15 +59,181 @@ class UbigeoConverter:
 
         return level
 
+    # ------------------------------------------------------------------
+    # ENTRADA MIXTA (CÓDIGOS Y NOMBRES) - SERIES
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    @instrumentation.medido("normalizacion")
+    def _normalizar_codigos(ubigeo: nw.Series) -> nw.Series:
+        """
+        Convierte una columna de ubigeos (str, enteros, enteros con nulos,
+        floats o Arrow) en str de solo dígitos, con operaciones de columna. Los
+        nulos se mantienen como nulos.
+        """
+        import narwhals as nw
+
+        # narwhalify deja pasar sin cambios lo que no es una Series (None, float, etc.)
+        if not isinstance(ubigeo, nw.Series):
+            raise TypeError("No se aceptan valores que no sean str o int")
+
+        if ubigeo.dtype.is_float():
+            # pandas guarda los enteros con NaN como float64 (150101.0)
+            nulos = ubigeo.is_null()
+            validos = ubigeo.filter(~nulos)
+            if len(validos) and not ((validos % 1) == 0).all():
+                raise TypeError("No se aceptan códigos con decimales")
+            # Se castea a entero con los nulos rellenados y se restauran al final
+            texto = ubigeo.fill_null(0).cast(nw.Int64).cast(nw.String())
+            indices_nulos = nulos.arg_true()
+            if len(indices_nulos):
+                texto = texto.scatter(
+                    indices_nulos, ubigeo.filter(nulos).cast(nw.String())
+                )
+        elif ubigeo.dtype == nw.String:
+            texto = ubigeo
+        else:
+            texto = ubigeo.cast(nw.String())
+
+        invalidos = texto.filter(
+            ~texto.str.contains(r"^\d+$").fill_null(True) & ~texto.is_null()
+        )
+        if len(invalidos):
+            raise ValueError(
+                f"El código debe contener solo dígitos, se encontró '{invalidos[0]}'"
+            )
+        return texto
+
+    @staticmethod
+    @instrumentation.medido("normalizacion")
+    def _claves_codigo(codigos: nw.Series, level: Levels) -> nw.Series:
+        """
+        Convierte una serie de códigos (str de solo dígitos) en las claves del
+        nivel, completando el cero inicial de los códigos de largo impar.
+        """
+        import narwhals as nw
+
+        largo = {"departamentos": 2, "provincias": 4, "distritos": 6}[level]
+        codigo = nw.col("codigo")
+        completo = (
+            nw.when(codigo.str.len_chars().is_in([1, 3, 5]))
+            .then(nw.concat_str(nw.lit("0"), codigo))
+            .otherwise(codigo)
+        )
+        largos = (
+            codigos.alias("codigo")
+            .to_frame()
+            .select(completo.alias("codigo"), completo.str.len_chars().alias("largo"))
+        )
+
+        if largos["largo"].count() == 0:
+            # Serie vacía o solo con nulos: no hay largos que validar
+            return largos["codigo"].alias(codigos.name)
+        if largos["largo"].max() > 6:
+            raise ValueError("No se aceptan ubigeos con más de 6 caracteres")
+        if largos["largo"].min() < largo:
+            if level == "provincias":
+                raise ValueError(
+                    "No se aceptan ubigeos con menos de 3 o 4 caracteres para provincias"
+                )
+            raise ValueError(
+                "No se aceptan ubigeos que no tengan 5 o 6 caracteres para distritos"
+            )
+
+        return largos["codigo"].str.slice(0, largo).alias(codigos.name)
+
+    @staticmethod
+    def _resolver_mixto(
+        serie: nw.Series,
+        desde_codigos: Callable[[nw.Series], nw.Series],
+        desde_nombres: Callable[[nw.Series], nw.Series],
+    ) -> nw.Series:
+        """
+        Clasifica la serie completa en códigos y nombres con una sola máscara
+        (regex de dígitos), resuelve cada sub-lote con su función vectorizada y
+        reúne los resultados en el orden original. Los nulos se mantienen.
+        """
+        import narwhals as nw
+
+        if serie.dtype.is_numeric():
+            texto = UbigeoConverter._normalizar_codigos(serie)
+        else:
+            texto = serie if serie.dtype == nw.String else serie.cast(nw.String())
+        es_codigo = texto.str.contains(r"^\d+$").fill_null(False)
+        es_nombre = ~es_codigo & ~texto.is_null()
+
+        resultado = texto
+        for mascara, resolver in (
+            (es_codigo, desde_codigos),
+            (es_nombre, desde_nombres),
+        ):
+            indices = mascara.arg_true()
+            if len(indices):
+                resultado = resultado.scatter(indices, resolver(texto.filter(mascara)))
+        return resultado
+
+    @staticmethod
+    @instrumentation.medido("busqueda")
+    def _mapear(
+        serie: nw.Series,
+        mapping: dict[str, str],
+        default: str | None = None,
+        contar: bool = True,
+    ) -> nw.Series:
+        """
+        `replace_strict` de la serie con `mapping` (o `default`), conservando los
+        nulos. Con `contar=False` no suma a las consultas de la instrumentación
+        (para pasadas repetidas sobre la misma serie).
+        """
+        import narwhals as nw
+
+        if contar and instrumentation.ACTIVO:
+            instrumentation.contar("consultas", len(serie))
+        resultado = serie.replace_strict(
+            list(mapping),
+            list(mapping.values()),
+            default=default,
+            return_dtype=nw.String(),
+        )
+        return resultado.zip_with(~serie.is_null(), serie)
+
+    @staticmethod
+    def _mapear_con_error(
+        claves: nw.Series,
+        mapping: dict[str, str],
+        on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"],
+        institucion: str,
+        message: str,
+    ) -> nw.Series:
+        """`_mapear`, aplicando `on_error` una sola vez por cada clave sin coincidencia."""
+        resultado = UbigeoConverter._mapear(claves, mapping)
+        faltantes = (
+            claves.filter(resultado.is_null() & ~claves.is_null())
+            .unique(maintain_order=True)
+            .to_list()
+        )
+        if not faltantes:
+            return resultado
+
+        extra = {}
+        for clave in faltantes:
+            valor = assert_error(
+                on_error, evaluated=clave, institucion=institucion, message=message
+            )
+            if valor is not None:
+                extra[clave] = valor
+        return (
+            UbigeoConverter._mapear(claves, {**mapping, **extra}, contar=False)
+            if extra
+            else resultado
+        )
+
     # ------------------------------------------------------------------
     # GET DEPARTAMENTO - SERIES
     # ------------------------------------------------------------------
 
     @staticmethod
-    @nw.narwhalify(
-        series_only=True,
-        eager_only=True,
-    )
+    @narwhalify_series
     def _get_departamento_series(
         ubigeo: nw.Series,
         mapping: dict[str, str],
@@ -69,22 +241,30 @@ class UbigeoConverter:
         normalize: bool,
         divide_lima: bool,
     ) -> nw.Series:
-        resultado = []
-
-        for value in ubigeo:
-            code = UbigeoConverter._validate_codigo(value)
+        import narwhals as nw
 
-            dept_key = code[:2]
+        codigos = UbigeoConverter._normalizar_codigos(ubigeo)
+        claves = UbigeoConverter._claves_codigo(codigos, "departamentos")
+        resultado = UbigeoConverter._mapear(claves, mapping)
 
-            try:
-                dept = mapping[dept_key]
-            except KeyError:
-                raise KeyError(
-                    f"El código de ubigeo {code} no se encontró en la base de datos"
-                )
+        faltantes = codigos.filter(resultado.is_null() & ~codigos.is_null())
+        if len(faltantes):
+            raise KeyError(
+                f"El código de ubigeo {faltantes[0]} no se encontró en la base de datos"
+            )
 
-            if divide_lima and dept == "Lima":
-                if len(code) < 4:
+        if divide_lima:
+            claves_lima = [
+                clave
+                for clave, dept in mapping.items()
+                if eliminar_acentos(dept).upper() == "LIMA"
+            ]
+            es_lima = claves.is_in(claves_lima).fill_null(False)
+            indices = es_lima.arg_true()
+
+            if len(indices):
+                lima = codigos.filter(es_lima)
+                if lima.str.len_chars().min() < 3:
                     raise ValueError(
                         "Para distinguir Lima Metropolitana "
                         "y Lima Región, el ubigeo debe tener "
@@ -94,20 +274,19 @@ class UbigeoConverter:
                 if provincias is None:
                     raise RuntimeError("No se cargó el diccionario de provincias")
 
-                prov = provincias[code[:4]]
+                metropolitana = [c for c, prov in provincias.items() if prov == "Lima"]
+                nombres = ["Lima Metropolitana", "Lima Región"]
+                if normalize:
+                    nombres = [eliminar_acentos(n).upper() for n in nombres]
 
-                dept = "Lima Metropolitana" if prov == "Lima" else "Lima Región"
-
-            if normalize:
-                dept = eliminar_acentos(dept).upper()
+                valores = (
+                    UbigeoConverter._claves_codigo(lima, "provincias")
+                    .is_in(metropolitana)
+                    .replace_strict([True, False], nombres, return_dtype=nw.String())
+                )
+                resultado = resultado.scatter(indices, valores)
 
-            resultado.append(dept)
-
-        return nw.new_series(
-            name=ubigeo.name,
-            values=resultado,
-            backend=ubigeo.implementation,
-        )
+        return codificar_diccionario(resultado.alias(ubigeo.name), ubigeo)
 
     # ------------------------------------------------------------------
     # GET DEPARTAMENTO
@@ -126,15 +305,18 @@ class UbigeoConverter:
         normalize: bool = False,
     ) -> str | IntoSeriesT:
 
-        cls._resources.cargar_diccionario("departamentos")
+        mapping = cls._resources.cargar_diccionario("departamentos", institucion)
 
-        if divide_lima:
-            cls._resources.cargar_diccionario("provincias")
-
-        mapping = cls._resources._loaded["departamentos"][institucion]
+        provincias = (
+            cls._resources.cargar_diccionario("provincias", institucion)
+            if divide_lima
+            else None
+        )
 
         if isinstance(ubigeo, (str, int)):
             code = cls._validate_codigo(ubigeo)
+            if instrumentation.ACTIVO:
+                instrumentation.contar("consultas")
 
             try:
                 dept = mapping[code[:2]]
@@ -151,22 +333,18 @@ class UbigeoConverter:
                         "al menos 3 dígitos"
                     )
 
-                prov = cls._resources._loaded["provincias"][institucion][code[:4]]
+                prov = provincias[code[:4]]
 
                 dept = "Lima Metropolitana" if prov == "Lima" else "Lima Región"
 
             return eliminar_acentos(dept).upper() if normalize else dept
 
         mapping_series = (
-            {k: eliminar_acentos(v).upper() for k, v in mapping.items()}
+            cls._resources.cargar_normalizado("departamentos", institucion)
             if normalize
             else mapping
         )
 
-        provincias = (
-            cls._resources._loaded["provincias"][institucion] if divide_lima else None
-        )
-
         return cls._get_departamento_series(
             ubigeo,
             mapping_series,
@@ -180,45 +358,24 @@ class UbigeoConverter:
     # ------------------------------------------------------------------
 
     @staticmethod
-    @nw.narwhalify(
-        series_only=True,
-        eager_only=True,
-    )
+    @narwhalify_series
     def _get_provincia_series(
         ubigeo: nw.Series,
         mapping: dict[str, str],
         institucion: str,
         on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"],
     ) -> nw.Series:
-        resultado = []
-
-        for value in ubigeo:
-            code = UbigeoConverter._validate_codigo(value)
-
-            if len(code) < 4:
-                raise ValueError(
-                    "No se aceptan ubigeos con menos de 3 o 4 caracteres para provincias"
-                )
-
-            prov_key = code[:4]
-
-            try:
-                prov = mapping[prov_key]
-            except KeyError:
-                prov = assert_error(
-                    on_error,
-                    evaluated=prov_key,
-                    institucion=institucion,
-                    message="El código de ubigeo {} no se encontró en la base de datos de provincias de {}",
-                )
-
-            resultado.append(prov)
-
-        return nw.new_series(
-            name=ubigeo.name,
-            values=resultado,
-            backend=ubigeo.implementation,
+        codigos = UbigeoConverter._normalizar_codigos(ubigeo)
+        claves = UbigeoConverter._claves_codigo(codigos, "provincias")
+
+        resultado = UbigeoConverter._mapear_con_error(
+            claves,
+            mapping,
+            on_error,
+            institucion,
+            message="El código de ubigeo {} no se encontró en la base de datos de provincias de {}",
         )
+        return codificar_diccionario(resultado.alias(ubigeo.name), ubigeo)
 
     # ------------------------------------------------------------------
     # GET PROVINCIA
@@ -232,9 +389,7 @@ class UbigeoConverter:
         on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
         normalize: bool = False,
     ) -> str | IntoSeriesT:
-        cls._resources.cargar_diccionario("provincias")
-
-        mapping = cls._resources._loaded["provincias"][institucion]
+        mapping = cls._resources.cargar_diccionario("provincias", institucion)
 
         if isinstance(ubigeo, (str, int)):
             code = cls._validate_codigo(ubigeo)
@@ -242,6 +397,8 @@ class UbigeoConverter:
                 raise ValueError(
                     "No se aceptan ubigeos con menos de 3 o 4 caracteres para provincias"
                 )
+            if instrumentation.ACTIVO:
+                instrumentation.contar("consultas")
 
             try:
                 result = mapping[code[:4]]
@@ -253,7 +410,7 @@ class UbigeoConverter:
             return eliminar_acentos(result).upper() if normalize else result
 
         mapping_series = (
-            {k: eliminar_acentos(v).upper() for k, v in mapping.items()}
+            cls._resources.cargar_normalizado("provincias", institucion)
             if normalize
             else mapping
         )
@@ -265,45 +422,24 @@ class UbigeoConverter:
     # ------------------------------------------------------------------
 
     @staticmethod
-    @nw.narwhalify(
-        series_only=True,
-        eager_only=True,
-    )
+    @narwhalify_series
     def _get_distrito_series(
         ubigeo: nw.Series,
         mapping: dict[str, str],
         institucion: str,
         on_error: Literal["raise", "warn", "coerce", "ignore", "capitalize"],
     ) -> nw.Series:
-        resultado = []
-
-        for value in ubigeo:
-            code = UbigeoConverter._validate_codigo(value)
-
-            if len(code) not in (5, 6):
-                raise ValueError(
-                    "No se aceptan ubigeos que no tengan 5 o 6 caracteres para distritos"
-                )
-
-            dist_key = code[:6]
-
-            try:
-                dist = mapping[dist_key]
-            except KeyError:
-                dist = assert_error(
-                    on_error,
-                    evaluated=dist_key,
-                    institucion=institucion,
-                    message="El código de ubigeo {} no se encontró en la base de datos de distritos de {}",
-                )
-
-            resultado.append(dist)
-
-        return nw.new_series(
-            name=ubigeo.name,
-            values=resultado,
-            backend=ubigeo.implementation,
+        codigos = UbigeoConverter._normalizar_codigos(ubigeo)
+        claves = UbigeoConverter._claves_codigo(codigos, "distritos")
+
+        resultado = UbigeoConverter._mapear_con_error(
+            claves,
+            mapping,
+            on_error,
+            institucion,
+            message="El código de ubigeo {} no se encontró en la base de datos de distritos de {}",
         )
+        return codificar_diccionario(resultado.alias(ubigeo.name), ubigeo)
 
     # ------------------------------------------------------------------
     # GET DISTRITO
@@ -317,9 +453,7 @@ class UbigeoConverter:
         on_error: Literal["raise", "warn", "coerce", "ignore", "capitalize"] = "raise",
         normalize: bool = False,
     ) -> str | IntoSeriesT:
-        cls._resources.cargar_diccionario("distritos")
-
-        mapping = cls._resources._loaded["distritos"][institucion]
+        mapping = cls._resources.cargar_diccionario("distritos", institucion)
 
         if isinstance(ubigeo, (str, int)):
             code = cls._validate_codigo(ubigeo)
@@ -327,6 +461,8 @@ class UbigeoConverter:
                 raise ValueError(
                     "No se aceptan ubigeos que no tengan 5 o 6 caracteres para distritos"
                 )
+            if instrumentation.ACTIVO:
+                instrumentation.contar("consultas")
             try:
                 result = mapping[code]
             except KeyError:
@@ -337,7 +473,7 @@ class UbigeoConverter:
             return eliminar_acentos(result).upper() if normalize else result
 
         mapping_series = (
-            {k: eliminar_acentos(v).upper() for k, v in mapping.items()}
+            cls._resources.cargar_normalizado("distritos", institucion)
             if normalize
             else mapping
         )
@@ -349,47 +485,49 @@ class UbigeoConverter:
     # ------------------------------------------------------------------
 
     @staticmethod
-    @nw.narwhalify(
-        series_only=True,
-        eager_only=True,
-    )
+    @narwhalify_series
     def _get_macrorregion_series(
         departamento_o_ubigeo: nw.Series,
         mapping: dict[str, str],
         institucion: Literal["inei", "minsa", "ceplan"],
     ) -> nw.Series:
-        resultado = []
+        import narwhals as nw
 
-        for item in departamento_o_ubigeo:
-            if isinstance(item, str):
-                if not item[0].isdigit():
-                    departamento = Validations.validate_departamento(
-                        item, normalize=False
-                    )
-                else:
-                    departamento = UbigeoConverter.get_departamento(
-                        item, institucion=institucion, normalize=False
-                    )
-            elif isinstance(item, int):
-                departamento = UbigeoConverter.get_departamento(
-                    item, institucion=institucion, normalize=False
-                )
-            else:
-                raise TypeError(
-                    "Solo se acepta el nombre del departamento o su código de ubigeo"
-                )
+        # Los códigos de departamento son los mismos en todas las instituciones
+        departamentos = ResourceManager.cargar_diccionario("departamentos", "inei")
 
-            try:
-                resultado.append(mapping[departamento])
-            except KeyError:
+        def desde_codigos(codigos: nw.Series) -> nw.Series:
+            claves = UbigeoConverter._claves_codigo(codigos, "departamentos")
+            nombres = UbigeoConverter._mapear(claves, departamentos)
+            faltantes = claves.filter(nombres.is_null())
+            if len(faltantes):
                 raise KeyError(
-                    f"El departamento '{departamento}' no se encontró en la base de datos de macrorregiones de {institucion.upper()}"
+                    f"El código de ubigeo {faltantes[0]} no se encontró en la base de datos"
                 )
+            return nombres
+
+        def desde_nombres(nombres: nw.Series) -> nw.Series:
+            # Con fuzzy_report se omite el print del fuzzy match (se descarta el
+            # reporte). Con PyArrow validate_* devuelve un diccionario; aquí se
+            # necesitan str
+            serie, _ = Validations.validate_departamento(
+                nombres.to_native(), normalize=False, fuzzy_report=True
+            )
+            return nw.from_native(serie, series_only=True).cast(nw.String())
 
-        return nw.new_series(
-            name=departamento_o_ubigeo.name,
-            values=resultado,
-            backend=departamento_o_ubigeo.implementation,
+        departamento = UbigeoConverter._resolver_mixto(
+            departamento_o_ubigeo, desde_codigos, desde_nombres
+        )
+
+        resultado = UbigeoConverter._mapear(departamento, mapping)
+        faltantes = departamento.filter(resultado.is_null() & ~departamento.is_null())
+        if len(faltantes):
+            raise KeyError(
+                f"El departamento '{faltantes[0]}' no se encontró en la base de datos de macrorregiones de {institucion.upper()}"
+            )
+
+        return codificar_diccionario(
+            resultado.alias(departamento_o_ubigeo.name), departamento_o_ubigeo
         )
 
     # ------------------------------------------------------------------
@@ -403,8 +541,7 @@ class UbigeoConverter:
         institucion: Literal["inei", "minsa", "ceplan"] = "inei",
         normalize: bool = False,
     ) -> str | IntoSeriesT:
-        cls._resources.cargar_diccionario("macrorregiones")
-        mapping = cls._resources._loaded["macrorregiones"][institucion]
+        mapping = cls._resources.cargar_diccionario("macrorregiones", institucion)
 
         if isinstance(departamento_o_ubigeo, (str, int)):
             if isinstance(departamento_o_ubigeo, str):
@@ -414,13 +551,15 @@ class UbigeoConverter:
                     )
                 else:
                     departamento = cls.get_departamento(
-                        departamento_o_ubigeo, institucion=institucion, normalize=False
+                        departamento_o_ubigeo, normalize=False
                     )
             else:
                 departamento = cls.get_departamento(
-                    departamento_o_ubigeo, institucion=institucion, normalize=False
+                    departamento_o_ubigeo, normalize=False
                 )
 
+            if instrumentation.ACTIVO:
+                instrumentation.contar("consultas")
             try:
                 resultado = mapping[departamento]
             except KeyError:
@@ -431,7 +570,7 @@ class UbigeoConverter:
             return eliminar_acentos(resultado).upper() if normalize else resultado
 
         mapping_series = (
-            {k: eliminar_acentos(v).upper() for k, v in mapping.items()}
+            cls._resources.cargar_normalizado("macrorregiones", institucion)
             if normalize
             else mapping
         )
@@ -445,19 +584,20 @@ class UbigeoConverter:
     # ------------------------------------------------------------------
 
     @staticmethod
-    @nw.narwhalify(
-        series_only=True,
-        eager_only=True,
-    )
+    @narwhalify_series
     def _get_ubigeo_series(
         ubicacion: nw.Series,
         mapping: dict[str, str],
         institucion: str,
         level: Levels,
     ) -> nw.Series:
+        import narwhals as nw
+
+        # Se resuelven los valores distintos y al final se mapea la serie completa
+        unicos = ubicacion.unique(maintain_order=True).to_list()
         resultado = []
 
-        for item in ubicacion:
+        for item in unicos:
             try:
                 item_normalized = eliminar_acentos(str(item)).upper().strip()
             except TypeError:
@@ -466,11 +606,17 @@ class UbigeoConverter:
                 )
 
             if level == "provincias":
-                lugar_clean = Validations.validate_provincia(item_normalized)
+                lugar_clean = Validations.validate_provincia(
+                    item_normalized, normalize=True
+                )
             elif level == "distritos":
-                lugar_clean = Validations.validate_distrito(item_normalized)
+                lugar_clean = Validations.validate_distrito(
+                    item_normalized, normalize=True
+                )
             else:
-                lugar_clean = Validations.validate_departamento(item_normalized)
+                lugar_clean = Validations.validate_departamento(
+                    item_normalized, normalize=True
+                )
 
             try:
                 resultado.append(mapping[lugar_clean])
@@ -479,11 +625,20 @@ class UbigeoConverter:
                     f"El lugar '{item}' no se encontró en la base de datos de '{level}' de de {institucion.upper()}"
                 )
 
-        return nw.new_series(
-            name=ubicacion.name,
-            values=resultado,
-            backend=ubicacion.implementation,
-        )
+        if instrumentation.ACTIVO:
+            instrumentation.contar("consultas", len(ubicacion))
+        with instrumentation.medir("series"):
+            if not unicos:
+                return nw.new_series(
+                    name=ubicacion.name,
+                    values=[],
+                    dtype=nw.String(),
+                    backend=ubicacion.implementation,
+                )
+            codigos = ubicacion.replace_strict(
+                unicos, resultado, return_dtype=nw.String()
+            )
+        return codificar_diccionario(codigos, ubicacion)
 
     # ------------------------------------------------------------------
     # GET UBIGEO
@@ -497,8 +652,7 @@ class UbigeoConverter:
         institucion: Literal["inei", "reniec", "sunat"] = "inei",
     ) -> str | IntoSeriesT:
         level = cls._validate_level(level)
-        cls._resources.cargar_diccionario("inverted")
-        mapping = cls._resources._loaded["inverted"][level][institucion]
+        mapping = cls._resources.cargar_diccionario("inverted", level, institucion)
 
         if isinstance(ubicacion, str):
             try:
@@ -507,6 +661,8 @@ class UbigeoConverter:
                 raise TypeError(
                     "El lugar debe ser un str, no se aceptan números u otros tipos de datos"
                 )
+            if instrumentation.ACTIVO:
+                instrumentation.contar("consultas")
 
             try:
                 return mapping[ubicacion_normalized]
@@ -522,10 +678,7 @@ class UbigeoConverter:
     # ------------------------------------------------------------------
 
     @staticmethod
-    @nw.narwhalify(
-        series_only=True,
-        eager_only=True,
-    )
+    @narwhalify_series
     def _get_metadato_series(
         codigo_o_ubicacion: nw.Series,
         mapping: dict[str, dict[str, str]],
@@ -533,54 +686,46 @@ class UbigeoConverter:
         key: Literal["altitud", "capital", "latitud", "longitud", "superficie"],
         institucion: Literal["inei", "reniec", "sunat"],
     ) -> nw.Series:
-        resultado = []
-
-        for item in codigo_o_ubicacion:
-            if isinstance(item, str):
-                if not item[0].isdigit():
-                    if level == "departamentos":
-                        ubicacion = Validations.validate_departamento(
-                            item, normalize=False, on_error="ignore"
-                        )
-                    elif level == "provincias":
-                        ubicacion = Validations.validate_provincia(
-                            item, normalize=False, on_error="ignore"
-                        )
-                    else:
-                        ubicacion = Validations.validate_distrito(
-                            item, normalize=False, on_error="ignore"
-                        )
-                else:
-                    ubicacion = UbigeoConverter.get_ubigeo(item, level, institucion)
-            elif isinstance(item, int):
-                if level == "departamentos":
-                    ubicacion = UbigeoConverter.get_departamento(
-                        item, institucion=institucion
-                    )
-                elif level == "provincias":
-                    ubicacion = UbigeoConverter.get_provincia(
-                        item, institucion=institucion
-                    )
-                else:
-                    ubicacion = UbigeoConverter.get_distrito(
-                        item, institucion=institucion
-                    )
-            else:
-                raise TypeError(
-                    "Solo se acepta el nombre de la ubicacion o su código de ubigeo"
+        import narwhals as nw
+
+        oficiales = ResourceManager.cargar_diccionario(level, institucion)
+        validar = {
+            "departamentos": Validations.validate_departamento,
+            "provincias": Validations.validate_provincia,
+            "distritos": Validations.validate_distrito,
+        }[level]
+
+        def desde_codigos(codigos: nw.Series) -> nw.Series:
+            claves = UbigeoConverter._claves_codigo(codigos, level)
+            nombres = UbigeoConverter._mapear(claves, oficiales)
+            faltantes = claves.filter(nombres.is_null())
+            if len(faltantes):
+                raise KeyError(
+                    f"El código de ubigeo {faltantes[0]} no se encontró en la base de datos de {level} de {institucion.upper()}"
                 )
+            return nombres
+
+        def desde_nombres(nombres: nw.Series) -> nw.Series:
+            # Con fuzzy_report se omite el print del fuzzy match
+            serie, _ = validar(
+                nombres.to_native(),
+                normalize=False,
+                on_error="ignore",
+                fuzzy_report=True,
+            )
+            return nw.from_native(serie, series_only=True).cast(nw.String())
 
-            ubicacion_normalized = eliminar_acentos(ubicacion).upper()
-
-            try:
-                resultado.append(mapping[ubicacion_normalized][key])
-            except KeyError:
-                resultado.append("")
+        ubicacion = UbigeoConverter._resolver_mixto(
+            codigo_o_ubicacion, desde_codigos, desde_nombres
+        )
 
-        return nw.new_series(
-            name=codigo_o_ubicacion.name,
-            values=resultado,
-            backend=codigo_o_ubicacion.implementation,
+        valores = {
+            item: mapping.get(eliminar_acentos(item).upper(), {}).get(key, "")
+            for item in ubicacion.drop_nulls().unique().to_list()
+        }
+        resultado = UbigeoConverter._mapear(ubicacion, valores, default="")
+        return codificar_diccionario(
+            resultado.alias(codigo_o_ubicacion.name), codigo_o_ubicacion
         )
 
     # ------------------------------------------------------------------
@@ -598,8 +743,7 @@ class UbigeoConverter:
         institucion: Literal["inei", "reniec", "sunat"] = "inei",
     ) -> str | IntoSeriesT:
         level = cls._validate_level(level)
-        cls._resources.cargar_diccionario("otros")
-        mapping = cls._resources._loaded["otros"][level]
+        mapping = cls._resources.cargar_diccionario("otros", level)
 
         if not isinstance(key, str):
             raise TypeError(
@@ -643,6 +787,8 @@ class UbigeoConverter:
                     )
 
             ubicacion = eliminar_acentos(ubicacion).upper()
+            if instrumentation.ACTIVO:
+                instrumentation.contar("consultas")
 
             try:
                 return mapping[ubicacion][key]
@@ -1,15 +1,31 @@
-from typing import Literal
+from __future__ import annotations
 
-import narwhals as nw
-from narwhals.typing import IntoSeriesT
+from typing import TYPE_CHECKING, Literal, Optional
 
+from . import instrumentation
 from ._utils import (
+    Scorer,
     assert_error,
+    clave_fonetica,
+    codificar_diccionario,
     eliminar_acentos,
     fuzzy_validate,
+    narwhalify_series,
+    resolver_scorer,
+    validar_score_cutoff,
 )
 from .resource_manager import ResourceManager
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import narwhals as nw
+    from narwhals.typing import IntoDataFrameT, IntoSeriesT
+
+
+# score_cutoff de validate_* cuando no se indica uno
+_SCORE_CUTOFF = 80
+
 
 class Validations:
     _resources = ResourceManager()
@@ -24,66 +40,206 @@ class Validations:
     # ------------------------------------------------------------------
 
     @staticmethod
-    @nw.narwhalify(
-        series_only=True,
-        eager_only=True,
-    )
+    @narwhalify_series
     def _validate_generic_series(
         value: nw.Series,
         mapping: dict[str, str],
+        entity_type: Literal["departamentos", "provincias", "distritos"],
         error_message: str,
         fuzzy_match: bool,
         institucion: str,
         on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"],
-    ) -> nw.Series:
-        resultado = []
-        fuzzy_matched = set()
-
-        for item in value:
-            if not isinstance(item, str) or item.isdigit():
-                raise TypeError(
-                    f"No se permiten otros tipos de datos que no sean str, se insertó {type(item)}"
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        fuzzy_report: bool = False,
+        score_cutoff: float = 80,
+        scorer: Scorer = "WRatio",
+        phonetic: bool = True,
+    ) -> nw.Series | tuple[IntoSeriesT, IntoDataFrameT]:
+        import narwhals as nw
+
+        from ._executor import fuzzy_validate_many
+
+        if instrumentation.ACTIVO:
+            instrumentation.contar("consultas", len(value))
+
+        # Se trabaja sobre los valores distintos y al final se mapea la serie completa
+        with instrumentation.medir("normalizacion"):
+            unicos = value.unique(maintain_order=True).to_list()
+
+            limpios = {}
+            for item in unicos:
+                if not isinstance(item, str) or item.isdigit():
+                    raise TypeError(
+                        f"No se permiten otros tipos de datos que no sean str, se insertó {type(item)}"
+                    )
+                limpios[item] = eliminar_acentos(item).strip().upper()
+
+        # Intentar fuzzy matching (en paralelo si se indica) solo con lo que no
+        # tiene coincidencia directa
+        matches = {}
+        if fuzzy_match:
+            pendientes = list(
+                dict.fromkeys(
+                    item_limpio
+                    for item_limpio in limpios.values()
+                    if item_limpio not in mapping
                 )
+            )
+            with instrumentation.medir("fuzzy"):
+                # Primero el índice fonético (O(1) por valor); lo que no resuelve
+                # pasa a rapidfuzz
+                if phonetic:
+                    for item_limpio in pendientes:
+                        match = Validations._match_fonetico(
+                            item_limpio, entity_type, scorer
+                        )
+                        if match is not None:
+                            matches[item_limpio] = match
+                if instrumentation.ACTIVO and matches:
+                    instrumentation.contar("foneticos", len(matches))
+                pendientes = [p for p in pendientes if p not in matches]
+                matches.update(
+                    zip(
+                        pendientes,
+                        fuzzy_validate_many(
+                            pendientes,
+                            entity_type,
+                            n_jobs=n_jobs,
+                            executor=executor,
+                            score_cutoff=score_cutoff,
+                            scorer=scorer,
+                        ),
+                    )
+                )
+            if instrumentation.ACTIVO and pendientes:
+                aceptados = sum(matches[p] is not None for p in pendientes)
+                instrumentation.contar("fuzzy_llamadas", len(pendientes))
+                instrumentation.contar("fuzzy_aceptados", aceptados)
+                instrumentation.contar("fuzzy_rechazados", len(pendientes) - aceptados)
 
-            item_limpio = eliminar_acentos(item).strip().upper()
+        with instrumentation.medir("busqueda"):
+            resultado = {}
+            # valor original -> (clave encontrada, score)
+            fuzzy_matched = {}
 
-            # Intentar búsqueda directa
-            try:
-                resultado.append(mapping[item_limpio])
-                continue
-            except KeyError:
-                pass
+            for item, item_limpio in limpios.items():
+                # Intentar búsqueda directa
+                try:
+                    resultado[item] = mapping[item_limpio]
+                    continue
+                except KeyError:
+                    pass
 
-            # Intentar fuzzy matching
-            if fuzzy_match:
-                match = fuzzy_validate(item_limpio, list(mapping.keys()), limit=1)
+                match = matches.get(item_limpio)
                 if match:
-                    match_limpio = eliminar_acentos(match).upper()
-                    resultado.append(mapping[match_limpio])
-                    fuzzy_matched.add((item_limpio, match_limpio))
+                    match_limpio = eliminar_acentos(match[0]).upper()
+                    resultado[item] = mapping[match_limpio]
+                    fuzzy_matched[item] = (match_limpio, match[1])
                     continue
 
-            # Manejo de errores
-            valor_error = assert_error(
-                on_error,
-                evaluated=item_limpio,
-                message=error_message,
-                institucion=institucion,
+                # Manejo de errores
+                resultado[item] = assert_error(
+                    on_error,
+                    evaluated=item_limpio,
+                    message=error_message,
+                    institucion=institucion,
+                )
+
+        if fuzzy_matched and not fuzzy_report:
+            # Un solo print con los pares distintos (valor limpio -> clave)
+            pares = dict.fromkeys(
+                f"{limpios[original]} -> {match}"
+                for original, (match, _) in fuzzy_matched.items()
+            )
+            print(
+                "Los siguientes valores fueron obtenidos con fuzzy match. Validar:\n"
+                + "\n".join(pares)
             )
-            resultado.append(valor_error)
 
-        # Imprimir fuzzy matches
-        if fuzzy_matched:
-            print("Los siguientes valores fueron obtenidos con fuzzy match. Validar:")
-            for original, matched in fuzzy_matched:
-                print(f"{original} -> {matched}")
+        with instrumentation.medir("series"):
+            if not resultado:
+                serie = nw.new_series(
+                    name=value.name,
+                    values=[],
+                    dtype=nw.String(),
+                    backend=value.implementation,
+                )
+            else:
+                serie = value.replace_strict(
+                    list(resultado.keys()),
+                    list(resultado.values()),
+                    return_dtype=nw.String(),
+                )
+        serie = codificar_diccionario(serie, value)
 
-        return nw.new_series(
-            name=value.name,
-            values=resultado,
+        if not fuzzy_report:
+            return serie
+        # narwhalify no convierte tuplas: se devuelven ya en formato nativo
+        reporte = Validations._reporte_fuzzy(value, fuzzy_matched)
+        return serie.to_native(), reporte.to_native()
+
+    @staticmethod
+    def _reporte_fuzzy(
+        value: nw.Series, fuzzy_matched: dict[str, tuple[str, float]]
+    ) -> nw.DataFrame:
+        """
+        Reporte de los reemplazos por fuzzy matching, una fila por valor original
+        distinto: "original", "match" (clave de equivalencias encontrada),
+        "score" (0-100) y "filas" (filas de la serie con ese valor).
+        """
+        import narwhals as nw
+
+        originales = list(fuzzy_matched)
+        filas = {}
+        if originales:
+            afectados = value.filter(value.is_in(originales).fill_null(False))
+            conteos = afectados.alias("original").value_counts()
+            filas = dict(zip(conteos["original"].to_list(), conteos["count"].to_list()))
+
+        return nw.from_dict(
+            {
+                "original": originales,
+                "match": [match for match, _ in fuzzy_matched.values()],
+                "score": [score for _, score in fuzzy_matched.values()],
+                "filas": [filas.get(original, 0) for original in originales],
+            },
+            schema={
+                "original": nw.String(),
+                "match": nw.String(),
+                "score": nw.Float64(),
+                "filas": nw.Int64(),
+            },
             backend=value.implementation,
         )
 
+    @classmethod
+    def _match_fonetico(
+        cls,
+        item_limpio: str,
+        entity_type: Literal["departamentos", "provincias", "distritos"],
+        scorer: Scorer = "WRatio",
+    ) -> Optional[tuple[str, float]]:
+        """
+        Coincidencia por clave fonética: (clave de equivalencias, score).
+
+        No aplica `score_cutoff`: dos grafías que suenan igual se aceptan aunque
+        difieran en varias letras (ej. "WANUKO" y "HUANUCO"). Por eso solo se usa
+        con `phonetic=True` (por defecto, cuando no se pasa `score_cutoff`). El
+        score se calcula solo para informarlo en el reporte.
+        """
+        indice = cls._resources.cargar_indice_fonetico(entity_type)
+        clave = indice.get(clave_fonetica(item_limpio))
+        if clave is None:
+            return None
+
+        from rapidfuzz import utils
+
+        score = resolver_scorer(scorer)(
+            utils.default_process(item_limpio), utils.default_process(clave)
+        )
+        return clave, float(score)
+
     # ------------------------------------------------------------------
     # VALIDATE GENERIC
     # ------------------------------------------------------------------
@@ -97,7 +253,13 @@ class Validations:
         normalize: bool = False,
         fuzzy_match: bool = True,
         on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-    ) -> str | IntoSeriesT:
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        fuzzy_report: bool = False,
+        score_cutoff: Optional[float] = None,
+        scorer: Scorer = "WRatio",
+        phonetic: Optional[bool] = None,
+    ) -> str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]:
         """
         Función genérica para validar departamentos, provincias o distritos.
 
@@ -113,19 +275,40 @@ class Validations:
             Si True, normaliza (elimina acentos y convierte a mayúsculas) el resultado.
             Por defecto False.
         fuzzy_match : bool, optional
-            Si True, intenta una búsqueda difusa (fuzzy matching) cuando no hay
-            coincidencia exacta. Por defecto True.
+            Si True, cuando no hay coincidencia exacta busca por clave fonética
+            (ver `clave_fonetica`) y, si tampoco hay, con fuzzy matching. Por
+            defecto True.
         on_error : {'raise', 'warn', 'ignore', 'capitalize', 'coerce'}, optional
             Comportamiento ante errores. Por defecto 'raise'.
+        n_jobs : int, optional
+            Solo para series. Número de procesos para el fuzzy matching de los
+            valores distintos; -1 usa todos los CPUs. Por defecto None (un proceso).
+        executor : concurrent.futures.Executor, optional
+            Solo para series. Executor externo a reutilizar en lugar de crear un
+            `ProcessPoolExecutor` en cada llamada.
+        fuzzy_report : bool, optional
+            Solo para series. Si True, no imprime los reemplazos por fuzzy
+            matching y devuelve además un DataFrame (del mismo backend) con una
+            fila por valor reemplazado: "original", "match", "score" y "filas".
+        score_cutoff : float, optional
+            Score mínimo (0-100) para aceptar una coincidencia aproximada. Se
+            pasa a rapidfuzz, que descarta antes las opciones que no pueden
+            alcanzarlo: un umbral alto es más rápido. Por defecto None, que usa 80.
+        scorer : str | Callable, optional
+            Scorer de rapidfuzz, por nombre ("WRatio", "ratio",
+            "token_sort_ratio", etc.) o como función. Por defecto "WRatio".
+        phonetic : bool, optional
+            Si se busca por clave fonética antes del fuzzy matching. Esas
+            coincidencias no pasan por `score_cutoff`, así que por defecto
+            (None) solo se usan si no se indicó un `score_cutoff`.
 
         Returns
         -------
-        str | IntoSeriesT
+        str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]
             Valor o serie de valores validados. Si `normalize` es True, devuelve
-            los valores normalizados.
+            los valores normalizados. Con `fuzzy_report`, la tupla (serie, reporte).
         """
-        cls._resources.cargar_diccionario("equivalencias")
-        mapping = cls._resources._loaded["equivalencias"][entity_type]
+        mapping = cls._resources.cargar_diccionario("equivalencias", entity_type)
 
         # Mensajes de error personalizados
         error_messages = {
@@ -135,20 +318,44 @@ class Validations:
         }
         error_message = error_messages[entity_type]
 
+        # Un umbral explícito no debe saltarse con las coincidencias fonéticas
+        if phonetic is None:
+            phonetic = score_cutoff is None
+        if score_cutoff is None:
+            score_cutoff = _SCORE_CUTOFF
+        if fuzzy_match:
+            validar_score_cutoff(score_cutoff)
+            resolver_scorer(scorer)
+
         # ------------------------ Input: Singular ------------------------
         if isinstance(value, str):
             item_limpio = eliminar_acentos(value).strip().upper()
             resultado = None
 
             # Intentar búsqueda directa
+            if instrumentation.ACTIVO:
+                instrumentation.contar("consultas")
             try:
                 resultado = mapping[item_limpio]
             except KeyError:
                 # Intentar fuzzy matching si no se encontró
-                if fuzzy_match:
-                    resultado_fuzzy = fuzzy_validate(
-                        item_limpio, list(mapping.keys()), limit=1
-                    )
+                if fuzzy_match and phonetic:
+                    match = cls._match_fonetico(item_limpio, entity_type, scorer)
+                    if match is not None:
+                        if instrumentation.ACTIVO:
+                            instrumentation.contar("foneticos")
+                        resultado = mapping[match[0]]
+                if fuzzy_match and resultado is None:
+                    indice = cls._resources.cargar_indice_fuzzy(entity_type)
+                    with instrumentation.medir("fuzzy"):
+                        resultado_fuzzy = fuzzy_validate(
+                            item_limpio, indice, score_cutoff, scorer
+                        )
+                    if instrumentation.ACTIVO:
+                        instrumentation.contar("fuzzy_llamadas")
+                        instrumentation.contar(
+                            "fuzzy_aceptados" if resultado_fuzzy else "fuzzy_rechazados"
+                        )
                     if resultado_fuzzy:
                         resultado_limpio = eliminar_acentos(resultado_fuzzy).upper()
                         resultado = mapping[resultado_limpio]
@@ -170,7 +377,7 @@ class Validations:
 
         # ---------------------- Input: Series-like ----------------------
         mapping_series = (
-            {k: eliminar_acentos(v).upper() for k, v in mapping.items()}
+            cls._resources.cargar_normalizado("equivalencias", entity_type)
             if normalize
             else mapping
         )
@@ -178,10 +385,17 @@ class Validations:
         return cls._validate_generic_series(
             value,
             mapping=mapping_series,
+            entity_type=entity_type,
             error_message=error_message,
             fuzzy_match=fuzzy_match,
             institucion=institucion,
             on_error=on_error,
+            n_jobs=n_jobs,
+            executor=executor,
+            fuzzy_report=fuzzy_report,
+            score_cutoff=score_cutoff,
+            scorer=scorer,
+            phonetic=phonetic,
         )
 
     @classmethod
@@ -192,7 +406,13 @@ class Validations:
         normalize: bool = False,
         fuzzy_match: bool = True,
         on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-    ) -> str | IntoSeriesT:
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        fuzzy_report: bool = False,
+        score_cutoff: Optional[float] = None,
+        scorer: Scorer = "WRatio",
+        phonetic: Optional[bool] = None,
+    ) -> str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]:
         return cls._validate_generic(
             value=departamento,
             entity_type="departamentos",
@@ -200,6 +420,12 @@ class Validations:
             normalize=normalize,
             fuzzy_match=fuzzy_match,
             on_error=on_error,
+            n_jobs=n_jobs,
+            executor=executor,
+            fuzzy_report=fuzzy_report,
+            score_cutoff=score_cutoff,
+            scorer=scorer,
+            phonetic=phonetic,
         )
 
     @classmethod
@@ -210,7 +436,13 @@ class Validations:
         normalize: bool = False,
         fuzzy_match: bool = True,
         on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-    ) -> str | IntoSeriesT:
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        fuzzy_report: bool = False,
+        score_cutoff: Optional[float] = None,
+        scorer: Scorer = "WRatio",
+        phonetic: Optional[bool] = None,
+    ) -> str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]:
         return cls._validate_generic(
             value=provincia,
             entity_type="provincias",
@@ -218,6 +450,12 @@ class Validations:
             normalize=normalize,
             fuzzy_match=fuzzy_match,
             on_error=on_error,
+            n_jobs=n_jobs,
+            executor=executor,
+            fuzzy_report=fuzzy_report,
+            score_cutoff=score_cutoff,
+            scorer=scorer,
+            phonetic=phonetic,
         )
 
     @classmethod
@@ -228,7 +466,13 @@ class Validations:
         normalize: bool = False,
         fuzzy_match: bool = True,
         on_error: Literal["raise", "warn", "ignore", "capitalize", "coerce"] = "raise",
-    ) -> str | IntoSeriesT:
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        fuzzy_report: bool = False,
+        score_cutoff: Optional[float] = None,
+        scorer: Scorer = "WRatio",
+        phonetic: Optional[bool] = None,
+    ) -> str | IntoSeriesT | tuple[IntoSeriesT, IntoDataFrameT]:
         return cls._validate_generic(
             value=distrito,
             entity_type="distritos",
@@ -236,4 +480,140 @@ class Validations:
             normalize=normalize,
             fuzzy_match=fuzzy_match,
             on_error=on_error,
+            n_jobs=n_jobs,
+            executor=executor,
+            fuzzy_report=fuzzy_report,
+            score_cutoff=score_cutoff,
+            scorer=scorer,
+            phonetic=phonetic,
+        )
+
+    # ------------------------------------------------------------------
+    # CANDIDATOS (TOP-K)
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def fuzzy_candidates(
+        cls,
+        value: str | IntoSeriesT,
+        entity_type: Literal["departamentos", "provincias", "distritos"],
+        limit: int = 5,
+        score_cutoff: float = 60,
+        scorer: Scorer = "WRatio",
+    ) -> list[tuple[str, float]] | IntoSeriesT:
+        """
+        Los `limit` nombres oficiales más parecidos a cada valor, con su score,
+        para revisión manual.
+
+        Parameters
+        ----------
+        value : str | IntoSeriesT
+            Valor o serie de valores a buscar. Las series se procesan una vez
+            por valor distinto.
+        entity_type : {'departamentos', 'provincias', 'distritos'}
+            Nivel en el que se busca.
+        limit : int, optional
+            Cantidad máxima de candidatos por valor. Por defecto 5.
+        score_cutoff : float, optional
+            Score mínimo (0-100) de un candidato. Por defecto 60.
+        scorer : str | Callable, optional
+            Scorer de rapidfuzz. Por defecto "WRatio".
+
+        Returns
+        -------
+        list[tuple[str, float]] | IntoSeriesT
+            Para un str, lista de (nombre, score) de mayor a menor score. Para
+            una serie, una columna de listas de structs {"nombre", "score"}
+            (tipo Arrow `list<struct<nombre: string, score: double>>`) del mismo
+            backend; los nulos se mantienen.
+        """
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+            raise ValueError("limit debe ser un entero >= 1")
+        validar_score_cutoff(score_cutoff)
+        resolver_scorer(scorer)
+
+        mapping = cls._resources.cargar_diccionario("equivalencias", entity_type)
+        indice = cls._resources.cargar_indice_fuzzy(entity_type)
+
+        def candidatos(item: str) -> list[tuple[str, float]]:
+            # Varias equivalencias apuntan al mismo nombre oficial: se conserva
+            # el mejor score de cada uno
+            mejores: dict[str, float] = {}
+            for clave, score in indice.candidatos(
+                eliminar_acentos(item).strip().upper(), None, score_cutoff, scorer
+            ):
+                mejores.setdefault(mapping[clave], score)
+                if len(mejores) == limit:
+                    break
+            return list(mejores.items())
+
+        if isinstance(value, str):
+            return candidatos(value)
+
+        import narwhals as nw
+
+        serie = nw.from_native(value, series_only=True, eager_only=True)
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError as e:
+            raise ImportError(
+                "fuzzy_candidates con series requiere 'pyarrow'. "
+                "Instálalo con: pip install pyarrow"
+            ) from e
+
+        # Solo los valores distintos pasan por rapidfuzz; el resultado se arma
+        # con columnas planas (offsets, nombres, scores) y se expande a cada
+        # fila con un take de Arrow, sin crear objetos de Python por fila
+        unicos = serie.drop_nulls().unique(maintain_order=True).to_list()
+        offsets = [0]
+        nombres: list[str] = []
+        scores: list[float] = []
+        for item in unicos:
+            for nombre, score in candidatos(item):
+                nombres.append(nombre)
+                scores.append(score)
+            offsets.append(len(nombres))
+        # Los nulos apuntan a una última posición nula
+        offsets.append(len(nombres))
+        tipo = pa.list_(pa.struct([("nombre", pa.string()), ("score", pa.float64())]))
+        valores = pa.ListArray.from_arrays(
+            pa.array(offsets, type=pa.int32()),
+            pa.StructArray.from_arrays(
+                [
+                    pa.array(nombres, type=pa.string()),
+                    pa.array(scores, type=pa.float64()),
+                ],
+                fields=list(tipo.value_type),
+            ),
+            mask=pa.array([False] * len(unicos) + [True]),
+        )
+        if unicos:
+            posiciones = serie.replace_strict(
+                unicos,
+                list(range(len(unicos))),
+                default=len(unicos),
+                return_dtype=nw.Int64(),
+            )
+            arreglo = pc.take(valores, posiciones.to_arrow())
+        else:
+            # Series vacía o solo con nulos (replace_strict no acepta un mapeo vacío)
+            arreglo = pa.nulls(len(serie), type=tipo)
+
+        nativo = serie.to_native()
+        implementacion = serie.implementation
+        if implementacion.is_pyarrow():
+            return pa.chunked_array([arreglo])
+        if implementacion.is_polars():
+            import polars as pl
+
+            return pl.Series(serie.name, arreglo)
+        if implementacion.is_pandas():
+            import pandas as pd
+
+            return pd.Series(
+                arreglo, dtype=pd.ArrowDtype(tipo), index=nativo.index, name=serie.name
+            )
+        raise TypeError(
+            "fuzzy_candidates solo acepta series de pandas, Polars o PyArrow"
         )
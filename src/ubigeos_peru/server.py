@@ -0,0 +1,654 @@
+"""
+Servidor HTTP local (solo biblioteca estándar) para consultar ubigeos desde otros
+lenguajes (R, Node, etc.).
+
+Ejemplo:
+
+    ubigeos-peru serve --port 8000
+    curl "localhost:8000/distrito?codigo=150101"
+    curl -d '{"codigos": ["150101", "080101"]}' localhost:8000/distrito
+
+Endpoints. Con GET se consulta un valor; con POST, un lote:
+
+- ``/departamento``, ``/provincia``, ``/distrito``: nombre a partir del código
+  (``codigo`` / ``codigos``).
+- ``/validate``: nombre oficial a partir de un nombre escrito de cualquier forma
+  (``nombre`` / ``nombres``; ``level`` indica el nivel, por defecto distritos).
+- ``/reverse_geocode``: distrito cuya capital está más cerca de un punto
+  (``lat`` y ``lon``). Es una aproximación por capitales, no por límites.
+- ``/health``: estado del servidor.
+
+Las opciones (``institucion``, ``normalize``, ``on_error``, ``fuzzy_match``,
+etc.) van en el query string o, en los POST con JSON, en el mismo cuerpo. Los
+lotes también se pueden enviar como Arrow IPC (``Content-Type:
+application/vnd.apache.arrow.stream``), con la columna de entrada con el mismo
+nombre que en JSON en singular (o como primera columna); la respuesta es una
+tabla Arrow con la columna ``resultado``.
+
+Los lotes pasan por la ruta vectorizada (Arrow) de la librería, y los recursos
+se precargan al iniciar para que ninguna consulta pague la carga.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+from urllib.parse import parse_qs, urlsplit
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_ARROW = "application/vnd.apache.arrow.stream"
+_JSON = "application/json"
+
+
+def _importar_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "El comando 'serve' requiere 'pyarrow'. "
+            "Instálalo con: pip install ubigeos-peru[cli]"
+        ) from e
+    return pa
+
+
+# ------------------------------------------------------------------
+# OPCIONES
+# ------------------------------------------------------------------
+
+
+def _bool(valor: Any) -> bool:
+    if isinstance(valor, bool):
+        return valor
+    if str(valor).lower() in ("1", "true", "si", "yes"):
+        return True
+    if str(valor).lower() in ("0", "false", "no"):
+        return False
+    raise ValueError(f"Se esperaba un booleano, se recibió {valor!r}")
+
+
+_TIPOS_OPCIONES: dict[str, Callable[[Any], Any]] = {
+    "institucion": str,
+    "normalize": _bool,
+    "divide_lima": _bool,
+    "on_error": str,
+    "level": str,
+    "fuzzy_match": _bool,
+    "score_cutoff": float,
+    "scorer": str,
+    "phonetic": _bool,
+}
+
+
+def _opciones(
+    crudas: dict[str, Any], permitidas: tuple[str, ...], defecto: dict[str, Any]
+) -> dict[str, Any]:
+    """Toma de `crudas` solo las opciones del endpoint, convertidas a su tipo."""
+    opciones = dict(defecto)
+    for nombre in permitidas:
+        if nombre in crudas:
+            opciones[nombre] = _TIPOS_OPCIONES[nombre](crudas[nombre])
+    return opciones
+
+
+# ------------------------------------------------------------------
+# REVERSE GEOCODING
+# ------------------------------------------------------------------
+
+_CELDA = 0.5  # grados
+_RADIO_TIERRA_KM = 6371.0088
+_MAX_KM_PROVINCIA = 150
+# Más allá de esta distancia a la capital distrital más cercana, el punto se
+# considera fuera del Perú (los distritos amazónicos más extensos no llegan)
+_MAX_KM_CAPITAL = 200
+# Proyección equirectangular centrada en la latitud media del Perú
+_COS_REFERENCIA = math.cos(math.radians(-9.2))
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * _RADIO_TIERRA_KM * math.asin(math.sqrt(a))
+
+
+class _IndiceCoordenadas:
+    """
+    Capitales distritales en una grilla de celdas de `_CELDA` grados, para
+    buscar la más cercana revisando solo los anillos de celdas necesarios.
+
+    Los metadatos de coordenadas están indexados por nombre. Si el nombre se
+    repite en varios distritos, las coordenadas se asignan al que tiene la
+    capital de provincia más cercana (a menos de `_MAX_KM_PROVINCIA`); si
+    ninguno está tan cerca, se descartan.
+    """
+
+    __slots__ = ("ubigeos", "puntos", "celdas", "limites")
+
+    def __init__(self) -> None:
+        from .core._utils import eliminar_acentos
+        from .core.resource_manager import ResourceManager
+
+        otros = ResourceManager.cargar_diccionario("otros", "distritos")
+        otros_provincias = ResourceManager.cargar_diccionario("otros", "provincias")
+        distritos = ResourceManager.cargar_diccionario("distritos", "inei")
+        provincias = ResourceManager.cargar_diccionario("provincias", "inei")
+
+        por_nombre: dict[str, list[str]] = {}
+        for ubigeo, nombre in distritos.items():
+            por_nombre.setdefault(eliminar_acentos(nombre).upper(), []).append(ubigeo)
+
+        def coordenadas(datos: Any) -> Optional[tuple[float, float]]:
+            try:
+                return float(datos["latitud"]), float(datos["longitud"])
+            except (KeyError, TypeError, ValueError):
+                return None
+
+        def distancia_provincia(ubigeo: str, punto: tuple[float, float]) -> float:
+            provincia = eliminar_acentos(provincias.get(ubigeo[:4], "")).upper()
+            capital = coordenadas(otros_provincias.get(provincia))
+            return math.inf if capital is None else _haversine_km(*punto, *capital)
+
+        self.ubigeos: list[str] = []
+        self.puntos: list[tuple[float, float]] = []
+        self.celdas: dict[tuple[int, int], list[int]] = {}
+        for nombre, ubigeos in por_nombre.items():
+            punto = coordenadas(otros.get(nombre))
+            if punto is None:
+                continue
+            ubigeo = ubigeos[0]
+            if len(ubigeos) > 1:
+                ubigeo = min(ubigeos, key=lambda u: distancia_provincia(u, punto))
+                if distancia_provincia(ubigeo, punto) > _MAX_KM_PROVINCIA:
+                    continue
+            self.celdas.setdefault(self._celda(*punto), []).append(len(self.puntos))
+            self.ubigeos.append(ubigeo)
+            self.puntos.append(punto)
+
+        filas = [i for i, _ in self.celdas]
+        columnas = [j for _, j in self.celdas]
+        self.limites = (min(filas), max(filas), min(columnas), max(columnas))
+
+    @staticmethod
+    def _celda(lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / _CELDA), math.floor(lon * _COS_REFERENCIA / _CELDA)
+
+    @staticmethod
+    def _anillo(ci: int, cj: int, r: int) -> Iterator[tuple[int, int]]:
+        """Celdas del borde del cuadrado de radio `r` alrededor de (ci, cj)."""
+        if r == 0:
+            yield ci, cj
+            return
+        for j in range(cj - r, cj + r + 1):
+            yield ci - r, j
+            yield ci + r, j
+        for i in range(ci - r + 1, ci + r):
+            yield i, cj - r
+            yield i, cj + r
+
+    def cercano(self, lat: float, lon: float) -> tuple[str, float]:
+        """Ubigeo de la capital más cercana y su distancia en km."""
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            raise ValueError(f"Coordenadas fuera de rango: ({lat}, {lon})")
+
+        x, y = lat, lon * _COS_REFERENCIA
+        ci, cj = self._celda(lat, lon)
+        imin, imax, jmin, jmax = self.limites
+        anillo_max = max(abs(ci - imin), abs(ci - imax), abs(cj - jmin), abs(cj - jmax))
+        # Fuera de la grilla, los anillos más cercanos están vacíos
+        anillo_min = max(0, imin - ci, ci - imax, jmin - cj, cj - jmax)
+
+        mejor, mejor_d2 = -1, math.inf
+        for r in range(anillo_min, anillo_max + 1):
+            for celda in self._anillo(ci, cj, r):
+                for indice in self.celdas.get(celda, ()):
+                    plat, plon = self.puntos[indice]
+                    d2 = (plat - x) ** 2 + (plon * _COS_REFERENCIA - y) ** 2
+                    if d2 < mejor_d2:
+                        mejor, mejor_d2 = indice, d2
+            # Todo punto de los anillos siguientes está a más de r celdas
+            if mejor >= 0 and mejor_d2 <= (r * _CELDA) ** 2:
+                break
+
+        plat, plon = self.puntos[mejor]
+        return self.ubigeos[mejor], _haversine_km(lat, lon, plat, plon)
+
+
+def _indice_coordenadas() -> _IndiceCoordenadas:
+    from .core.resource_manager import ResourceManager
+
+    return ResourceManager.cargar_derivado(
+        ("otros", "distritos", "coordenadas"), _IndiceCoordenadas
+    )
+
+
+_COLUMNAS_REVERSE = ("ubigeo", "departamento", "provincia", "distrito", "distancia_km")
+
+
+def _reverse_geocode(lat: float, lon: float) -> dict[str, Any]:
+    from .core.ubigeo_converter import UbigeoConverter
+
+    ubigeo, km = _indice_coordenadas().cercano(float(lat), float(lon))
+    if km > _MAX_KM_CAPITAL:
+        raise KeyError(
+            f"Las coordenadas ({lat}, {lon}) están a más de {_MAX_KM_CAPITAL} km "
+            "de cualquier capital distrital del Perú"
+        )
+    return {
+        "ubigeo": ubigeo,
+        "departamento": UbigeoConverter.get_departamento(ubigeo),
+        "provincia": UbigeoConverter.get_provincia(ubigeo),
+        "distrito": UbigeoConverter.get_distrito(ubigeo),
+        "distancia_km": round(km, 3),
+    }
+
+
+def _reverse_geocode_lote(lat: float, lon: float) -> dict[str, Any]:
+    # En un lote, un punto fuera del Perú da una fila nula en vez de un 404
+    try:
+        return _reverse_geocode(lat, lon)
+    except KeyError:
+        return dict.fromkeys(_COLUMNAS_REVERSE)
+
+
+# ------------------------------------------------------------------
+# ENDPOINTS
+# ------------------------------------------------------------------
+
+
+def _con_nulos(func: Callable[[pa.ChunkedArray], Any], valores: pa.Array) -> pa.Array:
+    """Aplica `func` a los valores no nulos y conserva los nulos en su posición."""
+    pa = _importar_pyarrow()
+    import pyarrow.compute as pc
+
+    if valores.null_count == 0:
+        return _a_arreglo(func(pa.chunked_array([valores])))
+    validos = pc.is_valid(valores)
+    resultado = _a_arreglo(func(pa.chunked_array([valores.filter(validos)])))
+    return pc.replace_with_mask(
+        pa.nulls(len(valores), type=pa.string()), validos, resultado
+    )
+
+
+def _a_arreglo(resultado: Any) -> pa.Array:
+    pa = _importar_pyarrow()
+
+    if isinstance(resultado, tuple):
+        # validate con fuzzy_report: (serie, reporte)
+        resultado = resultado[0]
+    if isinstance(resultado, pa.ChunkedArray):
+        resultado = resultado.combine_chunks()
+    return resultado.cast(pa.string())
+
+
+class _Endpoint:
+    """
+    Un endpoint con su parámetro de entrada, las opciones que acepta y cómo
+    resolver un valor (`escalar`) y un lote Arrow (`lote`).
+    """
+
+    __slots__ = ("parametro", "permitidas", "defecto", "escalar", "lote")
+
+    def __init__(
+        self,
+        parametro: str,
+        permitidas: tuple[str, ...],
+        defecto: dict[str, Any],
+        escalar: Callable[..., Any],
+        lote: Callable[..., pa.Array],
+    ):
+        self.parametro = parametro
+        self.permitidas = permitidas
+        self.defecto = defecto
+        self.escalar = escalar
+        self.lote = lote
+
+
+def _endpoint_codigo(funcion: str, con_on_error: bool = True) -> _Endpoint:
+    from .core.ubigeo_converter import UbigeoConverter
+
+    metodo = getattr(UbigeoConverter, funcion)
+    if con_on_error:
+        permitidas = ("institucion", "normalize", "on_error")
+        defecto = {"on_error": "coerce"}
+    else:
+        # get_departamento no tiene on_error
+        permitidas = ("institucion", "normalize", "divide_lima")
+        defecto = {}
+
+    return _Endpoint(
+        "codigo",
+        permitidas,
+        defecto,
+        escalar=metodo,
+        lote=lambda valores, **opciones: _a_arreglo(
+            metodo(_importar_pyarrow().chunked_array([valores]), **opciones)
+        ),
+    )
+
+
+def _endpoint_validate() -> _Endpoint:
+    from .core.validations import Validations
+
+    metodos = {
+        "departamentos": Validations.validate_departamento,
+        "provincias": Validations.validate_provincia,
+        "distritos": Validations.validate_distrito,
+    }
+
+    def resolver(level: str) -> Callable[..., Any]:
+        try:
+            return metodos[level]
+        except KeyError:
+            raise ValueError(
+                'Solo se aceptan "departamentos", "provincias", "distritos" como level'
+            ) from None
+
+    def escalar(nombre: str, level: str, **opciones: Any) -> Any:
+        return resolver(level)(nombre, **opciones)
+
+    def lote(valores: pa.Array, level: str, **opciones: Any) -> pa.Array:
+        metodo = resolver(level)
+        # fuzzy_report evita que los reemplazos se impriman en la salida del servidor
+        return _con_nulos(
+            lambda v: metodo(v, fuzzy_report=True, **opciones), valores.cast("string")
+        )
+
+    return _Endpoint(
+        "nombre",
+        (
+            "level",
+            "institucion",
+            "normalize",
+            "fuzzy_match",
+            "on_error",
+            "score_cutoff",
+            "scorer",
+            "phonetic",
+        ),
+        {"level": "distritos", "on_error": "coerce"},
+        escalar=escalar,
+        lote=lote,
+    )
+
+
+def _crear_endpoints() -> dict[str, _Endpoint]:
+    return {
+        "/departamento": _endpoint_codigo("get_departamento", con_on_error=False),
+        "/provincia": _endpoint_codigo("get_provincia"),
+        "/distrito": _endpoint_codigo("get_distrito"),
+        "/validate": _endpoint_validate(),
+    }
+
+
+# ------------------------------------------------------------------
+# HANDLER
+# ------------------------------------------------------------------
+
+
+class _ErrorHTTP(Exception):
+    def __init__(self, estado: HTTPStatus, mensaje: str):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "ubigeos-peru"
+    # Conexiones persistentes: un cliente puede reutilizar la conexión
+    protocol_version = "HTTP/1.1"
+    # Encabezados y cuerpo se escriben por separado: sin TCP_NODELAY, Nagle y el
+    # ACK diferido agregan ~40 ms a cada respuesta en conexiones persistentes
+    disable_nagle_algorithm = True
+    endpoints: dict[str, _Endpoint] = {}
+    verbose = False
+
+    def do_GET(self) -> None:
+        self._atender(con_cuerpo=False)
+
+    def do_POST(self) -> None:
+        self._atender(con_cuerpo=True)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.verbose:
+            super().log_message(format, *args)
+
+    # ------------------------------------------------------------------
+
+    def _atender(self, con_cuerpo: bool) -> None:
+        partes = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(partes.query).items()}
+        try:
+            cuerpo = self._leer_cuerpo() if con_cuerpo else None
+            if partes.path == "/health":
+                self._json(HTTPStatus.OK, {"estado": "ok"})
+            elif partes.path == "/reverse_geocode":
+                self._reverse_geocode(query, cuerpo)
+            elif partes.path in self.endpoints:
+                self._consulta(self.endpoints[partes.path], query, cuerpo)
+            else:
+                raise _ErrorHTTP(
+                    HTTPStatus.NOT_FOUND, f"Endpoint desconocido: {partes.path}"
+                )
+        except _ErrorHTTP as e:
+            self._json(e.estado, {"error": str(e)})
+        except KeyError as e:
+            # Los KeyError de la librería traen el mensaje como único argumento
+            self._json(HTTPStatus.NOT_FOUND, {"error": str(e.args[0] if e.args else e)})
+        except (ValueError, TypeError) as e:
+            self._json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        except ImportError as e:
+            self._json(HTTPStatus.NOT_IMPLEMENTED, {"error": str(e)})
+
+    def _consulta(
+        self, endpoint: _Endpoint, query: dict[str, str], cuerpo: Optional[bytes]
+    ) -> None:
+        if cuerpo is None:
+            if endpoint.parametro not in query:
+                raise _ErrorHTTP(
+                    HTTPStatus.BAD_REQUEST, f"Falta el parámetro '{endpoint.parametro}'"
+                )
+            opciones = _opciones(query, endpoint.permitidas, endpoint.defecto)
+            resultado = endpoint.escalar(query[endpoint.parametro], **opciones)
+            self._json(HTTPStatus.OK, {"resultado": resultado})
+            return
+
+        if self._es_arrow():
+            tabla = self._leer_arrow(cuerpo)
+            columna = (
+                endpoint.parametro
+                if endpoint.parametro in tabla.column_names
+                else tabla.column_names[0]
+            )
+            opciones = _opciones(query, endpoint.permitidas, endpoint.defecto)
+            resultado = endpoint.lote(tabla[columna].combine_chunks(), **opciones)
+            self._arrow({"resultado": resultado})
+            return
+
+        datos = self._leer_json(cuerpo)
+        clave = f"{endpoint.parametro}s"
+        valores = datos.get(clave)
+        if not isinstance(valores, list):
+            raise _ErrorHTTP(
+                HTTPStatus.BAD_REQUEST, f"El cuerpo debe tener una lista '{clave}'"
+            )
+        opciones = _opciones({**query, **datos}, endpoint.permitidas, endpoint.defecto)
+        pa = _importar_pyarrow()
+        # Los códigos enteros se pasan como texto para admitir listas mixtas
+        arreglo = pa.array(
+            [
+                str(v) if isinstance(v, int) and not isinstance(v, bool) else v
+                for v in valores
+            ],
+            type=pa.string(),
+        )
+        resultado = endpoint.lote(arreglo, **opciones)
+        self._json(HTTPStatus.OK, {"resultado": resultado.to_pylist()})
+
+    def _reverse_geocode(self, query: dict[str, str], cuerpo: Optional[bytes]) -> None:
+        if cuerpo is None:
+            if "lat" not in query or "lon" not in query:
+                raise _ErrorHTTP(
+                    HTTPStatus.BAD_REQUEST, "Faltan los parámetros 'lat' y 'lon'"
+                )
+            self._json(
+                HTTPStatus.OK,
+                {"resultado": _reverse_geocode(query["lat"], query["lon"])},
+            )
+            return
+
+        if self._es_arrow():
+            tabla = self._leer_arrow(cuerpo)
+            if "lat" not in tabla.column_names or "lon" not in tabla.column_names:
+                raise _ErrorHTTP(
+                    HTTPStatus.BAD_REQUEST,
+                    "La tabla debe tener las columnas 'lat' y 'lon'",
+                )
+            lats, lons = tabla["lat"].to_pylist(), tabla["lon"].to_pylist()
+        else:
+            datos = self._leer_json(cuerpo)
+            lats, lons = datos.get("lat"), datos.get("lon")
+            if not isinstance(lats, list) or not isinstance(lons, list):
+                raise _ErrorHTTP(
+                    HTTPStatus.BAD_REQUEST,
+                    "El cuerpo debe tener las listas 'lat' y 'lon'",
+                )
+        if len(lats) != len(lons):
+            raise _ErrorHTTP(
+                HTTPStatus.BAD_REQUEST, "'lat' y 'lon' deben tener el mismo largo"
+            )
+
+        filas = [_reverse_geocode_lote(lat, lon) for lat, lon in zip(lats, lons)]
+        if self._es_arrow():
+            self._arrow({c: [fila[c] for fila in filas] for c in _COLUMNAS_REVERSE})
+        else:
+            self._json(HTTPStatus.OK, {"resultado": filas})
+
+    # ------------------------------------------------------------------
+
+    def _leer_cuerpo(self) -> bytes:
+        try:
+            largo = int(self.headers.get("Content-Length") or 0)
+            if largo < 0:
+                raise ValueError
+        except ValueError:
+            # Sin un largo válido no se sabe dónde termina el cuerpo
+            self.close_connection = True
+            raise _ErrorHTTP(
+                HTTPStatus.BAD_REQUEST, "Content-Length inválido"
+            ) from None
+        return self.rfile.read(largo)
+
+    def _es_arrow(self) -> bool:
+        return (self.headers.get("Content-Type") or "").startswith(_ARROW)
+
+    def _leer_json(self, cuerpo: bytes) -> dict[str, Any]:
+        try:
+            datos = json.loads(cuerpo or b"{}")
+        except json.JSONDecodeError as e:
+            raise _ErrorHTTP(HTTPStatus.BAD_REQUEST, f"JSON inválido: {e}") from None
+        if not isinstance(datos, dict):
+            raise _ErrorHTTP(
+                HTTPStatus.BAD_REQUEST, "El cuerpo debe ser un objeto JSON"
+            )
+        return datos
+
+    def _leer_arrow(self, cuerpo: bytes) -> pa.Table:
+        pa = _importar_pyarrow()
+
+        try:
+            return pa.ipc.open_stream(cuerpo).read_all()
+        except pa.ArrowInvalid as e:
+            raise _ErrorHTTP(
+                HTTPStatus.BAD_REQUEST, f"Arrow IPC inválido: {e}"
+            ) from None
+
+    def _responder(self, estado: HTTPStatus, tipo: str, cuerpo: bytes) -> None:
+        self.send_response(estado)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def _json(self, estado: HTTPStatus, datos: Any) -> None:
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode("utf-8")
+        self._responder(estado, f"{_JSON}; charset=utf-8", cuerpo)
+
+    def _arrow(self, columnas: dict[str, Any]) -> None:
+        pa = _importar_pyarrow()
+
+        tabla = pa.table(columnas)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, tabla.schema) as writer:
+            writer.write_table(tabla)
+        self._responder(HTTPStatus.OK, _ARROW, sink.getvalue().to_pybytes())
+
+
+# ------------------------------------------------------------------
+# SERVIDOR
+# ------------------------------------------------------------------
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    preload: bool = True,
+    verbose: bool = False,
+) -> ThreadingHTTPServer:
+    """
+    Crea el servidor (sin iniciarlo). Un hilo por conexión.
+
+    Parameters
+    ----------
+    host, port : str, int
+        Dirección donde escuchar. Con ``port=0`` el sistema elige uno libre
+        (ver ``server.server_address``).
+    preload : bool, default True
+        Si es True, carga por adelantado los recursos, los índices de fuzzy
+        matching y el de coordenadas.
+    verbose : bool, default False
+        Si es True, registra cada request en stderr.
+
+    Returns
+    -------
+    ThreadingHTTPServer
+        Servidor listo para ``serve_forever()``.
+    """
+    _importar_pyarrow()
+
+    if preload:
+        from .core.resource_manager import ResourceManager
+
+        ResourceManager.preload()
+        _indice_coordenadas()
+
+    handler = type(
+        "Handler", (_Handler,), {"endpoints": _crear_endpoints(), "verbose": verbose}
+    )
+    servidor = ThreadingHTTPServer((host, port), handler)
+    servidor.daemon_threads = True
+    return servidor
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    preload: bool = True,
+    verbose: bool = False,
+) -> None:
+    """Inicia el servidor y atiende requests hasta recibir Ctrl+C."""
+    servidor = make_server(host, port, preload=preload, verbose=verbose)
+    host, port = servidor.server_address[:2]
+    print(f"[INFO] Sirviendo en http://{host}:{port}", file=sys.stderr)
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import ubigeos_peru as ubg
+from ubigeos_peru.core import async_api
+
+
+class TestAsyncUbigeo:
+    def test_results_match_sync_api(self):
+        codigos = ["150101", "080101", 150101, "150101", "10"]
+
+        async def main():
+            async with ubg.AsyncUbigeo() as aubg:
+                return await asyncio.gather(
+                    *(aubg.get_departamento(c) for c in codigos),
+                    aubg.validate_distrito("Miraflors", fuzzy_match=True),
+                    aubg.validate_provincia("HUAROCHIRI", normalize=True),
+                )
+
+        resultado = asyncio.run(main())
+
+        assert resultado == [
+            *(ubg.get_departamento(c) for c in codigos),
+            "Miraflores",
+            "HUAROCHIRI",
+        ]
+
+    def test_groups_concurrent_calls_in_one_batch(self, monkeypatch):
+        lotes = []
+        original = async_api._resolver_lote
+
+        def espia(funcion, kwargs, valores):
+            lotes.append((funcion, kwargs, list(valores)))
+            return original(funcion, kwargs, valores)
+
+        monkeypatch.setattr(async_api, "_resolver_lote", espia)
+
+        async def main():
+            aubg = ubg.AsyncUbigeo(max_delay=0.05)
+            return await asyncio.gather(
+                *(aubg.get_distrito(c) for c in ["150101", "150102", "150101"]),
+                aubg.get_distrito("150101", normalize=True),
+            )
+
+        resultado = asyncio.run(main())
+
+        assert resultado == ["Lima", "Ancón", "Lima", "LIMA"]
+        # Un lote por combinación de función y argumentos
+        assert lotes == [
+            ("get_distrito", {}, ["150101", "150102", "150101"]),
+            ("get_distrito", {"normalize": True}, ["150101"]),
+        ]
+
+    def test_max_batch_dispatches_without_waiting(self, monkeypatch):
+        tamanos = []
+        original = async_api._resolver_lote
+
+        def espia(funcion, kwargs, valores):
+            tamanos.append(len(valores))
+            return original(funcion, kwargs, valores)
+
+        monkeypatch.setattr(async_api, "_resolver_lote", espia)
+
+        async def main():
+            # Con max_delay tan largo, solo max_batch puede despachar a tiempo
+            aubg = ubg.AsyncUbigeo(max_delay=60, max_batch=2)
+            return await asyncio.wait_for(
+                asyncio.gather(*(aubg.get_departamento("15") for _ in range(4))),
+                timeout=5,
+            )
+
+        assert asyncio.run(main()) == ["Lima"] * 4
+        assert tamanos == [2, 2]
+
+    def test_errors_are_isolated_per_value(self):
+        async def main():
+            async with ubg.AsyncUbigeo() as aubg:
+                return await asyncio.gather(
+                    aubg.get_distrito("150101"),
+                    aubg.get_distrito("999999"),
+                    return_exceptions=True,
+                )
+
+        ok, error = asyncio.run(main())
+
+        assert ok == "Lima"
+        assert isinstance(error, KeyError)
+
+    def test_runs_off_the_event_loop_thread(self, monkeypatch):
+        hilos = []
+        original = async_api._resolver_lote
+
+        def espia(funcion, kwargs, valores):
+            hilos.append(threading.get_ident())
+            return original(funcion, kwargs, valores)
+
+        monkeypatch.setattr(async_api, "_resolver_lote", espia)
+
+        async def main():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                aubg = ubg.AsyncUbigeo(executor=executor)
+                await aubg.get_departamento("15")
+            return threading.get_ident()
+
+        hilo_loop = asyncio.run(main())
+
+        assert hilos and hilos[0] != hilo_loop
+
+    def test_flush_and_cancelled_caller(self):
+        async def main():
+            aubg = ubg.AsyncUbigeo(max_delay=60)
+            cancelada = asyncio.ensure_future(aubg.get_departamento("15"))
+            pendiente = asyncio.ensure_future(aubg.get_departamento("08"))
+            await asyncio.sleep(0)
+            cancelada.cancel()
+            await aubg.flush()
+            return cancelada.cancelled(), await pendiente
+
+        assert asyncio.run(main()) == (True, "Cusco")
+
+    def test_rejects_series_and_invalid_arguments(self):
+        async def main():
+            await ubg.AsyncUbigeo().get_departamento(["15"])
+
+        with pytest.raises(TypeError):
+            asyncio.run(main())
+        with pytest.raises(ValueError):
+            ubg.AsyncUbigeo(max_batch=0)
+        with pytest.raises(ValueError):
+            ubg.AsyncUbigeo(max_delay=-1)
@@ -0,0 +1,42 @@
+import pytest
+
+import ubigeos_peru as ubg
+
+
+class TestAutocomplete:
+    def test_prefix_ignores_case_and_accents(self):
+        assert ubg.autocomplete("cuz", level="departamentos") == [
+            {"nombre": "Cusco", "ubigeo": "08"}
+        ]
+        assert ubg.autocomplete("ANCÁ", level="departamentos") == [
+            {"nombre": "Áncash", "ubigeo": "02"}
+        ]
+
+    def test_duplicate_names_keep_every_code(self):
+        sugerencias = ubg.autocomplete("asuncion")
+
+        assert {s["ubigeo"] for s in sugerencias} == {"010102", "060102"}
+        assert all(s["nombre"] == "Asunción" for s in sugerencias)
+
+    def test_trailing_space_is_significant(self):
+        nombres = [s["nombre"] for s in ubg.autocomplete("san ", limit=50)]
+
+        assert nombres
+        assert all(n.startswith("San ") for n in nombres)
+
+    def test_limit_and_population_ranking(self):
+        alfabetico = ubg.autocomplete("lima", level="provincias", limit=1)
+        sugerencias = ubg.autocomplete("san juan", limit=3, by_population=True)
+
+        assert len(alfabetico) == 1
+        assert [s["ubigeo"] for s in sugerencias] == ["150132", "150133", "160113"]
+
+    def test_empty_prefix(self):
+        assert ubg.autocomplete("   ") == []
+        assert ubg.autocomplete("xqzw") == []
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ubg.autocomplete("lim", level="regiones")
+        with pytest.raises(TypeError):
+            ubg.autocomplete(15)
@@ -0,0 +1,185 @@
+import pytest
+
+from ubigeos_peru.cli import CAMPOS, convert, main
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+pacsv = pytest.importorskip("pyarrow.csv")
+
+
+class TestConvert:
+    def test_convert_parquet_in_batches(self, tmp_path):
+        input_path = tmp_path / "in.parquet"
+        output_path = tmp_path / "out.parquet"
+        pq.write_table(
+            pa.table({"UBIGEO": [10101, 150110, 50110] * 5, "X": list(range(15))}),
+            input_path,
+        )
+
+        code = main(
+            [
+                "convert",
+                str(input_path),
+                str(output_path),
+                "--col",
+                "UBIGEO",
+                "--add",
+                "departamento,provincia,distrito",
+                "--batch-size",
+                "4",
+            ]
+        )
+
+        result = pq.read_table(output_path)
+        assert code == 0
+        assert result.num_rows == 15
+        assert result.column_names == [
+            "UBIGEO",
+            "X",
+            "departamento",
+            "provincia",
+            "distrito",
+        ]
+        assert result["X"].to_pylist() == list(range(15))
+        assert result["distrito"].to_pylist()[:3] == [
+            "Chachapoyas",
+            "Comas",
+            "San Juan Bautista",
+        ]
+
+    def test_convert_csv_keeps_leading_zeros(self, tmp_path):
+        input_path = tmp_path / "in.csv"
+        output_path = tmp_path / "out.csv"
+        input_path.write_text("UBIGEO;P1\n010101;1\n220101;0\n010199;1\n")
+
+        main(
+            [
+                "convert",
+                str(input_path),
+                str(output_path),
+                "--col",
+                "UBIGEO",
+                "--add",
+                "departamento,distrito",
+                "--sep",
+                ";",
+                "--normalize",
+            ]
+        )
+
+        result = pacsv.read_csv(
+            output_path,
+            parse_options=pacsv.ParseOptions(delimiter=";"),
+            convert_options=pacsv.ConvertOptions(
+                column_types={"UBIGEO": pa.string()}, strings_can_be_null=True
+            ),
+        )
+        assert result["UBIGEO"].to_pylist() == ["010101", "220101", "010199"]
+        assert result["departamento"].to_pylist() == [
+            "AMAZONAS",
+            "SAN MARTIN",
+            "AMAZONAS",
+        ]
+        assert result["distrito"].to_pylist() == ["CHACHAPOYAS", "MOYOBAMBA", None]
+
+    def test_convert_rejects_unknown_field(self, tmp_path):
+        input_path = tmp_path / "in.parquet"
+        pq.write_table(pa.table({"UBIGEO": ["010101"]}), input_path)
+
+        with pytest.raises(ValueError):
+            main(
+                [
+                    "convert",
+                    str(input_path),
+                    str(tmp_path / "out.parquet"),
+                    "--col",
+                    "UBIGEO",
+                    "--add",
+                    "capital",
+                ]
+            )
+
+    def test_on_error_applies_to_departamento(self, tmp_path):
+        input_path = tmp_path / "in.parquet"
+        output_path = tmp_path / "out.parquet"
+        pq.write_table(
+            pa.table({"UBIGEO": ["150101", "990101", None, "990101"]}), input_path
+        )
+        args = ["convert", str(input_path), str(output_path), "--col", "UBIGEO"]
+
+        main(args + ["--add", "departamento,distrito"])
+
+        result = pq.read_table(output_path)
+        assert result["departamento"].to_pylist() == ["Lima", None, None, None]
+        assert result["distrito"].to_pylist() == ["Lima", None, None, None]
+
+        main(args + ["--on-error", "ignore"])
+        assert pq.read_table(output_path)["departamento"].to_pylist() == [
+            "Lima",
+            "990101",
+            None,
+            "990101",
+        ]
+
+    def test_failed_conversion_removes_output(self, tmp_path):
+        input_path = tmp_path / "in.parquet"
+        output_path = tmp_path / "out.parquet"
+        pq.write_table(pa.table({"UBIGEO": ["150101", "990101"]}), input_path)
+
+        with pytest.raises(KeyError):
+            main(
+                [
+                    "convert",
+                    str(input_path),
+                    str(output_path),
+                    "--col",
+                    "UBIGEO",
+                    "--on-error",
+                    "raise",
+                    "--batch-size",
+                    "1",
+                ]
+            )
+        assert not output_path.exists()
+
+    def test_blank_and_malformed_codes_follow_on_error(self, tmp_path):
+        input_path = tmp_path / "in.csv"
+        output_path = tmp_path / "out.parquet"
+        input_path.write_text("UBIGEO,X\n150101,1\n,2\nABC,3\n990101,4\n")
+        args = ["convert", str(input_path), str(output_path), "--col", "UBIGEO"]
+
+        main(args + ["--add", ",".join(CAMPOS)])
+
+        result = pq.read_table(output_path)
+        assert result["departamento"].to_pylist() == ["Lima", None, None, None]
+        assert result["provincia"].to_pylist() == ["Lima", None, None, None]
+        assert result["distrito"].to_pylist() == ["Lima", None, None, None]
+        assert result["macrorregion"].to_pylist() == [
+            "Lima Metropolitana",
+            None,
+            None,
+            None,
+        ]
+
+        with pytest.raises(ValueError):
+            main(args + ["--add", "provincia", "--on-error", "raise"])
+
+    def test_rejects_non_positive_batch_size_and_prefetch(self, tmp_path):
+        input_path = tmp_path / "in.parquet"
+        output_path = tmp_path / "out.parquet"
+        pq.write_table(pa.table({"UBIGEO": ["150101"]}), input_path)
+
+        for opcion in ("--batch-size", "--prefetch"):
+            with pytest.raises(SystemExit):
+                main(
+                    ["convert", str(input_path), str(output_path), "--col", "UBIGEO"]
+                    + [opcion, "0"]
+                )
+            with pytest.raises(ValueError):
+                convert(
+                    input_path,
+                    output_path,
+                    "UBIGEO",
+                    **{opcion[2:].replace("-", "_"): 0},
+                )
+        assert not output_path.exists()
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import ubigeos_peru as ubg
+from ubigeos_peru.core import get_metadato
+
+
+class TestCodeColumnDtypes:
+    def test_pandas_float_with_nan(self):
+        ubigeos = pd.Series([150101.0, np.nan, 10101.0])
+
+        resultado = ubg.get_distrito(ubigeos)
+
+        assert resultado[0] == "Lima"
+        assert pd.isna(resultado[1])
+        assert resultado[2] == "Chachapoyas"
+        assert ubg.get_departamento(ubigeos).tolist()[::2] == ["Lima", "Amazonas"]
+
+    def test_pandas_nullable_int(self):
+        ubigeos = pd.Series([150101, None, 80101], dtype="Int64")
+
+        resultado = ubg.get_provincia(ubigeos)
+
+        assert resultado.isna().tolist() == [False, True, False]
+        assert resultado[[0, 2]].tolist() == ["Lima", "Cusco"]
+
+    def test_polars_and_arrow(self):
+        polars = ubg.get_distrito(pl.Series("ubigeo", [150101.0, None]))
+        arrow = ubg.get_distrito(pa.chunked_array([[150101, None], [80101]]))
+
+        assert polars.name == "ubigeo"
+        assert polars.to_list() == ["Lima", None]
+        assert arrow.to_pylist() == ["Lima", None, "Cusco"]
+
+    def test_pandas_arrow_strings(self):
+        ubigeos = pd.Series(["150101", "80101", None], dtype=pd.ArrowDtype(pa.string()))
+
+        resultado = ubg.get_distrito(ubigeos)
+
+        assert resultado[:2].tolist() == ["Lima", "Cusco"]
+        assert pd.isna(resultado[2])
+
+    def test_divide_lima_with_normalize(self):
+        ubigeos = pd.Series([150101.0, 150501.0, np.nan])
+
+        resultado = ubg.get_departamento(ubigeos, divide_lima=True, normalize=True)
+
+        assert resultado.tolist()[:2] == ["LIMA METROPOLITANA", "LIMA REGION"]
+
+    def test_on_error_per_unique_code(self):
+        ubigeos = pd.Series(["150101", "999999", "999999"])
+
+        with pytest.warns(UserWarning):
+            resultado = ubg.get_distrito(ubigeos, on_error="warn")
+
+        assert resultado.tolist() == ["Lima", "999999", "999999"]
+        assert ubg.get_distrito(ubigeos, on_error="coerce").isna().tolist() == [
+            False,
+            True,
+            True,
+        ]
+
+    def test_invalid_values(self):
+        with pytest.raises(TypeError):
+            ubg.get_distrito(pd.Series([150101.5]))
+        with pytest.raises(ValueError):
+            ubg.get_distrito(pd.Series(["15O101"]))
+        with pytest.raises(KeyError):
+            ubg.get_departamento(pd.Series([99.0, np.nan]))
+
+
+class TestEmptyAndNullColumns:
+    FUNCIONES = [
+        ubg.get_departamento,
+        ubg.get_provincia,
+        ubg.get_distrito,
+        ubg.get_macrorregion,
+    ]
+
+    @pytest.mark.parametrize("funcion", FUNCIONES)
+    @pytest.mark.parametrize(
+        "ubigeos",
+        [
+            pd.Series([], dtype="str"),
+            pl.Series([], dtype=pl.String),
+            pa.chunked_array([[]], type=pa.string()),
+        ],
+        ids=["pandas", "polars", "pyarrow"],
+    )
+    def test_empty(self, funcion, ubigeos):
+        assert len(funcion(ubigeos)) == 0
+
+    @pytest.mark.parametrize("funcion", FUNCIONES)
+    @pytest.mark.parametrize(
+        "ubigeos",
+        [
+            pd.Series([None, None], dtype="Int64"),
+            pd.Series([np.nan, np.nan]),
+            pl.Series([None, None], dtype=pl.String),
+            pa.chunked_array([[None, None]], type=pa.string()),
+        ],
+        ids=["pandas-Int64", "pandas-float", "polars", "pyarrow"],
+    )
+    def test_all_null(self, funcion, ubigeos):
+        resultado = funcion(ubigeos)
+        if isinstance(resultado, pa.ChunkedArray):
+            resultado = resultado.to_pylist()
+
+        assert pd.isna(list(resultado)).all()
+        assert len(resultado) == 2
+
+
+class TestGetUbigeoSeries:
+    def test_matches_scalar(self):
+        lugares = ["Lima", "Huarochiri", "San Isidro"]
+        niveles = ["departamentos", "provincias", "distritos"]
+
+        for lugar, level in zip(lugares, niveles):
+            resultado = ubg.get_ubigeo(pd.Series([lugar, lugar]), level)
+
+            assert resultado.tolist() == [ubg.get_ubigeo(lugar, level)] * 2
+
+
+class TestArrowDictionaryOutput:
+    def test_dictionary_preserves_chunks(self):
+        ubigeos = pa.chunked_array([["150101", "080101"], [None, "150102"], []])
+
+        resultado = ubg.get_distrito(ubigeos)
+
+        assert resultado.type == pa.dictionary(pa.int32(), pa.string())
+        assert [len(chunk) for chunk in resultado.chunks] == [2, 2, 0]
+        assert resultado.to_pylist() == ["Lima", "Cusco", None, "Ancón"]
+
+    def test_chunks_share_dictionary(self):
+        ubigeos = pa.chunked_array([["150101", "150102"], ["150101", None]])
+
+        resultado = ubg.get_departamento(ubigeos, divide_lima=True)
+
+        primero, segundo = resultado.chunks
+        assert primero.dictionary.equals(segundo.dictionary)
+        assert primero.dictionary.to_pylist() == ["Lima Metropolitana"]
+        assert segundo.indices.to_pylist() == [0, None]
+
+    def test_names_and_codes(self):
+        nombres = pa.chunked_array([["Lince", "ANCON"], ["Lince"]])
+
+        validados = ubg.validate_distrito(nombres)
+        ubigeos = ubg.get_ubigeo(nombres, "distritos")
+
+        assert pa.types.is_dictionary(validados.type)
+        assert validados.to_pylist() == ["Lince", "Ancón", "Lince"]
+        assert ubigeos.num_chunks == 2
+        assert ubigeos.to_pylist() == ["150116", "150102", "150116"]
+        # La salida puede volver a usarse como entrada
+        assert ubg.get_macrorregion(ubigeos).to_pylist() == ["Lima Metropolitana"] * 3
+
+    def test_metadato(self):
+        entrada = pa.chunked_array([["Lince", "150101"], [None]])
+
+        resultado = get_metadato(entrada, level="distritos", key="altitud")
+
+        assert pa.types.is_dictionary(resultado.type)
+        assert [len(chunk) for chunk in resultado.chunks] == [2, 1]
+        assert resultado.to_pylist() == ["150", "162", None]
+
+    def test_other_backends_keep_strings(self):
+        assert ubg.get_distrito(pl.Series(["150101"])).dtype == pl.String
@@ -0,0 +1,68 @@
+import pytest
+
+import ubigeos_peru as ubg
+
+duckdb = pytest.importorskip("duckdb")
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def con():
+    return ubg.register_duckdb(duckdb.connect())
+
+
+class TestDuckDBUDFs:
+    def test_ubigeo_departamento(self, con):
+        result = con.sql(
+            "SELECT ubigeo_departamento(c) FROM (VALUES ('010101'), ('22'), ('150101')) t(c)"
+        ).fetchall()
+        assert [r[0] for r in result] == ["Amazonas", "San Martín", "Lima"]
+
+    def test_ubigeo_distrito_from_integer_column(self, con):
+        result = con.sql(
+            "SELECT ubigeo_distrito(CAST(c AS VARCHAR)) FROM (VALUES (150110), (50110)) t(c)"
+        ).fetchall()
+        assert [r[0] for r in result] == ["Comas", "San Juan Bautista"]
+
+    def test_invalid_codes_and_nulls_return_null(self, con):
+        result = con.sql(
+            "SELECT ubigeo_distrito(c) FROM (VALUES ('999999'), (NULL), ('abc')) t(c)"
+        ).fetchall()
+        assert [r[0] for r in result] == [None, None, None]
+
+    def test_ubigeo_validate(self, con):
+        result = con.sql(
+            """
+            SELECT ubigeo_validate(n, l)
+            FROM (VALUES ('CUZCO', 'departamento'), ('NAZCA', 'provincias'), ('XXXXXXX', 'distritos')) t(n, l)
+            """
+        ).fetchall()
+        assert [r[0] for r in result] == ["Cusco", "Nazca", None]
+
+    def test_many_rows(self, con):
+        result = con.sql(
+            "SELECT DISTINCT ubigeo_departamento('15' || '0101') FROM range(10000)"
+        ).fetchall()
+        assert result == [("Lima",)]
+
+
+class TestDuckDBTables:
+    def test_reference_join(self, con):
+        result = con.sql(
+            """
+            SELECT d.distrito, d.provincia, d.departamento
+            FROM (VALUES ('150116')) t(c)
+            JOIN ubigeo_distritos d ON d.ubigeo = t.c AND d.institucion = 'inei'
+            """
+        ).fetchone()
+        assert result == ("Lince", "Lima", "Lima")
+
+    def test_reference_tables_sizes(self, con):
+        n_deps = con.sql(
+            "SELECT count(*) FROM ubigeo_departamentos WHERE institucion = 'inei'"
+        ).fetchone()[0]
+        n_provs = con.sql(
+            "SELECT count(*) FROM ubigeo_provincias WHERE institucion = 'inei'"
+        ).fetchone()[0]
+        assert n_deps == 25
+        assert n_provs == 196
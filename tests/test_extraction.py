@@ -0,0 +1,94 @@
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import ubigeos_peru as ubg
+from ubigeos_peru.core.extraction import AhoCorasick
+
+
+class TestAhoCorasick:
+    def test_finds_overlapping_patterns(self):
+        automata = AhoCorasick(
+            {
+                ("SANTIAGO",): frozenset({"a"}),
+                ("SANTIAGO", "DE", "SURCO"): frozenset({"b"}),
+                ("SURCO",): frozenset({"c"}),
+                ("DE", "SURCO", "LIMA"): frozenset({"d"}),
+            }
+        )
+
+        menciones = automata.buscar(["AV", "SANTIAGO", "DE", "SURCO", "LIMA"])
+
+        assert sorted((i, f, automata.valores[p]) for i, f, p in menciones) == [
+            (1, 2, frozenset({"a"})),
+            (1, 4, frozenset({"b"})),
+            (2, 5, frozenset({"d"})),
+            (3, 4, frozenset({"c"})),
+        ]
+
+    def test_matches_whole_words_only(self):
+        automata = AhoCorasick({("ATE",): frozenset({"150103"})})
+
+        assert automata.buscar(["AV", "ATENCION"]) == []
+
+
+class TestExtractUbigeo:
+    def test_hierarchy_consistency(self):
+        texto = "AV. LOS INCAS 123, SANTIAGO DE SURCO, LIMA"
+
+        assert ubg.extract_ubigeo(texto) == "150140"
+        assert ubg.extract_ubigeo(texto, level="provincias") == "1501"
+        assert ubg.extract_ubigeo(texto, level="departamentos") == "15"
+
+    def test_ties(self):
+        # Calle con nombre de ubicación: gana la mención de la localidad
+        assert ubg.extract_ubigeo("Jr. Puno 456, Cusco") == "080101"
+        # Sin contexto: gana el más poblado
+        assert ubg.extract_ubigeo("San Isidro") == "150131"
+
+    def test_accents_case_and_aliases(self):
+        assert ubg.extract_ubigeo("calle 5, wanchaq, CUSCO") == "080108"
+        assert ubg.extract_ubigeo("Cuzco", level="departamentos") == "08"
+        assert ubg.extract_ubigeo("los olivos lima") == ubg.get_ubigeo(
+            "Los Olivos", "distritos"
+        )
+
+    def test_no_match(self):
+        assert ubg.extract_ubigeo("sin ubicación conocida") is None
+        # Un departamento no determina un distrito
+        assert ubg.extract_ubigeo("Loreto") is None
+        assert ubg.extract_ubigeo("Loreto", level="departamentos") == "16"
+        assert ubg.extract_ubigeo("") is None
+
+    def test_bulk(self):
+        textos = ["Surco, Lima", None, "Jr. Puno 456, Cusco", "Surco, Lima"]
+        esperado = [ubg.extract_ubigeo(t) if t else None for t in textos]
+
+        assert ubg.extract_ubigeo(textos) == esperado
+        assert ubg.extract_ubigeo(pl.Series(textos)).to_list() == esperado
+        assert ubg.extract_ubigeo(pd.Series(textos)).isna().tolist() == [
+            False,
+            True,
+            False,
+            False,
+        ]
+
+    def test_generator(self):
+        textos = (t for t in ["Jr. Puno 456, Wanchaq, Cusco", None])
+
+        assert ubg.extract_ubigeo(textos) == ["080108", None]
+
+    def test_empty_and_all_null_series(self):
+        pandas = ubg.extract_ubigeo(pd.Series([None, None], dtype=object, index=[3, 4]))
+        arrow = ubg.extract_ubigeo(pa.chunked_array([[None]], type=pa.string()))
+
+        assert pandas.isna().tolist() == [True, True]
+        assert pandas.index.tolist() == [3, 4]
+        assert arrow.type == pa.string()
+        assert arrow.to_pylist() == [None]
+        assert ubg.extract_ubigeo(pl.Series([], dtype=pl.String)).to_list() == []
+
+    def test_invalid_level(self):
+        with pytest.raises(ValueError):
+            ubg.extract_ubigeo("Lima", level="macrorregiones")
@@ -1,4 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+from rapidfuzz import fuzz
+
 import ubigeos_peru as ubg
+from ubigeos_peru.core import _executor
+from ubigeos_peru.core._utils import clave_fonetica
 
 
 class TestFuzzyMatch:
@@ -39,6 +49,255 @@ class TestFuzzyMatch:
             )
 
 
+class TestFuzzyMatchSeries:
+    def test_fuzzy_match_series_keeps_order_and_duplicates(
+        self, fuzzy_match_test_cases
+    ):
+        test_cases = fuzzy_match_test_cases["distritos"]
+        originales = list(test_cases) * 3
+        result = ubg.validate_distrito(
+            pd.Series(originales), fuzzy_match=True, on_error="ignore"
+        )
+
+        assert isinstance(result, pd.Series)
+        assert result.tolist() == [test_cases[original] for original in originales]
+
+    def test_fuzzy_match_series_n_jobs(self, fuzzy_match_test_cases, monkeypatch):
+        # Se baja el umbral para que el pool de procesos se use con pocos valores
+        monkeypatch.setattr(_executor, "_MIN_ITEMS_PARALELO", 1)
+        test_cases = fuzzy_match_test_cases["distritos"]
+        originales = pl.Series("DISTRITO", list(test_cases))
+
+        secuencial = ubg.validate_distrito(
+            originales, fuzzy_match=True, on_error="ignore"
+        )
+        paralelo = ubg.validate_distrito(
+            originales, fuzzy_match=True, on_error="ignore", n_jobs=2
+        )
+
+        assert isinstance(paralelo, pl.Series)
+        assert paralelo.to_list() == secuencial.to_list()
+        assert paralelo.to_list() == list(test_cases.values())
+
+    def test_fuzzy_match_series_executor(self, fuzzy_match_test_cases):
+        test_cases = fuzzy_match_test_cases["distritos"]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = ubg.validate_distrito(
+                pd.Series(list(test_cases)),
+                fuzzy_match=True,
+                on_error="ignore",
+                executor=executor,
+            )
+
+        assert result.tolist() == list(test_cases.values())
+
+
+class TestFuzzyReport:
+    def test_report_columns_and_row_counts(self, capsys):
+        valores = ["Miraflors", "Lince", "Miraflors", "CHORRILOS", "XXXXXX"]
+
+        result, reporte = ubg.validate_distrito(
+            pd.Series(valores), fuzzy_match=True, on_error="coerce", fuzzy_report=True
+        )
+
+        assert capsys.readouterr().out == ""
+        assert result[[0, 1, 3]].tolist() == ["Miraflores", "Lince", "Chorrillos"]
+        assert list(reporte.columns) == ["original", "match", "score", "filas"]
+        assert reporte["original"].tolist() == ["Miraflors", "CHORRILOS"]
+        assert reporte["match"].tolist() == ["MIRAFLORES", "CHORRILLOS"]
+        assert reporte["filas"].tolist() == [2, 1]
+        assert reporte["score"].between(80, 100).all()
+
+    def test_report_backend_and_empty(self):
+        result, reporte = ubg.validate_provincia(
+            pl.Series(["Huarochiri"]), fuzzy_match=True, fuzzy_report=True
+        )
+
+        assert isinstance(result, pl.Series)
+        assert isinstance(reporte, pl.DataFrame)
+        assert reporte.height == 0
+        assert reporte.schema["filas"] == pl.Int64
+
+    def test_prints_by_default(self, capsys):
+        ubg.validate_distrito(pd.Series(["Miraflors"]), fuzzy_match=True)
+
+        assert "MIRAFLORS -> MIRAFLORES" in capsys.readouterr().out
+
+
+class TestScorer:
+    def test_scorer_by_name_and_callable(self):
+        por_nombre = ubg.validate_distrito(
+            "Miraflors", fuzzy_match=True, scorer="token_sort_ratio"
+        )
+        por_funcion = ubg.validate_distrito(
+            "Miraflors", fuzzy_match=True, scorer=fuzz.token_sort_ratio
+        )
+
+        assert por_nombre == por_funcion == "Miraflores"
+
+    def test_score_cutoff_rejects_weak_match(self):
+        assert ubg.validate_distrito("Miraflors", fuzzy_match=True) == "Miraflores"
+        assert (
+            ubg.validate_distrito(
+                "Miraflors", fuzzy_match=True, score_cutoff=99, on_error="coerce"
+            )
+            is None
+        )
+
+        result = ubg.validate_distrito(
+            pd.Series(["Miraflors", "Lince"]),
+            fuzzy_match=True,
+            score_cutoff=99,
+            on_error="coerce",
+        )
+        assert result.isna().tolist() == [True, False]
+        assert result[1] == "Lince"
+
+    @pytest.mark.parametrize(
+        "kwargs, error",
+        [
+            ({"scorer": "no_existe"}, ValueError),
+            ({"score_cutoff": 120}, ValueError),
+            ({"score_cutoff": "80"}, TypeError),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, error):
+        with pytest.raises(error):
+            ubg.validate_distrito("Miraflors", fuzzy_match=True, **kwargs)
+
+
+class TestFuzzyCandidates:
+    def test_str(self):
+        candidatos = ubg.fuzzy_candidates("Miraflors", limit=3)
+
+        assert len(candidatos) == 3
+        assert candidatos[0][0] == "Miraflores"
+        scores = [score for _, score in candidatos]
+        assert scores == sorted(scores, reverse=True)
+        assert all(score >= 60 for score in scores)
+        # Cada nombre oficial aparece una sola vez
+        assert len({nombre for nombre, _ in candidatos}) == 3
+
+    def test_score_cutoff_and_limit(self):
+        assert ubg.fuzzy_candidates("XXXXXXXX", score_cutoff=95) == []
+        assert len(ubg.fuzzy_candidates("Huarochiri", "provincias", limit=1)) == 1
+        with pytest.raises(ValueError):
+            ubg.fuzzy_candidates("Miraflors", limit=0)
+
+    def test_pandas_keeps_index_and_nulls(self):
+        serie = pd.Series(["Miraflors", None, "Miraflors"], index=[5, 6, 7], name="d")
+
+        result = ubg.fuzzy_candidates(serie, limit=2)
+
+        assert isinstance(result.dtype, pd.ArrowDtype)
+        assert result.index.tolist() == [5, 6, 7]
+        assert result.name == "d"
+        assert result.isna().tolist() == [False, True, False]
+        assert [c["nombre"] for c in result[5]] == [
+            nombre for nombre, _ in ubg.fuzzy_candidates("Miraflors", limit=2)
+        ]
+
+    def test_polars_and_pyarrow(self):
+        polars = ubg.fuzzy_candidates(pl.Series("d", ["Lince", None]), limit=2)
+        arrow = ubg.fuzzy_candidates(pa.chunked_array([["Lince", None]]), limit=2)
+
+        assert isinstance(polars, pl.Series)
+        assert polars.name == "d"
+        assert polars[0][0]["nombre"] == "Lince"
+        assert polars[1] is None
+        assert isinstance(arrow, pa.ChunkedArray)
+        assert arrow.to_pylist()[0][0] == {"nombre": "Lince", "score": 100.0}
+        assert arrow.to_pylist()[1] is None
+
+    def test_all_null_and_no_match(self):
+        nulos = ubg.fuzzy_candidates(pd.Series([None, None]), limit=2)
+        arrow = ubg.fuzzy_candidates(
+            pa.chunked_array([["XXXXXXXX", "Lince", "XXXXXXXX"]]),
+            limit=1,
+            score_cutoff=90,
+        )
+
+        assert nulos.isna().tolist() == [True, True]
+        assert arrow.to_pylist() == [[], [{"nombre": "Lince", "score": 100.0}], []]
+
+
+class TestPhonetic:
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ("NAZCA", "NASCA"),
+            ("TOMAY KICHWA", "TOMAY-QUICHUA"),
+            ("SANTA RITA DE SIHUAS", "SANTA RITA DE SIGUAS"),
+            ("HUANUCO", "WANUKO"),
+            ("VILCABAMBA", "BILCAVAMBA"),
+            ("SAN JUAN DE YSCOS", "SAN JUAN DE ISCOS"),
+            ("CHORRILLOS", "CHORRIYOS"),
+            ("HUANCAYO", "GUANCAYO"),
+        ],
+    )
+    def test_same_key(self, a, b):
+        assert clave_fonetica(a) == clave_fonetica(b)
+
+    @pytest.mark.parametrize(
+        "a, b", [("CHILCA", "SILCA"), ("LIMA", "LIMAS"), ("GERONA", "GUERRA")]
+    )
+    def test_different_key(self, a, b):
+        assert clave_fonetica(a) != clave_fonetica(b)
+
+    def test_ambiguous_keys_are_dropped(self):
+        # NAZCA y NASCA son provincias distintas en las equivalencias
+        indice = ubg.ResourceManager.cargar_indice_fonetico("provincias")
+
+        assert clave_fonetica("NAZCA") not in indice
+        assert ubg.validate_provincia("NASCA", fuzzy_match=True) == "Nasca"
+
+    def test_resolves_before_fuzzy_without_cutoff(self):
+        # Por fuzzy matching el score queda por debajo de 80
+        assert (
+            ubg.validate_departamento("WANUKO", fuzzy_match=True, normalize=True)
+            == "HUANUCO"
+        )
+        assert (
+            ubg.validate_departamento(
+                "WANUKO", fuzzy_match=True, score_cutoff=99, phonetic=True
+            )
+            == "Huánuco"
+        )
+        assert ubg.validate_departamento("WANUKO", on_error="coerce") is None
+
+    def test_explicit_cutoff_disables_phonetic(self):
+        # La clave iguala Ñ y N: un umbral estricto no debe dejar pasar ZANA -> Saña
+        assert ubg.validate_distrito("ZANA", fuzzy_match=True) == "Saña"
+        assert (
+            ubg.validate_distrito(
+                "ZANA", fuzzy_match=True, score_cutoff=95, on_error="coerce"
+            )
+            is None
+        )
+        assert (
+            ubg.validate_distrito(
+                "ZANA", fuzzy_match=True, phonetic=False, on_error="coerce"
+            )
+            != "Saña"
+        )
+        resultado = ubg.validate_departamento(
+            pd.Series(["WANUKO"]), fuzzy_match=True, score_cutoff=95, on_error="coerce"
+        )
+        assert resultado.isna().all()
+
+    def test_series_and_report(self):
+        result, reporte = ubg.validate_distrito(
+            pd.Series(["COZNIPATA", "Lince", "COZNIPATA"]),
+            fuzzy_match=True,
+            fuzzy_report=True,
+        )
+
+        assert result.tolist() == ["Kosñipata", "Lince", "Kosñipata"]
+        assert reporte["original"].tolist() == ["COZNIPATA"]
+        assert reporte["match"].tolist() == ["KOSNIPATA"]
+        assert reporte["filas"].tolist() == [2]
+
+
 # if __name__ == "__main__":
 #     test_scorers()
 #     # test_fuzzy_match_batch()
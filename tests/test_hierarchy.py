@@ -0,0 +1,46 @@
+import pytest
+
+import ubigeos_peru as ubg
+
+
+class TestHierarchy:
+    def test_children(self):
+        provincias = ubg.children("08")
+        distritos = ubg.children(1501)
+
+        assert provincias["0801"] == "Cusco"
+        assert all(
+            codigo.startswith("08") and len(codigo) == 4 for codigo in provincias
+        )
+        assert list(distritos)[:2] == ["150101", "150102"]
+        assert distritos["150116"] == "Lince"
+        assert ubg.children("150116") == {}
+
+    def test_children_match_prefix_scan(self):
+        distritos = ubg.cargar_diccionario("distritos", "reniec")
+        esperado = {c: n for c, n in distritos.items() if c.startswith("1401")}
+
+        assert ubg.children("1401", institucion="reniec") == esperado
+
+    def test_parent(self):
+        assert ubg.parent("150116") == "1501"
+        assert ubg.parent(1501) == "15"
+        assert ubg.parent("15") is None
+        with pytest.raises(ValueError):
+            ubg.parent("1501011")
+
+    def test_descendants(self):
+        distritos = ubg.descendants("08", level="distritos")
+
+        assert len(distritos) == sum(
+            len(ubg.children(provincia)) for provincia in ubg.children("08")
+        )
+        assert list(ubg.descendants("15", level="provincias"))[0] == "1501"
+
+    def test_invalid_codes(self):
+        with pytest.raises(KeyError):
+            ubg.children("99")
+        with pytest.raises(ValueError):
+            ubg.descendants("1501", level="provincias")
+        with pytest.raises(ValueError):
+            ubg.descendants("15", level="regiones")
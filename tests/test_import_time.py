@@ -0,0 +1,70 @@
+"""
+Presupuesto de tiempo de importación, medido con `python -X importtime` en un
+proceso nuevo para que no influyan los módulos ya cargados por pytest.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# Presupuesto para el tiempo acumulado de `import ubigeos_peru` (microsegundos)
+IMPORT_BUDGET_US = 60_000
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def cumulative_import_time(stderr: str, module: str) -> int:
+    # Formato: "import time: self [us] | cumulative | imported package"
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"No se encontró {module} en la salida de -X importtime")
+
+
+class TestImportTime:
+    def test_import_time_budget(self):
+        result = run_python("import ubigeos_peru", "-X", "importtime")
+        cumulative = cumulative_import_time(result.stderr, "ubigeos_peru")
+
+        assert cumulative < IMPORT_BUDGET_US, (
+            f"import ubigeos_peru tomó {cumulative} us (presupuesto: {IMPORT_BUDGET_US} us)"
+        )
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        code = (
+            "import sys, json, ubigeos_peru as ubg\n"
+            "loaded = lambda: [m for m in ('narwhals', 'rapidfuzz', 'orjson') if m in sys.modules]\n"
+            "after_import = loaded()\n"
+            "assert ubg.get_departamento('15') == 'Lima'\n"
+            "assert ubg.validate_departamento('CUSCO') == 'Cusco'\n"
+            "after_scalar = loaded()\n"
+            "print(json.dumps([after_import, after_scalar]))"
+        )
+        after_import, after_scalar = json.loads(run_python(code).stdout)
+
+        assert after_import == []
+        assert after_scalar == ["orjson"]
+
+    def test_series_and_fuzzy_load_dependencies_on_demand(self):
+        code = (
+            "import sys, json, pandas as pd, ubigeos_peru as ubg\n"
+            "ubg.get_departamento(pd.Series(['15']))\n"
+            "series = 'narwhals' in sys.modules\n"
+            "ubg.validate_departamento('AMAZONS', fuzzy_match=True)\n"
+            "fuzzy = 'rapidfuzz' in sys.modules\n"
+            "print(json.dumps([series, fuzzy]))"
+        )
+        assert json.loads(run_python(code).stdout) == [True, True]
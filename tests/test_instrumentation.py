@@ -0,0 +1,91 @@
+import pandas as pd
+import polars as pl
+import pytest
+
+import ubigeos_peru as ubg
+
+
+@pytest.fixture
+def instrumentado():
+    ubg.stats(reset=True)
+    ubg.enable_stats()
+    yield
+    ubg.disable_stats()
+    ubg.stats(reset=True)
+
+
+class TestStats:
+    def test_disabled_by_default(self):
+        ubg.stats(reset=True)
+
+        ubg.get_distrito("150101")
+        ubg.get_distrito(pd.Series(["150101"]))
+
+        assert ubg.stats() == {"activo": False, "contadores": {}, "tiempos": {}}
+
+    def test_lookup_counters(self, instrumentado):
+        ubg.get_distrito("150101")
+        ubg.get_provincia(pl.Series(["150101", "080101", None]))
+        ubg.get_distrito(pd.Series(["150101", "999999"]), on_error="coerce")
+
+        contadores = ubg.stats()["contadores"]
+
+        assert contadores["consultas"] == 6
+        assert contadores["errores_coerce"] == 1
+        # Un acceso al recurso por llamada, ya cargado o no según los tests previos
+        accesos = contadores.get("cache_hits", 0) + contadores.get("cache_misses", 0)
+        assert accesos == 3
+
+    def test_fuzzy_counters(self, instrumentado):
+        ubg.validate_distrito("MIRAFLORS", fuzzy_match=True)
+        ubg.validate_distrito(
+            pd.Series(["Lince", "CHORRILOS", "XXXXXXXX", "XXXXXXXX"]),
+            fuzzy_match=True,
+            on_error="coerce",
+        )
+
+        contadores = ubg.stats()["contadores"]
+
+        assert contadores["fuzzy_llamadas"] == 3
+        assert contadores["fuzzy_aceptados"] == 2
+        assert contadores["fuzzy_rechazados"] == 1
+        assert contadores["errores_coerce"] == 1
+
+    def test_phonetic_counter(self, instrumentado):
+        ubg.validate_departamento("WANUKO", fuzzy_match=True)
+        ubg.validate_distrito(pd.Series(["COZNIPATA", "MIRAFLORS"]), fuzzy_match=True)
+
+        contadores = ubg.stats()["contadores"]
+
+        assert contadores["foneticos"] == 2
+        # Solo lo que no resuelve el índice fonético llega a rapidfuzz
+        assert contadores["fuzzy_llamadas"] == 1
+
+    def test_phase_timers(self, instrumentado):
+        ubg.ResourceManager.unload("provincias", "reniec")
+        ubg.get_provincia(pd.Series(["0101"]), institucion="reniec")
+        ubg.validate_provincia(pd.Series(["HUAROCHIR"]), fuzzy_match=True)
+
+        reporte = ubg.stats(reset=True)
+
+        assert reporte["contadores"]["cache_misses"] >= 1
+        assert {"carga", "normalizacion", "busqueda", "fuzzy", "series"} <= set(
+            reporte["tiempos"]
+        )
+        carga = reporte["tiempos"]["carga"]
+        assert carga["llamadas"] >= 1
+        assert 0 < carga["max"] <= carga["segundos"]
+        assert ubg.stats()["tiempos"] == {}
+
+    def test_callback(self, instrumentado):
+        eventos = []
+        ubg.enable_stats(callback=lambda *evento: eventos.append(evento))
+
+        ubg.get_distrito(pd.Series(["150101", "080101"]))
+
+        assert ("contador", "consultas", 2) in eventos
+        assert any(tipo == "tiempo" and fase == "busqueda" for tipo, fase, _ in eventos)
+
+        ubg.disable_stats()
+        ubg.get_distrito("150101")
+        assert ("contador", "consultas", 1) not in eventos
@@ -0,0 +1,75 @@
+import pandas as pd
+import polars as pl
+import pytest
+
+import ubigeos_peru as ubg
+
+
+class TestMixedMacrorregion:
+    def test_codes_and_names_keep_order(self):
+        valores = ["01", "Cusco", "150101", "lima", "2", 15]
+        esperado = [ubg.get_macrorregion(v) for v in valores]
+
+        resultado = ubg.get_macrorregion(pd.Series(valores))
+
+        assert resultado.tolist() == esperado
+
+    def test_polars_with_nulls(self):
+        resultado = ubg.get_macrorregion(
+            pl.Series("dep", ["Ucayali", None, "150101"]), institucion="minsa"
+        )
+
+        assert resultado.name == "dep"
+        assert resultado.to_list() == ["Oriente", None, "Lima y Callao"]
+
+    def test_code_with_other_institution(self):
+        assert ubg.get_macrorregion(25, institucion="ceplan") == "Nororiente"
+        assert ubg.get_macrorregion(
+            pd.Series(["25", "Ucayali"]), institucion="ceplan"
+        ).tolist() == ["Nororiente", "Nororiente"]
+
+    def test_fuzzy_names_are_silent(self, capsys):
+        resultado = ubg.get_macrorregion(pd.Series(["Amazonass", "15", None]))
+
+        assert resultado.tolist()[:2] == ["Oriente", "Lima Metropolitana"]
+        assert capsys.readouterr().out == ""
+
+    def test_errors(self):
+        with pytest.raises(KeyError):
+            ubg.get_macrorregion(pd.Series(["Cusco", "99"]))
+        with pytest.raises(KeyError):
+            ubg.get_macrorregion(pd.Series(["15"]), institucion="ceplan")
+        with pytest.raises(ValueError):
+            ubg.get_macrorregion(pd.Series(["1501011"]))
+
+
+class TestMixedMetadato:
+    def test_codes_and_names(self):
+        resultado = ubg.core.get_metadato(
+            pd.Series(["Lince", "150116", None, 150131]),
+            level="distritos",
+            key="superficie",
+        )
+
+        assert resultado.tolist()[:2] == ["3.03", "3.03"]
+        assert pd.isna(resultado[2])
+        assert resultado[3] == "11.1"
+
+    def test_provincias(self):
+        resultado = ubg.core.get_metadato(
+            pl.Series(["0801", "Huarochiri", "1507"]), level="provincias"
+        )
+
+        assert resultado.to_list() == ["Cusco", "Matucana", "Matucana"]
+
+    def test_fuzzy_names_are_silent(self, capsys):
+        resultado = ubg.core.get_metadato(
+            pd.Series(["Miraflors", "150101"]), level="distritos"
+        )
+
+        assert resultado.tolist()[1] == "Lima"
+        assert capsys.readouterr().out == ""
+
+    def test_short_code_for_level(self):
+        with pytest.raises(ValueError):
+            ubg.core.get_metadato(pd.Series(["15", "Lima"]), level="provincias")
@@ -0,0 +1,257 @@
+import threading
+import time
+from types import MappingProxyType
+
+import pytest
+
+import ubigeos_peru as ubg
+from ubigeos_peru.core import resource_manager
+from ubigeos_peru.core.resource_manager import ResourceManager
+
+
+@pytest.fixture
+def fresh_resources(monkeypatch):
+    """
+    Vacía los recursos publicados y cuenta cuántas veces se parsea cada archivo.
+    """
+    monkeypatch.setattr(ResourceManager, "_loaded", {})
+    parseos: dict[str, int] = {}
+    leer_recurso = resource_manager._leer_recurso
+    lock = threading.Lock()
+
+    def leer_recurso_lento(ruta):
+        with lock:
+            parseos[ruta] = parseos.get(ruta, 0) + 1
+        # Ensancha la ventana de carrera entre los primeros llamadores
+        time.sleep(0.05)
+        return leer_recurso(ruta)
+
+    monkeypatch.setattr(resource_manager, "_leer_recurso", leer_recurso_lento)
+    return parseos
+
+
+class TestResourceManager:
+    def test_resources_are_read_only(self):
+        distritos = ResourceManager.cargar_diccionario("distritos")
+
+        assert isinstance(distritos, MappingProxyType)
+        with pytest.raises(TypeError):
+            distritos["inei"]["150101"] = "Otro"
+
+    def test_unknown_resource(self):
+        with pytest.raises(KeyError):
+            ResourceManager.cargar_diccionario("no_existe")
+
+    def test_concurrent_first_callers_parse_once(self, fresh_resources):
+        n_threads = 32
+        barrier = threading.Barrier(n_threads)
+        resultados = []
+        errores = []
+
+        def worker(i):
+            try:
+                barrier.wait()
+                if i % 2:
+                    resultados.append(ResourceManager.cargar_diccionario("distritos"))
+                else:
+                    assert ubg.get_distrito("150116") == "Lince"
+                    resultados.append(ResourceManager.cargar_diccionario("distritos"))
+            except BaseException as e:
+                errores.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errores == []
+        assert fresh_resources == {
+            "distritos/inei": 1,
+            "distritos/reniec": 1,
+            "distritos/sunat": 1,
+        }
+        assert len(resultados) == n_threads
+        assert all(resultado is resultados[0] for resultado in resultados)
+
+    def test_concurrent_different_resources(self, fresh_resources):
+        nombres = ["departamentos", "provincias", "distritos", "equivalencias"] * 8
+        barrier = threading.Barrier(len(nombres))
+
+        def worker(nombre):
+            barrier.wait()
+            ResourceManager.cargar_diccionario(nombre)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in nombres]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert set(fresh_resources.values()) == {1}
+        assert len(fresh_resources) == 12
+
+
+class TestPartialLoading:
+    def test_loads_only_requested_institution(self, fresh_resources):
+        assert ubg.get_distrito("150116") == "Lince"
+
+        assert fresh_resources == {"distritos/inei": 1}
+
+    def test_slices_are_shared_with_full_resource(self, fresh_resources):
+        inei = ResourceManager.cargar_diccionario("distritos", "inei")
+        distritos = ResourceManager.cargar_diccionario("distritos")
+
+        assert distritos["inei"] is inei
+        assert list(distritos) == ["inei", "reniec", "sunat"]
+        assert fresh_resources["distritos/inei"] == 1
+
+    def test_nested_partitions(self, fresh_resources):
+        mapping = ResourceManager.cargar_diccionario("inverted", "distritos", "reniec")
+
+        assert (
+            mapping
+            is ResourceManager.cargar_diccionario("inverted")["distritos"]["reniec"]
+        )
+        assert list(ResourceManager.cargar_diccionario("equivalencias")) == [
+            "departamentos",
+            "provincias",
+            "distritos",
+        ]
+
+    def test_keys_beyond_partition(self):
+        assert (
+            ResourceManager.cargar_diccionario("distritos", "inei", "150116") == "Lince"
+        )
+
+    def test_unknown_partition(self):
+        with pytest.raises(KeyError):
+            ResourceManager.cargar_diccionario("distritos", "minsa")
+
+
+class TestPreload:
+    def test_preload_report(self, monkeypatch):
+        monkeypatch.setattr(ResourceManager, "_loaded", {})
+        monkeypatch.setattr(ResourceManager, "_derived", {})
+
+        reporte = ubg.preload(levels=["distritos"], institutions=["inei"])
+
+        assert {
+            "distritos/inei",
+            "equivalencias/distritos",
+            "inverted/distritos/inei",
+            "distritos/inei/normalize",
+            "equivalencias/distritos/normalize",
+            "equivalencias/distritos/fuzzy",
+            "equivalencias/distritos/fonetico",
+        } <= set(reporte)
+        assert "provincias/inei/normalize" not in reporte
+        assert "distritos/reniec" not in reporte
+        assert reporte["distritos/inei"]["ya_cargado"] is False
+        assert reporte["distritos/inei"]["bytes"] > 0
+        assert all(r["segundos"] >= 0 for r in reporte.values())
+
+        segundo = ubg.preload(levels=["distritos"], institutions=["inei"])
+        assert all(r["ya_cargado"] for r in segundo.values())
+
+    def test_derived_structures_are_built_once(self):
+        normalizado = ResourceManager.cargar_normalizado("distritos", "inei")
+
+        assert normalizado is ResourceManager.cargar_normalizado("distritos", "inei")
+        assert normalizado["150101"] == "LIMA"
+        assert ResourceManager.cargar_indice_fuzzy(
+            "distritos"
+        ) is ResourceManager.cargar_indice_fuzzy("distritos")
+
+    def test_preload_invalid_level(self):
+        with pytest.raises(ValueError):
+            ubg.preload(levels=["regiones"])
+
+    def test_preload_rejects_strings_and_empty_loads_nothing(self):
+        with pytest.raises(TypeError):
+            ubg.preload(levels="distritos")
+        with pytest.raises(TypeError):
+            ubg.preload(institutions="inei")
+
+        assert ubg.preload(levels=[]) == {}
+
+
+@pytest.fixture
+def budget_state(monkeypatch):
+    """
+    Estado aislado para las pruebas de liberación y presupuesto de memoria.
+    """
+    monkeypatch.setattr(ResourceManager, "_loaded", {})
+    monkeypatch.setattr(ResourceManager, "_derived", {})
+    monkeypatch.setattr(ResourceManager, "_sizes", {})
+    monkeypatch.setattr(ResourceManager, "_last_used", {})
+    monkeypatch.setattr(ResourceManager, "_memory_budget", None)
+
+
+class TestMemoryBudget:
+    def test_unload_and_transparent_reload(self, budget_state):
+        distritos = ResourceManager.cargar_diccionario("distritos")
+        ResourceManager.cargar_normalizado("distritos", "inei")
+
+        assert ResourceManager.unload("distritos") is True
+        assert not any(ruta.startswith("distritos") for ruta in ResourceManager._loaded)
+        assert ("distritos", "inei", "normalize") not in ResourceManager._derived
+        assert ResourceManager.unload("distritos") is False
+        # La referencia previa sigue siendo válida
+        assert distritos["inei"]["150116"] == "Lince"
+
+        assert ubg.get_distrito("150116") == "Lince"
+        assert "distritos/inei" in ResourceManager._loaded
+
+    def test_unload_single_partition(self, budget_state):
+        ResourceManager.cargar_diccionario("distritos")
+
+        assert ResourceManager.unload("distritos", "reniec") is True
+        assert set(ResourceManager._loaded) == {"distritos/inei", "distritos/sunat"}
+
+    def test_unload_unknown_resource(self):
+        with pytest.raises(KeyError):
+            ResourceManager.unload("no_existe")
+
+    def test_memory_usage(self, budget_state):
+        ResourceManager.cargar_diccionario("departamentos")
+        ResourceManager.cargar_diccionario("distritos")
+        ResourceManager.cargar_normalizado("distritos", "inei")
+
+        uso = ResourceManager.memory_usage()
+        detalle = ResourceManager.memory_usage(detalle=True)
+
+        assert set(uso) == {"departamentos", "distritos"}
+        assert uso["distritos"] > uso["departamentos"] > 0
+        assert {
+            "departamentos/inei",
+            "distritos/sunat",
+            "distritos/inei/normalize",
+        } <= set(detalle)
+        assert uso["distritos"] == sum(
+            size for nombre, size in detalle.items() if nombre.startswith("distritos/")
+        )
+
+    def test_lru_eviction(self, budget_state):
+        ResourceManager.cargar_diccionario("departamentos")
+        ResourceManager.cargar_diccionario("provincias")
+        uso = ResourceManager.memory_usage()
+        ResourceManager.set_memory_budget(sum(uso.values()))
+
+        # Se usa departamentos para que provincias quede como el menos reciente
+        ResourceManager.cargar_diccionario("departamentos")
+        ResourceManager.cargar_diccionario("macrorregiones")
+
+        assert "provincias" not in ResourceManager._loaded
+        assert {"departamentos", "macrorregiones"} <= set(ResourceManager._loaded)
+        assert ubg.get_provincia("1501") == "Lima"
+
+    def test_resource_larger_than_budget_is_kept(self, budget_state):
+        ResourceManager.set_memory_budget(0)
+
+        assert ubg.get_distrito("150116") == "Lince"
+        assert set(ResourceManager._loaded) == {"distritos/inei"}
+
+    def test_invalid_budget(self):
+        with pytest.raises(ValueError):
+            ResourceManager.set_memory_budget(-1)
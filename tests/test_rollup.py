@@ -0,0 +1,105 @@
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import ubigeos_peru as ubg
+
+DATA = {
+    "ubigeo": ["150101", "150116", "080101", None, "010101", "080201"],
+    "casos": [3, 4, 5, 6, 1, 2],
+    "tasa": [1.0, 3.0, 2.0, 9.0, 5.0, 4.0],
+}
+
+
+class TestRollup:
+    @pytest.mark.parametrize("backend", [pd.DataFrame, pl.DataFrame, pa.table])
+    def test_departamentos(self, backend):
+        resultado = ubg.rollup(backend(DATA), "ubigeo", "casos")
+        df = (
+            pl.from_pandas(resultado)
+            if backend is pd.DataFrame
+            else pl.DataFrame(resultado)
+        )
+
+        assert type(resultado) is type(backend(DATA))
+        assert df.columns == ["ubigeo", "departamento", "casos"]
+        assert df["ubigeo"].to_list() == ["01", "08", "15"]
+        assert df["departamento"].to_list() == ["Amazonas", "Cusco", "Lima"]
+        assert df["casos"].to_list() == [1, 7, 7]
+
+    def test_provincias_with_agg_per_column(self):
+        resultado = ubg.rollup(
+            pd.DataFrame(DATA),
+            "ubigeo",
+            ["casos", "tasa"],
+            to="provincias",
+            agg={"casos": "sum", "tasa": "mean"},
+        )
+
+        assert resultado["ubigeo"].tolist() == ["0101", "0801", "0802", "1501"]
+        assert resultado["provincia"].tolist() == [
+            "Chachapoyas",
+            "Cusco",
+            "Acomayo",
+            "Lima",
+        ]
+        assert resultado["casos"].tolist() == [1, 5, 2, 7]
+        assert resultado["tasa"].tolist() == [5.0, 2.0, 4.0, 2.0]
+
+    def test_matches_groupby_on_names(self):
+        df = pd.DataFrame(
+            {"ubigeo": list(ubg.cargar_diccionario("distritos", "inei"))}
+        ).assign(valor=1)
+        esperado = (
+            df.assign(dep=ubg.get_departamento(df["ubigeo"]))
+            .groupby("dep")["valor"]
+            .sum()
+        )
+
+        resultado = ubg.rollup(df, "ubigeo", "valor").set_index("departamento")
+
+        assert resultado["valor"].to_dict() == esperado.to_dict()
+
+    def test_integer_codes(self):
+        df = pl.DataFrame({"ubigeo": [10101, 150101, 150102], "n": [1, 2, 3]})
+
+        resultado = ubg.rollup(df, "ubigeo", "n", to="provincias")
+
+        assert resultado["ubigeo"].to_list() == ["0101", "1501"]
+        assert resultado["n"].to_list() == [1, 5]
+
+    def test_macrorregiones(self):
+        inei = ubg.rollup(pd.DataFrame(DATA), "ubigeo", "casos", to="macrorregiones")
+        minsa = ubg.rollup(
+            pd.DataFrame({"dep": ["15", "07", "08"], "casos": [1, 2, 3]}),
+            "dep",
+            "casos",
+            to="macrorregiones",
+            institucion="minsa",
+        )
+
+        assert dict(zip(inei["macrorregion"], inei["casos"])) == {
+            "Lima Metropolitana": 7,
+            "Oriente": 1,
+            "Sur": 7,
+        }
+        assert dict(zip(minsa["macrorregion"], minsa["casos"])) == {
+            "Lima y Callao": 3,
+            "Sur": 3,
+        }
+
+    def test_invalid_arguments(self):
+        df = pd.DataFrame(DATA)
+
+        with pytest.raises(ValueError):
+            ubg.rollup(df, "ubigeo", "casos", to="distritos")
+        with pytest.raises(ValueError):
+            ubg.rollup(df, "ubigeo", "casos", agg="mode")
+        with pytest.raises(ValueError):
+            ubg.rollup(
+                pd.DataFrame({"dep": ["15"], "casos": [1]}),
+                "dep",
+                "casos",
+                to="departamentos",
+            )
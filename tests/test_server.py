@@ -0,0 +1,199 @@
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from ubigeos_peru.cli import _build_parser
+
+pa = pytest.importorskip("pyarrow")
+
+from ubigeos_peru.server import (  # noqa: E402
+    _COS_REFERENCIA,
+    _IndiceCoordenadas,
+    make_server,
+)
+
+ARROW = "application/vnd.apache.arrow.stream"
+
+
+@pytest.fixture(scope="module")
+def url():
+    servidor = make_server(port=0, preload=False)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    yield f"http://127.0.0.1:{servidor.server_address[1]}"
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def pedir(url, ruta, datos=None, tipo="application/json"):
+    if datos is not None and not isinstance(datos, bytes):
+        datos = json.dumps(datos).encode()
+    request = urllib.request.Request(
+        url + ruta, data=datos, headers={"Content-Type": tipo}
+    )
+    try:
+        with urllib.request.urlopen(request) as respuesta:
+            return respuesta.status, respuesta.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def pedir_json(url, ruta, datos=None):
+    estado, cuerpo = pedir(url, ruta, datos)
+    return estado, json.loads(cuerpo)
+
+
+def a_ipc(tabla):
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, tabla.schema) as writer:
+        writer.write_table(tabla)
+    return sink.getvalue().to_pybytes()
+
+
+class TestSingle:
+    def test_codigo(self, url):
+        assert pedir_json(url, "/distrito?codigo=150101") == (
+            200,
+            {"resultado": "Lima"},
+        )
+        assert pedir_json(url, "/departamento?codigo=8&normalize=true") == (
+            200,
+            {"resultado": "CUSCO"},
+        )
+
+    def test_validate(self, url):
+        estado, datos = pedir_json(
+            url, "/validate?nombre=Miraflors&level=distritos&fuzzy_match=true"
+        )
+
+        assert (estado, datos) == (200, {"resultado": "Miraflores"})
+
+    def test_errors(self, url):
+        estado, datos = pedir_json(url, "/provincia?codigo=9999&on_error=raise")
+        assert estado == 404
+        assert "9999" in datos["error"]
+
+        assert pedir_json(url, "/validate?nombre=Lima&level=regiones")[0] == 400
+        assert pedir_json(url, "/distrito")[0] == 400
+        assert pedir_json(url, "/no_existe")[0] == 404
+        assert pedir_json(url, "/health") == (200, {"estado": "ok"})
+
+
+class TestBatch:
+    def test_json_codigos(self, url):
+        estado, datos = pedir_json(
+            url, "/distrito", {"codigos": ["150101", 10101, None, "999999"]}
+        )
+
+        assert estado == 200
+        assert datos == {"resultado": ["Lima", "Chachapoyas", None, None]}
+
+    def test_json_validate_with_nulls(self, url):
+        estado, datos = pedir_json(
+            url,
+            "/validate",
+            {
+                "nombres": ["Miraflors", None, "HUAROCHIRI"],
+                "level": "provincias",
+                "fuzzy_match": True,
+                "normalize": True,
+            },
+        )
+
+        assert estado == 200
+        assert datos == {"resultado": [None, None, "HUAROCHIRI"]}
+
+    def test_arrow_ipc(self, url):
+        tabla = pa.table({"otra": [1, 2, 3], "codigo": ["150101", "080101", None]})
+
+        estado, cuerpo = pedir(url, "/provincia?normalize=1", a_ipc(tabla), ARROW)
+        resultado = pa.ipc.open_stream(cuerpo).read_all()
+
+        assert estado == 200
+        assert resultado.column_names == ["resultado"]
+        assert resultado["resultado"].to_pylist() == ["LIMA", "CUSCO", None]
+
+    def test_invalid_content_length(self, url):
+        host, puerto = url.removeprefix("http://").split(":")
+        conexion = http.client.HTTPConnection(host, int(puerto), timeout=5)
+        conexion.putrequest("POST", "/distrito")
+        conexion.putheader("Content-Length", "abc")
+        conexion.endheaders()
+
+        respuesta = conexion.getresponse()
+        assert respuesta.status == 400
+        assert "Content-Length" in json.loads(respuesta.read())["error"]
+        conexion.close()
+
+    def test_invalid_bodies(self, url):
+        assert pedir_json(url, "/distrito", {"codigo": "150101"})[0] == 400
+        assert pedir(url, "/distrito", b"{no es json")[0] == 400
+        assert pedir(url, "/distrito", b"no es arrow", ARROW)[0] == 400
+
+
+class TestReverseGeocode:
+    def test_single_and_batch(self, url):
+        estado, datos = pedir_json(url, "/reverse_geocode?lat=-13.52&lon=-71.97")
+
+        assert estado == 200
+        assert datos["resultado"]["departamento"] == "Cusco"
+        assert datos["resultado"]["ubigeo"].startswith("08")
+        assert datos["resultado"]["distancia_km"] < 10
+
+        estado, datos = pedir_json(
+            url, "/reverse_geocode", {"lat": [-12.06, -6.23], "lon": [-77.04, -77.87]}
+        )
+        assert estado == 200
+        assert [fila["departamento"] for fila in datos["resultado"]] == [
+            "Lima",
+            "Amazonas",
+        ]
+
+    def test_arrow_and_errors(self, url):
+        tabla = pa.table({"lat": [-12.06], "lon": [-77.04]})
+        estado, cuerpo = pedir(url, "/reverse_geocode", a_ipc(tabla), ARROW)
+
+        assert estado == 200
+        assert pa.ipc.open_stream(cuerpo).read_all()["ubigeo"].to_pylist()[0][:2] == (
+            "15"
+        )
+        assert pedir_json(url, "/reverse_geocode?lat=-12")[0] == 400
+        assert pedir_json(url, "/reverse_geocode?lat=200&lon=0")[0] == 400
+        sin_lon = a_ipc(pa.table({"lat": [-12.06]}))
+        assert pedir(url, "/reverse_geocode", sin_lon, ARROW)[0] == 400
+
+    def test_outside_peru(self, url):
+        assert pedir_json(url, "/reverse_geocode?lat=0&lon=0")[0] == 404
+
+        estado, datos = pedir_json(
+            url, "/reverse_geocode", {"lat": [0, -12.06], "lon": [0, -77.04]}
+        )
+        assert estado == 200
+        assert datos["resultado"][0] == dict.fromkeys(datos["resultado"][0])
+        assert datos["resultado"][1]["departamento"] == "Lima"
+
+    def test_nearest_matches_brute_force(self):
+        indice = _IndiceCoordenadas()
+        puntos = [(-12.1, -77.0), (-3.7, -73.2), (-18.0, -70.2), (10.0, -60.0)]
+
+        for lat, lon in puntos:
+            ubigeo, _ = indice.cercano(lat, lon)
+            esperado = min(
+                range(len(indice.puntos)),
+                key=lambda i: (
+                    (indice.puntos[i][0] - lat) ** 2
+                    + ((indice.puntos[i][1] - lon) * _COS_REFERENCIA) ** 2
+                ),
+            )
+            assert ubigeo == indice.ubigeos[esperado]
+
+
+class TestServeCommand:
+    def test_parser(self):
+        args = _build_parser().parse_args(["serve", "--port", "0", "--no-preload"])
+
+        assert (args.command, args.port, args.no_preload) == ("serve", 0, True)
@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import ubigeos_peru as ubg
+from ubigeos_peru.core import shared_tables
+from ubigeos_peru.core.resource_manager import ResourceManager
+from ubigeos_peru.core.shared_tables import SharedTable
+
+
+def tipo_de_tabla(ruta):
+    # Se ejecuta en el worker
+    return type(ResourceManager._loaded.get(ruta)).__name__
+
+
+def consultar(codigo):
+    return ubg.get_distrito(codigo), ubg.validate_distrito("LINCEE", fuzzy_match=True)
+
+
+@pytest.fixture
+def attached_state(monkeypatch):
+    monkeypatch.setattr(ResourceManager, "_loaded", {})
+    monkeypatch.setattr(ResourceManager, "_derived", {})
+    monkeypatch.setattr(shared_tables, "_ADJUNTADOS", {})
+
+
+class TestSharedTables:
+    def test_attach_in_process(self, attached_state):
+        with ubg.share_tables(levels=["distritos"], institutions=["inei"]) as tablas:
+            ResourceManager._loaded.clear()
+            ResourceManager._derived.clear()
+            ubg.attach_tables(tablas.name)
+
+            distritos = ResourceManager.cargar_diccionario("distritos", "inei")
+            assert isinstance(distritos, SharedTable)
+            assert distritos["150116"] == "Lince"
+            assert "999999" not in distritos
+            assert list(distritos)[:2] == ["010101", "010102"]
+
+            assert ubg.get_distrito("150116") == "Lince"
+            assert ubg.get_ubigeo("Lince", level="distritos") == "150116"
+            assert ubg.validate_distrito("LINCEE", fuzzy_match=True) == "Lince"
+
+    def test_lookup_matches_json_resources(self, attached_state):
+        esperado = dict(
+            ResourceManager.cargar_diccionario("equivalencias", "distritos")
+        )
+
+        with ubg.share_tables(levels=["distritos"], institutions=[]) as tablas:
+            assert tablas.tablas == ["equivalencias/distritos", "distritos"]
+            ResourceManager._loaded.clear()
+            ubg.attach_tables(tablas.name)
+
+            compartida = ResourceManager.cargar_diccionario(
+                "equivalencias", "distritos"
+            )
+            assert dict(compartida.items()) == esperado
+
+    def test_close_is_idempotent(self):
+        tablas = ubg.share_tables(levels=["departamentos"], fuzzy=False)
+        tablas.close()
+        tablas.close()
+
+    def test_invalid_level(self):
+        with pytest.raises(ValueError):
+            ubg.share_tables(levels=["regiones"])
+
+    def test_process_pool_workers(self):
+        with ubg.share_tables(levels=["distritos"], institutions=["inei"]) as tablas:
+            with ProcessPoolExecutor(
+                max_workers=2,
+                initializer=ubg.attach_tables,
+                initargs=(tablas.name,),
+            ) as pool:
+                assert pool.submit(tipo_de_tabla, "distritos/inei").result() == (
+                    "SharedTable"
+                )
+                assert list(pool.map(consultar, ["150116", "080101"])) == [
+                    ("Lince", "Lince"),
+                    ("Cusco", "Lince"),
+                ]
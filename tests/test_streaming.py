@@ -0,0 +1,119 @@
+import itertools
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import ubigeos_peru as ubg
+from ubigeos_peru.core import streaming
+
+
+class TestIterConvert:
+    def test_groups_scalars_in_batches(self):
+        codigos = ["150101", "080101", None, "150101", 10101]
+
+        resultado = list(ubg.iter_convert(codigos, field="distrito", batch_size=2))
+
+        assert resultado == [["Lima", "Cusco"], [None, "Lima"], ["Chachapoyas"]]
+
+    def test_series_keep_backend_and_order(self):
+        lotes = [
+            pd.Series(["150101", "080101"]),
+            "10",
+            ["15"],
+            pa.chunked_array([["08"]]),
+        ]
+
+        pandas, lista_suelta, lista, arrow = ubg.iter_convert(
+            lotes, field="departamento", normalize=True
+        )
+
+        assert pandas.tolist() == ["LIMA", "CUSCO"]
+        assert (lista_suelta, lista) == (["HUANUCO"], ["LIMA"])
+        assert arrow.to_pylist() == ["CUSCO"]
+
+    def test_on_error_and_validate(self):
+        codigos = ["150101", "999999", "999999"]
+
+        assert list(ubg.iter_convert(codigos, field="distrito", on_error="coerce")) == [
+            ["Lima", None, None]
+        ]
+        with pytest.raises(KeyError):
+            list(ubg.iter_convert(codigos, field="distrito"))
+        assert list(
+            ubg.iter_convert(["Miraflors"], field="validate_distrito", fuzzy_match=True)
+        ) == [["Miraflores"]]
+
+    def test_floats_from_cursors(self):
+        filas = [150101.0, 80101, float("nan"), None]
+
+        assert list(ubg.iter_convert(filas, field="distrito")) == [
+            ["Lima", "Cusco", None, None]
+        ]
+        with pytest.raises(TypeError):
+            list(ubg.iter_convert([150101.5], field="distrito"))
+
+    def test_on_error_for_fields_without_it(self):
+        codigos = ["15", "99", None]
+
+        assert list(
+            ubg.iter_convert(codigos, field="departamento", on_error="coerce")
+        ) == [["Lima", None, None]]
+        (serie,) = ubg.iter_convert(
+            [pd.Series(["15", "99"])], field="macrorregion", on_error="ignore"
+        )
+        assert serie.tolist() == ["Lima Metropolitana", "99"]
+        with pytest.raises(KeyError):
+            list(ubg.iter_convert(codigos, field="departamento"))
+
+    def test_is_lazy_and_caches_across_batches(self, monkeypatch):
+        llamadas = []
+        original = streaming._Convertidor._resolver
+
+        def espia(self, valor):
+            llamadas.append(valor)
+            return original(self, valor)
+
+        monkeypatch.setattr(streaming._Convertidor, "_resolver", espia)
+        consumidos = itertools.count()
+        infinito = (
+            ("150101", "080101")[next(consumidos) % 2] for _ in itertools.count()
+        )
+
+        lotes = ubg.iter_convert(infinito, field="provincia", batch_size=3)
+        primeros = [next(lotes), next(lotes)]
+
+        assert primeros == [["Lima", "Cusco", "Lima"], ["Cusco", "Lima", "Cusco"]]
+        assert next(consumidos) == 6
+        assert llamadas == ["150101", "080101"]
+
+    def test_prefetch(self):
+        codigos = [f"{d:02d}" for d in range(1, 26)] * 4
+
+        esperado = list(ubg.iter_convert(codigos, batch_size=7))
+        resultado = list(ubg.iter_convert(codigos, batch_size=7, prefetch=2))
+
+        assert resultado == esperado
+        assert len(resultado) == 15
+
+    def test_prefetch_errors_and_early_close(self):
+        with pytest.raises(ValueError):
+            list(ubg.iter_convert(["15", "1O"], batch_size=1, prefetch=1))
+
+        hilos = threading.active_count()
+        lotes = ubg.iter_convert(itertools.repeat("15"), batch_size=5, prefetch=2)
+        assert next(lotes) == ["Lima"] * 5
+        lotes.close()
+        for hilo in threading.enumerate():
+            if hilo.name == "ubigeos-prefetch":
+                hilo.join(timeout=5)
+        assert threading.active_count() <= hilos
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ubg.iter_convert([], field="region")
+        with pytest.raises(ValueError):
+            ubg.iter_convert([], batch_size=0)
+        with pytest.raises(ValueError):
+            ubg.iter_convert([], prefetch=-1)